@@ -4,10 +4,19 @@ import os
 from fastapi import FastAPI
 
 from services.database import create_db_and_tables
-from utils.get_env import get_app_data_directory_env
+from services.docling_process_pool import DOCLING_PROCESS_POOL
+from services.http_session_manager import HTTP_SESSION_MANAGER
+from services.icon_finder_service import ICON_FINDER_SERVICE
+from services.presentation_generation_worker import PRESENTATION_GENERATION_WORKER
+from utils.get_env import (
+    get_app_data_directory_env,
+    get_disable_docling_warm_up_env,
+    get_disable_in_process_worker_env,
+)
 from utils.model_availability import (
     check_llm_and_image_provider_api_or_model_availability,
 )
+from utils.parsers import parse_bool_or_none
 from utils.safe_init import safe_init
 
 
@@ -21,14 +30,37 @@ async def initialize_models_and_providers():
     await check_llm_and_image_provider_api_or_model_availability()
 
 
+def start_docling_warm_up():
+    # Starts the document parsing processes before the first upload
+    if parse_bool_or_none(get_disable_docling_warm_up_env()):
+        return
+    DOCLING_PROCESS_POOL.warm_up()
+
+
+def start_presentation_generation_worker():
+    # Disabled when workers run as separate processes (worker.py)
+    if parse_bool_or_none(get_disable_in_process_worker_env()):
+        return
+    PRESENTATION_GENERATION_WORKER.start()
+
+
 @asynccontextmanager
 async def app_lifespan(_: FastAPI):
     """
     Lifespan context manager for FastAPI application.
-    Initializes the application data directory and checks LLM model availability.
+    Initializes the application data directory, the shared HTTP sessions,
+    checks LLM model availability, warms up icon search and document
+    parsing in the background and starts the presentation generation worker.
 
     """
     os.makedirs(get_app_data_directory_env(), exist_ok=True)
     await initialize_database()
+    await HTTP_SESSION_MANAGER.start()
     await initialize_models_and_providers()
+    ICON_FINDER_SERVICE.warm_up()
+    start_docling_warm_up()
+    start_presentation_generation_worker()
     yield
+    await PRESENTATION_GENERATION_WORKER.stop()
+    await HTTP_SESSION_MANAGER.close()
+    DOCLING_PROCESS_POOL.close()
@@ -21,7 +21,10 @@ async def generate_image(
 ):
     images_directory = get_images_directory()
     image_prompt = ImagePrompt(prompt=prompt)
-    image_generation_service = ImageGenerationService(images_directory)
+    # Images requested explicitly from the editor are always newly generated
+    image_generation_service = ImageGenerationService(
+        images_directory, reuse_generated_images=False
+    )
 
     image = await image_generation_service.generate_image(image_prompt)
     if not isinstance(image, ImageAsset):
@@ -17,8 +17,9 @@ from models.sse_response import (
     SSEStatusResponse,
 )
 from services.temp_file_service import TEMP_FILE_SERVICE
+from services.context_budgeter import CONTEXT_BUDGETER
 from services.database import get_async_session
-from services.documents_loader import DocumentsLoader
+from services.documents_loader import DocumentsLoader, get_outline_context_max_pages
 from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
 from utils.ppt_utils import get_presentation_title_from_outlines
 
@@ -44,10 +45,14 @@ async def stream_outlines(
         additional_context = ""
         if presentation.file_paths:
             documents_loader = DocumentsLoader(file_paths=presentation.file_paths)
-            await documents_loader.load_documents(temp_dir)
+            await documents_loader.load_documents(
+                temp_dir, max_pdf_pages=get_outline_context_max_pages()
+            )
             documents = documents_loader.documents
             if documents:
-                additional_context = "\n\n".join(documents)
+                additional_context = await CONTEXT_BUDGETER.get_context(
+                    documents, presentation.n_slides, presentation.content
+                )
 
         presentation_outlines_text = ""
 
@@ -5,24 +5,40 @@ import math
 import os
 import random
 import traceback
-from typing import Annotated, List, Literal, Optional, Tuple
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
 import dirtyjson
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Path
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+)
 from fastapi.responses import StreamingResponse
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
-from constants.presentation import DEFAULT_TEMPLATES
+from constants.presentation import (
+    DEFAULT_BATCH_PRESENTATION_CONCURRENCY,
+    DEFAULT_TEMPLATES,
+)
+from enums.presentation_generation_stage import PresentationGenerationStage
 from enums.webhook_event import WebhookEvent
 from models.api_error_model import APIErrorModel
+from models.generate_presentation_batch_request import (
+    GeneratePresentationBatchRequest,
+)
 from models.generate_presentation_request import GeneratePresentationRequest
 from models.presentation_and_path import PresentationPathAndEditPath
+from models.presentation_batch_result import PresentationBatchItemResult
 from models.presentation_from_template import EditPresentationRequest
 from models.presentation_outline_model import (
     PresentationOutlineModel,
     SlideOutlineModel,
 )
 from enums.tone import Tone
+from enums.llm_provider import LLMProvider
 from enums.verbosity import Verbosity
 from models.pptx_models import PptxPresentationModel
 from models.presentation_layout import PresentationLayoutModel
@@ -30,19 +46,29 @@ from models.presentation_structure_model import PresentationStructureModel
 from models.presentation_with_slides import (
     PresentationWithSlides,
 )
+from models.slide_generation_timing import SlideGenerationTiming
 from models.sql.template import TemplateModel
 
-from services.documents_loader import DocumentsLoader
+from services.context_budgeter import CONTEXT_BUDGETER
+from services.documents_loader import DocumentsLoader, get_outline_context_max_pages
 from services.webhook_service import WebhookService
 from utils.get_layout_by_name import get_layout_by_name
 from services.image_generation_service import ImageGenerationService
 from utils.dict_utils import deep_update
 from utils.export_utils import export_presentation
 from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
+from utils.llm_provider import get_llm_provider
 from models.sql.slide import SlideModel
-from models.sse_response import SSECompleteResponse, SSEErrorResponse, SSEResponse
+from models.sse_response import (
+    SSEBatchProgressResponse,
+    SSECompleteResponse,
+    SSEErrorResponse,
+    SSEResponse,
+    SSESlideResponse,
+)
 
-from services.database import get_async_session
+from services.database import async_session_maker, get_async_session
+from services.presentation_generation_queue import PRESENTATION_GENERATION_QUEUE
 from services.temp_file_service import TEMP_FILE_SERVICE
 from services.concurrent_service import CONCURRENT_SERVICE
 from models.sql.presentation import PresentationModel
@@ -50,6 +76,7 @@ from services.pptx_presentation_creator import PptxPresentationCreator
 from models.sql.async_presentation_generation_status import (
     AsyncPresentationGenerationTaskModel,
 )
+from models.sql.presentation_generation_batch import PresentationGenerationBatchModel
 from utils.asset_directory_utils import get_exports_directory, get_images_directory
 from utils.llm_calls.generate_presentation_structure import (
     generate_presentation_structure,
@@ -65,6 +92,13 @@ from utils.process_slides import (
     process_slide_add_placeholder_assets,
     process_slide_and_fetch_assets,
 )
+from utils.outline_stream_parser import OutlineStreamParser
+from utils.slide_generation import (
+    fetch_slide_assets_with_timing,
+    generate_slide_content_with_timing,
+    generate_slide_contents,
+    get_slide_generation_concurrency,
+)
 import uuid
 
 
@@ -81,6 +115,7 @@ async def get_all_presentations(sql_session: AsyncSession = Depends(get_async_se
             SlideModel,
             (SlideModel.presentation == PresentationModel.id) & (SlideModel.index == 0),
         )
+        .where(PresentationModel.generating.is_not(True))
         .order_by(PresentationModel.created_at.desc())
     )
 
@@ -257,7 +292,14 @@ async def prepare_presentation(
 
 @PRESENTATION_ROUTER.get("/stream/{id}", response_model=PresentationWithSlides)
 async def stream_presentation(
-    id: uuid.UUID, sql_session: AsyncSession = Depends(get_async_session)
+    id: uuid.UUID,
+    parallel: Annotated[
+        bool,
+        Query(
+            description="Generate slides concurrently and stream each one as soon as it is ready"
+        ),
+    ] = False,
+    sql_session: AsyncSession = Depends(get_async_session),
 ):
     presentation = await sql_session.get(PresentationModel, id)
     if not presentation:
@@ -358,7 +400,124 @@ async def stream_presentation(
             value=response.model_dump(mode="json"),
         ).to_string()
 
-    return StreamingResponse(inner(), media_type="text/event-stream")
+    async def inner_parallel():
+        structure = presentation.get_structure()
+        layout = presentation.get_layout()
+        outline = presentation.get_presentation_outline()
+
+        slide_layouts = [layout.slides[index] for index in structure.slides]
+        slides: List[Optional[SlideModel]] = [None] * len(slide_layouts)
+
+        # Slide and asset events are pushed here as soon as they are ready
+        events = asyncio.Queue()
+        async_assets_generation_tasks: List[asyncio.Task] = []
+
+        async def fetch_assets(slide: SlideModel):
+            assets = await process_slide_and_fetch_assets(
+                image_generation_service, slide
+            )
+            await events.put(
+                SSESlideResponse(
+                    type="patch",
+                    index=slide.index,
+                    slide=slide.model_dump(mode="json"),
+                )
+            )
+            return assets
+
+        async def generate_slides():
+            try:
+                async for i, slide_content, _ in generate_slide_contents(
+                    slide_layouts,
+                    outline.slides,
+                    presentation.language,
+                    presentation.tone,
+                    presentation.verbosity,
+                    presentation.instructions,
+                ):
+                    slide = SlideModel(
+                        presentation=id,
+                        layout_group=layout.name,
+                        layout=slide_layouts[i].id,
+                        index=i,
+                        speaker_note=slide_content.get("__speaker_note__", ""),
+                        content=slide_content,
+                    )
+                    slides[i] = slide
+
+                    # This will mutate slide and add placeholder assets
+                    process_slide_add_placeholder_assets(slide)
+                    await events.put(
+                        SSESlideResponse(
+                            type="slide",
+                            index=i,
+                            slide=slide.model_dump(mode="json"),
+                        )
+                    )
+
+                    async_assets_generation_tasks.append(
+                        asyncio.create_task(fetch_assets(slide))
+                    )
+
+                generated_assets_lists = await asyncio.gather(
+                    *async_assets_generation_tasks
+                )
+                await events.put(generated_assets_lists)
+            except Exception as e:
+                for task in async_assets_generation_tasks:
+                    task.cancel()
+                await events.put(e)
+
+        generation_task = asyncio.create_task(generate_slides())
+        try:
+            while True:
+                event = await events.get()
+                if isinstance(event, SSESlideResponse):
+                    yield event.to_string()
+                    continue
+
+                if isinstance(event, Exception):
+                    if not isinstance(event, HTTPException):
+                        traceback.print_exception(event)
+                        event = HTTPException(
+                            status_code=500, detail="Slide generation failed"
+                        )
+                    yield SSEErrorResponse(detail=event.detail).to_string()
+                    return
+
+                generated_assets_lists = event
+                break
+        finally:
+            if not generation_task.done():
+                generation_task.cancel()
+
+        generated_assets = []
+        for assets_list in generated_assets_lists:
+            generated_assets.extend(assets_list)
+
+        await sql_session.execute(
+            delete(SlideModel).where(SlideModel.presentation == id)
+        )
+        await sql_session.commit()
+
+        sql_session.add(presentation)
+        sql_session.add_all(slides)
+        sql_session.add_all(generated_assets)
+        await sql_session.commit()
+
+        response = PresentationWithSlides(
+            **presentation.model_dump(),
+            slides=slides,
+        )
+
+        yield SSECompleteResponse(
+            key="presentation",
+            value=response.model_dump(mode="json"),
+        ).to_string()
+
+    return StreamingResponse(
+        inner_parallel() if parallel else inner(), media_type="text/event-stream"
+    )
 
 
 @PRESENTATION_ROUTER.patch("/update", response_model=PresentationWithSlides)
@@ -484,6 +643,16 @@ async def check_if_api_request_is_valid(
                 detail="Template not found. Please use a valid template.",
             )
 
+    # Bulk generation relies on provider batch APIs
+    if request.generation_mode == "bulk" and get_llm_provider() not in (
+        LLMProvider.OPENAI,
+        LLMProvider.ANTHROPIC,
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Bulk generation is only supported with OpenAI and Anthropic",
+        )
+
     return (presentation_id,)
 
 
@@ -492,7 +661,12 @@ async def generate_presentation_handler(
     presentation_id: uuid.UUID,
     async_status: Optional[AsyncPresentationGenerationTaskModel],
     sql_session: AsyncSession = Depends(get_async_session),
+    layout: Optional[PresentationLayoutModel] = None,
 ):
+    # Slide contents started while outlines are still streaming, by index
+    speculative_slide_tasks: Dict[int, Tuple[SlideOutlineModel, asyncio.Task]] = {}
+    slide_generation_semaphore = asyncio.Semaphore(get_slide_generation_concurrency())
+
     try:
         using_slides_markdown = False
 
@@ -500,7 +674,23 @@ async def generate_presentation_handler(
             using_slides_markdown = True
             request.n_slides = len(request.slides_markdown)
 
-        if not using_slides_markdown:
+        # Outlines, structure and slides saved by an earlier run are reused
+        presentation = await sql_session.get(PresentationModel, presentation_id)
+
+        # Parse Layouts
+        if presentation and presentation.layout:
+            layout_model = presentation.get_layout()
+        elif layout:
+            layout_model = layout
+        else:
+            layout_model = await get_layout_by_name(request.template)
+        total_slide_layouts = len(layout_model.slides)
+
+        if presentation and presentation.outlines:
+            presentation_outlines = presentation.get_presentation_outline()
+            total_outlines = len(presentation_outlines.slides)
+
+        elif not using_slides_markdown:
             additional_context = ""
 
             # Updating async status
@@ -512,10 +702,14 @@ async def generate_presentation_handler(
 
             if request.files:
                 documents_loader = DocumentsLoader(file_paths=request.files)
-                await documents_loader.load_documents()
+                await documents_loader.load_documents(
+                    max_pdf_pages=get_outline_context_max_pages()
+                )
                 documents = documents_loader.documents
                 if documents:
-                    additional_context = "\n\n".join(documents)
+                    additional_context = await CONTEXT_BUDGETER.get_context(
+                        documents, request.n_slides, request.content
+                    )
 
             # Finding number of slides to generate by considering table of contents
             n_slides_to_generate = request.n_slides
@@ -532,6 +726,15 @@ async def generate_presentation_handler(
                     (request.n_slides - needed_toc_count) / 10
                 )
 
+            # Slides of ordered templates map one to one onto layouts, so their
+            # content can be generated while later outlines are still streaming
+            speculate_slides = (
+                layout_model.ordered
+                and not request.include_table_of_contents
+                and request.generation_mode == "realtime"
+            )
+            outline_stream_parser = OutlineStreamParser()
+
             presentation_outlines_text = ""
             async for chunk in generate_ppt_outline(
                 request.content,
@@ -550,6 +753,28 @@ async def generate_presentation_handler(
 
                 presentation_outlines_text += chunk
 
+                if not speculate_slides:
+                    continue
+                for outline in outline_stream_parser.feed(chunk):
+                    index = len(outline_stream_parser.slides) - 1
+                    if index >= total_slide_layouts:
+                        continue
+                    speculative_slide_tasks[index] = (
+                        outline,
+                        asyncio.create_task(
+                            generate_slide_content_with_timing(
+                                index,
+                                layout_model.slides[index],
+                                outline,
+                                request.language,
+                                request.tone.value,
+                                request.verbosity.value,
+                                request.instructions,
+                                slide_generation_semaphore,
+                            )
+                        ),
+                    )
+
             try:
                 presentation_outlines_json = dict(
                     dirtyjson.loads(presentation_outlines_text)
@@ -585,12 +810,36 @@ async def generate_presentation_handler(
         print("-" * 40)
         print(f"Generated {total_outlines} outlines for the presentation")
 
-        # Parse Layouts
-        layout_model = await get_layout_by_name(request.template)
-        total_slide_layouts = len(layout_model.slides)
+        # Save outlines and layout so a failure later on does not lose them
+        if not presentation:
+            presentation = PresentationModel(
+                id=presentation_id,
+                content=request.content,
+                n_slides=request.n_slides,
+                language=request.language,
+                title=get_presentation_title_from_outlines(presentation_outlines),
+                outlines=presentation_outlines.model_dump(),
+                layout=layout_model.model_dump(),
+                tone=request.tone.value,
+                verbosity=request.verbosity.value,
+                instructions=request.instructions,
+                include_table_of_contents=request.include_table_of_contents,
+                include_title_slide=request.include_title_slide,
+                web_search=request.web_search,
+                generating=True,
+            )
+            sql_session.add(presentation)
+            if async_status:
+                PRESENTATION_GENERATION_QUEUE.set_stage_completed(
+                    sql_session, async_status, PresentationGenerationStage.OUTLINES
+                )
+            await sql_session.commit()
 
         # Generate Structure
-        if layout_model.ordered:
+        structure_completed = bool(presentation.structure)
+        if structure_completed:
+            presentation_structure = presentation.get_structure()
+        elif layout_model.ordered:
             presentation_structure = layout_model.to_presentation_structure()
         else:
             presentation_structure: PresentationStructureModel = (
@@ -602,66 +851,69 @@ async def generate_presentation_handler(
                 )
             )
 
-        presentation_structure.slides = presentation_structure.slides[:total_outlines]
-        for index in range(total_outlines):
-            random_slide_index = random.randint(0, total_slide_layouts - 1)
-            if index >= total_outlines:
-                presentation_structure.slides.append(random_slide_index)
-                continue
-            if presentation_structure.slides[index] >= total_slide_layouts:
-                presentation_structure.slides[index] = random_slide_index
-
-        # Injecting table of contents to the presentation structure and outlines
-        if request.include_table_of_contents and not using_slides_markdown:
-            n_toc_slides = request.n_slides - total_outlines
-            toc_slide_layout_index = select_toc_or_list_slide_layout_index(layout_model)
-            if toc_slide_layout_index != -1:
-                outline_index = 1 if request.include_title_slide else 0
-                for i in range(n_toc_slides):
-                    outlines_to = outline_index + 10
-                    if total_outlines == outlines_to:
-                        outlines_to -= 1
-
-                    presentation_structure.slides.insert(
-                        i + 1 if request.include_title_slide else i,
-                        toc_slide_layout_index,
-                    )
-                    toc_outline = f"Table of Contents\n\n"
-
-                    for outline in presentation_outlines.slides[
-                        outline_index:outlines_to
-                    ]:
-                        page_number = (
-                            outline_index - i + n_toc_slides + 1
-                            if request.include_title_slide
-                            else outline_index - i + n_toc_slides
+        if not structure_completed:
+            presentation_structure.slides = presentation_structure.slides[
+                :total_outlines
+            ]
+            for index in range(total_outlines):
+                random_slide_index = random.randint(0, total_slide_layouts - 1)
+                if index >= total_outlines:
+                    presentation_structure.slides.append(random_slide_index)
+                    continue
+                if presentation_structure.slides[index] >= total_slide_layouts:
+                    presentation_structure.slides[index] = random_slide_index
+
+            # Injecting table of contents to the presentation structure and outlines
+            if request.include_table_of_contents and not using_slides_markdown:
+                n_toc_slides = request.n_slides - total_outlines
+                toc_slide_layout_index = select_toc_or_list_slide_layout_index(
+                    layout_model
+                )
+                if toc_slide_layout_index != -1:
+                    outline_index = 1 if request.include_title_slide else 0
+                    for i in range(n_toc_slides):
+                        outlines_to = outline_index + 10
+                        if total_outlines == outlines_to:
+                            outlines_to -= 1
+
+                        presentation_structure.slides.insert(
+                            i + 1 if request.include_title_slide else i,
+                            toc_slide_layout_index,
                         )
-                        toc_outline += f"Slide page number: {page_number}\n Slide Content: {outline.content[:100]}\n\n"
-                        outline_index += 1
+                        toc_outline = f"Table of Contents\n\n"
+
+                        for outline in presentation_outlines.slides[
+                            outline_index:outlines_to
+                        ]:
+                            page_number = (
+                                outline_index - i + n_toc_slides + 1
+                                if request.include_title_slide
+                                else outline_index - i + n_toc_slides
+                            )
+                            toc_outline += f"Slide page number: {page_number}\n Slide Content: {outline.content[:100]}\n\n"
+                            outline_index += 1
 
-                    outline_index += 1
+                        outline_index += 1
 
-                    presentation_outlines.slides.insert(
-                        i + 1 if request.include_title_slide else i,
-                        SlideOutlineModel(
-                            content=toc_outline,
-                        ),
-                    )
+                        presentation_outlines.slides.insert(
+                            i + 1 if request.include_title_slide else i,
+                            SlideOutlineModel(
+                                content=toc_outline,
+                            ),
+                        )
 
-        # Create PresentationModel
-        presentation = PresentationModel(
-            id=presentation_id,
-            content=request.content,
-            n_slides=request.n_slides,
-            language=request.language,
-            title=get_presentation_title_from_outlines(presentation_outlines),
-            outlines=presentation_outlines.model_dump(),
-            layout=layout_model.model_dump(),
-            structure=presentation_structure.model_dump(),
-            tone=request.tone.value,
-            verbosity=request.verbosity.value,
-            instructions=request.instructions,
-        )
+            # Save structure together with the table of contents outlines
+            presentation.title = get_presentation_title_from_outlines(
+                presentation_outlines
+            )
+            presentation.outlines = presentation_outlines.model_dump()
+            presentation.set_structure(presentation_structure)
+            sql_session.add(presentation)
+            if async_status:
+                PRESENTATION_GENERATION_QUEUE.set_stage_completed(
+                    sql_session, async_status, PresentationGenerationStage.STRUCTURE
+                )
+            await sql_session.commit()
 
         # Updating async status
         if async_status:
@@ -670,40 +922,85 @@ async def generate_presentation_handler(
             sql_session.add(async_status)
             await sql_session.commit()
 
-        image_generation_service = ImageGenerationService(get_images_directory())
-        async_assets_generation_tasks = []
-
-        # 7. Generate slide content concurrently (batched), then build slides and fetch assets
-        slides: List[SlideModel] = []
+        image_generation_service = ImageGenerationService(
+            get_images_directory(), request.reuse_generated_images
+        )
+        async_assets_generation_tasks: Dict[asyncio.Task, int] = {}
 
+        # 7. Generate slide content with a sliding window of concurrent LLM calls
         slide_layout_indices = presentation_structure.slides
         slide_layouts = [layout_model.slides[idx] for idx in slide_layout_indices]
 
-        # Schedule slide content generation and asset fetching in batches of 10
-        batch_size = 10
-        for start in range(0, len(slide_layouts), batch_size):
-            end = min(start + batch_size, len(slide_layouts))
-
-            print(f"Generating slides from {start} to {end}")
-
-            # Generate contents for this batch concurrently
-            content_tasks = [
-                get_slide_content_from_type_and_outline(
-                    slide_layouts[i],
-                    presentation_outlines.slides[i],
-                    request.language,
-                    request.tone.value,
-                    request.verbosity.value,
-                    request.instructions,
-                )
-                for i in range(start, end)
+        # Only slides that were not saved by an earlier run are generated
+        saved_slides = await sql_session.scalars(
+            select(SlideModel).where(SlideModel.presentation == presentation_id)
+        )
+        saved_slide_indices = {slide.index for slide in saved_slides}
+        missing_slide_indices = [
+            index
+            for index in range(len(slide_layouts))
+            if index not in saved_slide_indices
+        ]
+
+        # Speculative slides are kept only if their outline and layout still match
+        started_slide_tasks: Dict[int, asyncio.Task] = {}
+        for index, (outline, task) in speculative_slide_tasks.items():
+            if (
+                index in missing_slide_indices
+                and slide_layout_indices[index] == index
+                and presentation_outlines.slides[index].content == outline.content
+            ):
+                started_slide_tasks[index] = task
+            else:
+                task.cancel()
+        await asyncio.gather(
+            *(
+                task
+                for _, task in speculative_slide_tasks.values()
+                if task not in started_slide_tasks.values()
+            ),
+            return_exceptions=True,
+        )
+
+        slides: List[Optional[SlideModel]] = [None] * len(slide_layouts)
+        slide_timings: List[Optional[SlideGenerationTiming]] = [None] * len(
+            slide_layouts
+        )
+
+        async def save_ready_slides() -> Optional[BaseException]:
+            # 8. Save each slide with its assets as soon as they are ready
+            error = None
+            ready_tasks = [
+                task for task in async_assets_generation_tasks if task.done()
             ]
-            batch_contents: List[dict] = await asyncio.gather(*content_tasks)
+            for task in ready_tasks:
+                i = async_assets_generation_tasks.pop(task)
+                if task.cancelled():
+                    continue
+                if task.exception():
+                    error = error or task.exception()
+                    continue
+                sql_session.add(slides[i])
+                sql_session.add_all(task.result())
+            if ready_tasks:
+                await sql_session.commit()
+            return error
+
+        try:
+            async for i, slide_content, content_seconds in generate_slide_contents(
+                slide_layouts,
+                presentation_outlines.slides,
+                request.language,
+                request.tone.value,
+                request.verbosity.value,
+                request.instructions,
+                indices=missing_slide_indices,
+                bulk=request.generation_mode == "bulk",
+                semaphore=slide_generation_semaphore,
+                started_tasks=started_slide_tasks,
+            ):
+                print(f"Generated slide {i} in {content_seconds:.2f}s")
 
-            # Build slides for this batch
-            batch_slides: List[SlideModel] = []
-            for offset, slide_content in enumerate(batch_contents):
-                i = start + offset
                 slide_layout = slide_layouts[i]
                 slide = SlideModel(
                     presentation=presentation_id,
@@ -713,34 +1010,72 @@ async def generate_presentation_handler(
                     speaker_note=slide_content.get("__speaker_note__"),
                     content=slide_content,
                 )
-                slides.append(slide)
-                batch_slides.append(slide)
+                slides[i] = slide
+                slide_timings[i] = SlideGenerationTiming(
+                    index=i,
+                    layout=slide_layout.id,
+                    content_seconds=content_seconds,
+                )
 
-            # Start asset fetch tasks for just-generated slides so they run while next batch is processed
-            asset_tasks = [
-                process_slide_and_fetch_assets(image_generation_service, slide)
-                for slide in batch_slides
-            ]
-            async_assets_generation_tasks.extend(asset_tasks)
+                # Start fetching assets as soon as this slide's content lands
+                task = asyncio.create_task(
+                    fetch_slide_assets_with_timing(
+                        image_generation_service, slide, slide_timings[i]
+                    )
+                )
+                async_assets_generation_tasks[task] = i
 
-        if async_status:
-            async_status.message = "Fetching assets for slides"
-            async_status.updated_at = datetime.now()
-            sql_session.add(async_status)
-            await sql_session.commit()
+                error = await save_ready_slides()
+                if error:
+                    raise error
 
-        # Run all asset tasks concurrently while batches may still be generating content
-        generated_assets_list = await asyncio.gather(*async_assets_generation_tasks)
-        generated_assets = []
-        for assets_list in generated_assets_list:
-            generated_assets.extend(assets_list)
+            if async_status:
+                PRESENTATION_GENERATION_QUEUE.set_stage_completed(
+                    sql_session, async_status, PresentationGenerationStage.SLIDES
+                )
+                async_status.message = "Fetching assets for slides"
+                async_status.slide_timings = [
+                    each.model_dump(mode="json") for each in slide_timings if each
+                ]
+                async_status.updated_at = datetime.now()
+                sql_session.add(async_status)
+                await sql_session.commit()
+
+            # Wait for asset tasks that are still running
+            while async_assets_generation_tasks:
+                await asyncio.wait(
+                    list(async_assets_generation_tasks),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                error = await save_ready_slides()
+                if error:
+                    raise error
+
+        except Exception:
+            # Slides with their assets ready are kept for a resumed run, the
+            # rest is not worth paying image providers for
+            for task in async_assets_generation_tasks:
+                task.cancel()
+            await asyncio.gather(
+                *async_assets_generation_tasks, return_exceptions=True
+            )
+            await save_ready_slides()
+            raise
 
-        # 8. Save PresentationModel and Slides
+        presentation.generating = False
         sql_session.add(presentation)
-        sql_session.add_all(slides)
-        sql_session.add_all(generated_assets)
         await sql_session.commit()
 
+        if async_status:
+            async_status.slide_timings = [
+                each.model_dump(mode="json") for each in slide_timings if each
+            ]
+            PRESENTATION_GENERATION_QUEUE.set_stage_completed(
+                sql_session, async_status, PresentationGenerationStage.ASSETS
+            )
+            sql_session.add(async_status)
+            await sql_session.commit()
+
         if async_status:
             async_status.message = "Exporting presentation"
             async_status.updated_at = datetime.now()
@@ -757,6 +1092,9 @@ async def generate_presentation_handler(
         )
 
         if async_status:
+            PRESENTATION_GENERATION_QUEUE.set_stage_completed(
+                sql_session, async_status, PresentationGenerationStage.EXPORT
+            )
             async_status.message = "Presentation generation completed"
             async_status.status = "completed"
             async_status.data = response.model_dump(mode="json")
@@ -775,12 +1113,25 @@ async def generate_presentation_handler(
         return response
 
     except Exception as e:
+        for _, task in speculative_slide_tasks.values():
+            task.cancel()
+        await asyncio.gather(
+            *(task for _, task in speculative_slide_tasks.values()),
+            return_exceptions=True,
+        )
+
         if not isinstance(e, HTTPException):
             traceback.print_exc()
             e = HTTPException(status_code=500, detail="Presentation generation failed")
 
         api_error_model = APIErrorModel.from_exception(e)
 
+        # Queued tasks are retried before they are reported as failed
+        if async_status and await PRESENTATION_GENERATION_QUEUE.retry_later(
+            sql_session, async_status, api_error_model
+        ):
+            return
+
         # Triggering webhook on failure
         CONCURRENT_SERVICE.run_task(
             None,
@@ -806,6 +1157,16 @@ async def generate_presentation_sync(
     request: GeneratePresentationRequest,
     sql_session: AsyncSession = Depends(get_async_session),
 ):
+    # Provider batches can take up to 24 hours, far longer than a request
+    if request.generation_mode == "bulk":
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Bulk generation is only supported with /generate/async "
+                "and /generate/batch"
+            ),
+        )
+
     try:
         (presentation_id,) = await check_if_api_request_is_valid(request, sql_session)
         return await generate_presentation_handler(
@@ -816,33 +1177,213 @@ async def generate_presentation_sync(
         raise HTTPException(status_code=500, detail="Presentation generation failed")
 
 
+@PRESENTATION_ROUTER.post(
+    "/generate/resume/{id}", response_model=PresentationPathAndEditPath
+)
+async def resume_presentation_generation(
+    id: uuid.UUID = Path(description="ID of the presentation to resume"),
+    export_as: Annotated[
+        Literal["pptx", "pdf"],
+        Body(embed=True, description="Format to export the presentation as"),
+    ] = "pptx",
+    sql_session: AsyncSession = Depends(get_async_session),
+):
+    presentation = await sql_session.get(PresentationModel, id)
+    if not presentation:
+        raise HTTPException(status_code=404, detail="Presentation not found")
+    if not (presentation.outlines and presentation.layout):
+        raise HTTPException(
+            status_code=400,
+            detail="Presentation has no saved outlines to resume from",
+        )
+
+    # Saved outlines, structure and slides are reused, only missing slides are generated
+    request = GeneratePresentationRequest(
+        content=presentation.content,
+        instructions=presentation.instructions,
+        tone=presentation.tone or Tone.DEFAULT,
+        verbosity=presentation.verbosity or Verbosity.STANDARD,
+        web_search=presentation.web_search,
+        n_slides=presentation.n_slides,
+        language=presentation.language,
+        include_table_of_contents=presentation.include_table_of_contents,
+        include_title_slide=presentation.include_title_slide,
+        export_as=export_as,
+    )
+    return await generate_presentation_handler(request, id, None, sql_session)
+
+
+async def generate_presentation_batch_handler(
+    batch_request: GeneratePresentationBatchRequest,
+    batch_id: str,
+    events: asyncio.Queue,
+):
+    """
+    Generates every presentation of a batch, at most `concurrency` at a time.
+    Layouts are fetched once per template and all LLM calls share the process
+    wide budget of the LLM rate limiter. Progress is put on `events` and
+    saved to the batch record, a None event marks the end of the batch.
+    """
+    results = [
+        PresentationBatchItemResult(index=index, status="pending")
+        for index in range(len(batch_request.presentations))
+    ]
+    semaphore = asyncio.Semaphore(
+        batch_request.concurrency or DEFAULT_BATCH_PRESENTATION_CONCURRENCY
+    )
+    save_lock = asyncio.Lock()
+    layout_tasks: Dict[str, asyncio.Task] = {}
+
+    async def get_layout(template: str) -> PresentationLayoutModel:
+        if template not in layout_tasks:
+            layout_tasks[template] = asyncio.create_task(get_layout_by_name(template))
+        return await layout_tasks[template]
+
+    async def save_batch(status: str) -> PresentationGenerationBatchModel:
+        async with save_lock:
+            async with async_session_maker() as sql_session:
+                batch = await sql_session.get(PresentationGenerationBatchModel, batch_id)
+                batch.status = status
+                batch.completed = sum(each.status == "completed" for each in results)
+                batch.failed = sum(each.status == "failed" for each in results)
+                batch.results = [each.model_dump(mode="json") for each in results]
+                batch.updated_at = datetime.now()
+                sql_session.add(batch)
+                await sql_session.commit()
+                return batch
+
+    async def update_result(result: PresentationBatchItemResult):
+        results[result.index] = result
+        events.put_nowait(
+            SSEBatchProgressResponse(
+                index=result.index,
+                status=result.status,
+                result=result.model_dump(mode="json"),
+            )
+        )
+        await save_batch("running")
+
+    async def generate(index: int, request: GeneratePresentationRequest):
+        async with semaphore:
+            presentation_id = None
+            await update_result(
+                PresentationBatchItemResult(index=index, status="running")
+            )
+            try:
+                async with async_session_maker() as sql_session:
+                    (presentation_id,) = await check_if_api_request_is_valid(
+                        request, sql_session
+                    )
+                    response = await generate_presentation_handler(
+                        request,
+                        presentation_id,
+                        None,
+                        sql_session,
+                        layout=await get_layout(request.template),
+                    )
+                result = PresentationBatchItemResult(
+                    index=index,
+                    status="completed",
+                    presentation_id=presentation_id,
+                    path=response.path,
+                    edit_path=response.edit_path,
+                )
+            except Exception as e:
+                if not isinstance(e, HTTPException):
+                    traceback.print_exc()
+                # Failed presentations can be resumed with /generate/resume/{id}
+                result = PresentationBatchItemResult(
+                    index=index,
+                    status="failed",
+                    presentation_id=presentation_id,
+                    error=APIErrorModel.from_exception(e),
+                )
+            await update_result(result)
+
+    try:
+        await asyncio.gather(
+            *[
+                generate(index, request)
+                for index, request in enumerate(batch_request.presentations)
+            ]
+        )
+        batch = await save_batch("completed")
+        events.put_nowait(
+            SSECompleteResponse(key="batch", value=batch.model_dump(mode="json"))
+        )
+    except Exception as e:
+        traceback.print_exc()
+        events.put_nowait(SSEErrorResponse(detail=f"Batch generation failed: {e}"))
+    finally:
+        events.put_nowait(None)
+
+
+@PRESENTATION_ROUTER.post("/generate/batch")
+async def generate_presentation_batch(
+    batch_request: GeneratePresentationBatchRequest,
+    sql_session: AsyncSession = Depends(get_async_session),
+):
+    batch = PresentationGenerationBatchModel(
+        status="pending",
+        total=len(batch_request.presentations),
+        results=[
+            PresentationBatchItemResult(index=index, status="pending").model_dump(
+                mode="json"
+            )
+            for index in range(len(batch_request.presentations))
+        ],
+    )
+    sql_session.add(batch)
+    await sql_session.commit()
+
+    # Generation keeps going if the client disconnects, see /generate/batch/{id}
+    events = asyncio.Queue()
+    CONCURRENT_SERVICE.run_task(
+        None, generate_presentation_batch_handler, batch_request, batch.id, events
+    )
+
+    async def inner():
+        yield SSEResponse(
+            event="response",
+            data=json.dumps({"type": "batch", "id": batch.id, "total": batch.total}),
+        ).to_string()
+
+        while True:
+            event = await events.get()
+            if event is None:
+                break
+            yield event.to_string()
+
+    return StreamingResponse(inner(), media_type="text/event-stream")
+
+
+@PRESENTATION_ROUTER.get(
+    "/generate/batch/{id}", response_model=PresentationGenerationBatchModel
+)
+async def get_presentation_batch_status(
+    id: str = Path(description="ID of the presentation generation batch"),
+    sql_session: AsyncSession = Depends(get_async_session),
+):
+    batch = await sql_session.get(PresentationGenerationBatchModel, id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="No presentation batch found")
+    return batch
+
+
 @PRESENTATION_ROUTER.post(
     "/generate/async", response_model=AsyncPresentationGenerationTaskModel
 )
 async def generate_presentation_async(
     request: GeneratePresentationRequest,
-    background_tasks: BackgroundTasks,
     sql_session: AsyncSession = Depends(get_async_session),
 ):
     try:
         (presentation_id,) = await check_if_api_request_is_valid(request, sql_session)
 
-        async_status = AsyncPresentationGenerationTaskModel(
-            status="pending",
-            message="Queued for generation",
-            data=None,
-        )
-        sql_session.add(async_status)
-        await sql_session.commit()
-
-        background_tasks.add_task(
-            generate_presentation_handler,
-            request,
-            presentation_id,
-            async_status=async_status,
-            sql_session=sql_session,
+        # Picked up by a presentation generation worker
+        return await PRESENTATION_GENERATION_QUEUE.enqueue(
+            sql_session, request, presentation_id
         )
-        return async_status
 
     except Exception as e:
         if not isinstance(e, HTTPException):
@@ -0,0 +1,67 @@
+from fastapi import APIRouter
+
+from models.docling_pool_stats import DoclingPoolStats
+from models.image_generation_stats import ImageGenerationStats
+from models.layout_cache_stats import LayoutCacheStats
+from models.llm_client_pool_stats import LLMClientPoolStats
+from models.llm_rate_limit_stats import LLMRateLimitStats
+from models.llm_response_cache_stats import LLMResponseCacheStats
+from models.outline_context_stats import OutlineContextStats
+from models.parsed_document_cache_stats import ParsedDocumentCacheStats
+from models.schema_compile_cache_stats import SchemaCompileCacheStats
+from services.context_budgeter import CONTEXT_BUDGETER
+from services.docling_process_pool import DOCLING_PROCESS_POOL
+from services.image_generation_scheduler import IMAGE_GENERATION_SCHEDULER
+from services.layout_cache import LAYOUT_CACHE
+from services.llm_client import LLM_CLIENT_REGISTRY
+from services.llm_rate_limiter import LLM_RATE_LIMITER
+from services.llm_response_cache import LLM_RESPONSE_CACHE
+from services.parsed_document_cache import PARSED_DOCUMENT_CACHE
+from services.schema_compile_cache import SCHEMA_COMPILE_CACHE
+
+STATS_ROUTER = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+@STATS_ROUTER.get("/llm-clients", response_model=LLMClientPoolStats)
+async def get_llm_client_pool_stats():
+    return LLM_CLIENT_REGISTRY.get_stats()
+
+
+@STATS_ROUTER.get("/llm-cache", response_model=LLMResponseCacheStats)
+async def get_llm_response_cache_stats():
+    return LLM_RESPONSE_CACHE.get_stats()
+
+
+@STATS_ROUTER.get("/llm-rate-limits", response_model=LLMRateLimitStats)
+async def get_llm_rate_limit_stats():
+    return LLM_RATE_LIMITER.get_stats()
+
+
+@STATS_ROUTER.get("/layout-cache", response_model=LayoutCacheStats)
+async def get_layout_cache_stats():
+    return LAYOUT_CACHE.get_stats()
+
+
+@STATS_ROUTER.get("/schema-cache", response_model=SchemaCompileCacheStats)
+async def get_schema_compile_cache_stats():
+    return SCHEMA_COMPILE_CACHE.get_stats()
+
+
+@STATS_ROUTER.get("/image-generation", response_model=ImageGenerationStats)
+async def get_image_generation_stats():
+    return IMAGE_GENERATION_SCHEDULER.get_stats()
+
+
+@STATS_ROUTER.get("/document-parsing", response_model=DoclingPoolStats)
+async def get_document_parsing_stats():
+    return DOCLING_PROCESS_POOL.get_stats()
+
+
+@STATS_ROUTER.get("/document-cache", response_model=ParsedDocumentCacheStats)
+async def get_parsed_document_cache_stats():
+    return PARSED_DOCUMENT_CACHE.get_stats()
+
+
+@STATS_ROUTER.get("/outline-context", response_model=OutlineContextStats)
+async def get_outline_context_stats():
+    return CONTEXT_BUDGETER.get_stats()
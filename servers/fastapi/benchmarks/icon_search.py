@@ -0,0 +1,70 @@
+"""
+Startup time and query latency of the icon search backends (Chroma HNSW vs
+in-memory NumPy matrix). Needs assets/icons.json; the first run builds both
+indexes, later runs measure loading them.
+
+    python -m benchmarks.icon_search
+"""
+
+import os
+import time
+import timeit
+
+from services.icon_finder_service import IconFinderService
+
+QUERIES = [
+    "growth chart",
+    "rocket launch",
+    "team collaboration",
+    "money savings",
+    "security shield",
+    "global network",
+    "calendar deadline",
+    "customer support",
+    "cloud storage",
+    "idea lightbulb",
+]
+
+
+def start_service(backend: str) -> IconFinderService:
+    os.environ["ICON_SEARCH_BACKEND"] = backend
+    service = IconFinderService()
+    if not service._initialize_icons_collection():
+        raise RuntimeError(f"Unable to initialize the {backend} icon backend")
+    return service
+
+
+def main(number: int = 50):
+    # Builds the indexes (and downloads the model) outside of the timings
+    for backend in ("chroma", "numpy"):
+        start_service(backend)
+
+    print(f"{'backend':<10}{'startup':>12}{'single':>12}{'batch of 10':>14}")
+    for backend in ("chroma", "numpy"):
+        started_at = time.perf_counter()
+        service = start_service(backend)
+        startup = time.perf_counter() - started_at
+
+        collection = service.collection
+        single = min(
+            timeit.repeat(
+                lambda: collection.query(query_texts=QUERIES[:1], n_results=1),
+                number=number,
+                repeat=3,
+            )
+        )
+        batch = min(
+            timeit.repeat(
+                lambda: collection.query(query_texts=QUERIES, n_results=1),
+                number=number,
+                repeat=3,
+            )
+        )
+        print(
+            f"{backend:<10}{startup * 1e3:>10.1f}ms{single / number * 1e3:>10.2f}ms"
+            f"{batch / number * 1e3:>12.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Per-slide CPU spent preparing response schemas, with and without the schema
+compile cache.
+
+    python -m benchmarks.schema_compile_cache
+"""
+
+import timeit
+
+from services.schema_compile_cache import SchemaCompileCache
+from utils.llm_calls.generate_slide_content import build_response_schema
+from utils.schema_utils import (
+    ensure_strict_json_schema,
+    flatten_json_schema,
+    remove_titles_from_schema,
+)
+
+ITEM_SCHEMA = {
+    "type": "object",
+    "title": "Item",
+    "properties": {
+        "title": {"type": "string", "minLength": 3, "maxLength": 40},
+        "description": {"type": "string", "minLength": 50, "maxLength": 150},
+        "icon": {
+            "type": "object",
+            "properties": {
+                "__icon_url__": {"type": "string"},
+                "__icon_query__": {"type": "string"},
+            },
+            "required": ["__icon_url__", "__icon_query__"],
+        },
+    },
+    "required": ["title", "description", "icon"],
+}
+
+SLIDE_SCHEMA = {
+    "type": "object",
+    "title": "BulletWithIconsSlide",
+    "properties": {
+        "title": {"type": "string", "minLength": 3, "maxLength": 60},
+        "image": {
+            "type": "object",
+            "properties": {
+                "__image_url__": {"type": "string"},
+                "__image_prompt__": {"type": "string"},
+            },
+            "required": ["__image_url__", "__image_prompt__"],
+        },
+        "items": {
+            "type": "array",
+            "items": {"$ref": "#/$defs/Item"},
+            "minItems": 2,
+            "maxItems": 6,
+        },
+    },
+    "required": ["title", "image", "items"],
+    "$defs": {"Item": ITEM_SCHEMA},
+}
+
+
+def strict_schema(schema: dict) -> dict:
+    return ensure_strict_json_schema(schema, path=(), root=schema)
+
+
+def google_tool_schema(schema: dict) -> dict:
+    return remove_titles_from_schema(flatten_json_schema(schema))
+
+
+def main(number: int = 2000):
+    cache = SchemaCompileCache()
+    cases = {
+        "slide content": lambda: build_response_schema(SLIDE_SCHEMA),
+        "slide content + strict": lambda: strict_schema(
+            build_response_schema(SLIDE_SCHEMA)
+        ),
+        "slide content + google tool": lambda: google_tool_schema(
+            build_response_schema(SLIDE_SCHEMA)
+        ),
+    }
+    cached_cases = {
+        "slide content": lambda: cache.compile(
+            SLIDE_SCHEMA, "slide_content", build_response_schema
+        ),
+        "slide content + strict": lambda: cache.compile(
+            cache.compile(SLIDE_SCHEMA, "slide_content", build_response_schema),
+            "strict",
+            strict_schema,
+        ),
+        "slide content + google tool": lambda: cache.compile(
+            cache.compile(SLIDE_SCHEMA, "slide_content", build_response_schema),
+            "google_tool",
+            google_tool_schema,
+        ),
+    }
+
+    print(f"{'case':<30}{'uncached':>12}{'cached':>12}{'saved':>10}")
+    for name, case in cases.items():
+        uncached = min(timeit.repeat(case, number=number, repeat=3)) / number
+        cached = min(timeit.repeat(cached_cases[name], number=number, repeat=3))
+        cached /= number
+        print(
+            f"{name:<30}{uncached * 1e6:>10.1f}us{cached * 1e6:>10.1f}us"
+            f"{(1 - cached / uncached) * 100:>9.0f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
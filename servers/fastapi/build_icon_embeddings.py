@@ -0,0 +1,27 @@
+"""
+Builds the icon embeddings artifact (and seeds the icons collection) so
+containers start without embedding every icon. Run from servers/fastapi at
+image build time:
+
+    python build_icon_embeddings.py
+"""
+
+from services.icon_finder_service import ICON_FINDER_SERVICE
+
+
+def main():
+    index = ICON_FINDER_SERVICE.build_icon_embeddings()
+    if not index:
+        print("Warning: Icon embeddings were not built, they are built on first use")
+        return
+    print(
+        f"Built embeddings of {len(index.ids)} icons at "
+        f"{ICON_FINDER_SERVICE.get_embeddings_path()}"
+    )
+
+    if ICON_FINDER_SERVICE.get_backend() != "numpy":
+        ICON_FINDER_SERVICE._initialize_icons_collection()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,3 +18,15 @@ WEBP_MIME_TYPES = ["image/webp"]
 UPLOAD_ACCEPTED_FILE_TYPES = (
     PDF_MIME_TYPES + TEXT_MIME_TYPES + POWERPOINT_TYPES + WORD_TYPES
 )
+
+
+# Document parsing in the docling process pool
+DEFAULT_DOCLING_PARSE_TIMEOUT = 300
+# Passed to docling's PdfPipelineOptions, part of the parsed document cache key
+DOCLING_PIPELINE_OPTIONS = {"do_ocr": False}
+PDF_PAGE_IMAGE_RESOLUTION = 150
+
+# Parsed document cache
+DEFAULT_PARSED_DOCUMENT_CACHE_MAX_SIZE = 512 * 1024 * 1024
+# PDFs are converted in sections of this many pages, in parallel
+PDF_PAGES_PER_SECTION = 10
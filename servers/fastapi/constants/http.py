@@ -0,0 +1,7 @@
+# Shared outbound HTTP session
+DEFAULT_HTTP_TIMEOUT = 300
+HTTP_CONNECT_TIMEOUT = 30
+HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST = 20
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 30
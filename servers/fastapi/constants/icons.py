@@ -0,0 +1,7 @@
+# Icon search
+ICON_SEARCH_BATCH_WINDOW = 0.01
+ICON_SEARCH_CACHE_MAX_ENTRIES = 2048
+DEFAULT_ICON_SEARCH_BACKEND = "chroma"
+DEFAULT_ICON_EMBEDDINGS_PATH = "chroma/icon_embeddings.npy"
+# Bump when the way icon documents are embedded changes
+ICON_EMBEDDINGS_VERSION = 1
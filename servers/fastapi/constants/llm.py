@@ -4,3 +4,48 @@ OPENAI_URL = "https://api.openai.com/v1"
 DEFAULT_OPENAI_MODEL = "gpt-4.1"
 DEFAULT_GOOGLE_MODEL = "models/gemini-2.5-flash"
 DEFAULT_ANTHROPIC_MODEL = "claude-sonnet-4-20250514"
+
+# Response cache
+DEFAULT_LLM_RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_LLM_RESPONSE_CACHE_MAX_SIZE_MB = 100
+
+# Rate limiting
+DEFAULT_LLM_MAX_CONCURRENCY = 16
+DEFAULT_LLM_MAX_RETRIES = 4
+LLM_RETRY_BASE_DELAY = 1.0
+LLM_RETRY_MAX_DELAY = 60.0
+LLM_RATE_LIMIT_STATUS_CODES = (429, 503, 529)
+
+# Provider batch APIs
+LLM_BATCH_POLL_INTERVAL = 30
+
+# Provider-ready response schemas kept by the schema compile cache
+SCHEMA_COMPILE_CACHE_MAX_ENTRIES = 1024
+
+# Outline context budget, documents beyond it are chunked and selected
+DEFAULT_OUTLINE_CONTEXT_TOKEN_BUDGET = 32000
+# Share of the model context window the default budget may take at most
+OUTLINE_CONTEXT_WINDOW_SHARE = 0.5
+# Context windows by model name prefix, the longest matching prefix wins
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-3.5-turbo": 16385,
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-0125": 128000,
+    "gpt-4-1106": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4.1": 1047576,
+    "gpt-4.5": 128000,
+    "gpt-4o": 128000,
+    "chatgpt-4o": 128000,
+    "gpt-5": 400000,
+    "gpt-oss": 131072,
+    "o1": 200000,
+    "o1-mini": 128000,
+    "o1-preview": 128000,
+    "o3": 200000,
+    "o4": 200000,
+    "models/gemini": 1048576,
+    "gemini": 1048576,
+    "claude": 200000,
+}
@@ -1 +1,43 @@
 DEFAULT_TEMPLATES = ["general", "modern", "standard", "swift"]
+
+# Maximum number of slide content LLM calls in flight for a single presentation
+DEFAULT_SLIDE_GENERATION_CONCURRENCY = 10
+
+# Async presentation generation queue
+DEFAULT_PRESENTATION_WORKER_CONCURRENCY = 2
+DEFAULT_PRESENTATION_GENERATION_MAX_ATTEMPTS = 3
+PRESENTATION_GENERATION_LEASE_SECONDS = 120
+PRESENTATION_GENERATION_POLL_INTERVAL = 2
+PRESENTATION_GENERATION_RETRY_DELAY = 10
+
+# Presentations generated at the same time by a batch request
+DEFAULT_BATCH_PRESENTATION_CONCURRENCY = 4
+
+# Seconds a fetched template layout is used before it is revalidated
+DEFAULT_LAYOUT_CACHE_TTL = 3600
+
+# Stock image search results
+STOCK_IMAGE_RESULTS_PER_QUERY = 10
+DEFAULT_IMAGE_SEARCH_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Minimum prompt similarity (0-1) for reusing a previously generated image
+DEFAULT_GENERATED_IMAGE_REUSE_THRESHOLD = 0.9
+
+# Image generation scheduler
+DEFAULT_IMAGE_GENERATION_CONCURRENCY = {
+    "dall-e-3": 4,
+    "gemini_flash": 4,
+    "pexels": 8,
+    "pixabay": 8,
+}
+DEFAULT_IMAGE_GENERATION_MAX_RETRIES = 2
+IMAGE_GENERATION_RETRY_BASE_DELAY = 1.0
+IMAGE_GENERATION_RETRY_MAX_DELAY = 30.0
+PLACEHOLDER_IMAGE_PATH = "/static/images/placeholder.jpg"
+# Pillow format and extension for generated images transcoded on save
+GENERATED_IMAGE_FORMATS = {
+    "webp": ("WEBP", ".webp"),
+    "jpeg": ("JPEG", ".jpg"),
+    "jpg": ("JPEG", ".jpg"),
+}
+GENERATED_IMAGE_QUALITY = 85
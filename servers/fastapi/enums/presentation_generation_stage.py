@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class PresentationGenerationStage(str, Enum):
+    OUTLINES = "outlines"
+    STRUCTURE = "structure"
+    SLIDES = "slides"
+    ASSETS = "assets"
+    EXPORT = "export"
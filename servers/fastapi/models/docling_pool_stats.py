@@ -0,0 +1,10 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class DoclingPoolStats(BaseModel):
+    status: Literal["cold", "warming", "ready", "failed"]
+    ready: bool
+    max_workers: int
+    warmed_workers: int
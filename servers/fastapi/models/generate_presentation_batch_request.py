@@ -0,0 +1,15 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from models.generate_presentation_request import GeneratePresentationRequest
+
+
+class GeneratePresentationBatchRequest(BaseModel):
+    presentations: List[GeneratePresentationRequest] = Field(
+        ..., min_length=1, description="Presentations to generate"
+    )
+    concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of presentations generated at the same time",
+    )
@@ -40,3 +40,11 @@ class GeneratePresentationRequest(BaseModel):
     trigger_webhook: bool = Field(
         default=False, description="Whether to trigger subscribed webhooks"
     )
+    reuse_generated_images: Optional[bool] = Field(
+        default=None,
+        description="Whether to reuse previously generated images for similar prompts, defaults to REUSE_GENERATED_IMAGES",
+    )
+    generation_mode: Literal["realtime", "bulk"] = Field(
+        default="realtime",
+        description="Use 'bulk' to generate slides through the provider batch API at lower cost, which can take up to 24 hours. Only supported with /generate/async and /generate/batch",
+    )
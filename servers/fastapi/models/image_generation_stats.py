@@ -0,0 +1,19 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class ImageGenerationProviderStats(BaseModel):
+    provider: str
+    max_concurrency: int
+    in_flight: int
+    queued: int
+    requests: int
+    retries: int
+    failures: int
+    placeholders: int
+    placeholder_reasons: Dict[str, int]
+
+
+class ImageGenerationStats(BaseModel):
+    providers: List[ImageGenerationProviderStats]
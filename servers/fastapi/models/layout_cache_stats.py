@@ -0,0 +1,12 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class LayoutCacheStats(BaseModel):
+    ttl: int
+    layouts: List[str]
+    hits: int
+    misses: int
+    revalidations: int
+    invalidations: int
@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class LLMClientPoolEntry(BaseModel):
+    provider: str
+    base_url: Optional[str] = None
+    created_at: datetime
+    uses: int
+
+
+class LLMClientPoolStats(BaseModel):
+    clients: List[LLMClientPoolEntry]
+    hits: int
+    misses: int
+    evictions: int
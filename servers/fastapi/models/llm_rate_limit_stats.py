@@ -0,0 +1,25 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class LLMRateLimitConfig(BaseModel):
+    max_concurrency: int
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+
+class LLMRateLimitEntry(BaseModel):
+    provider: str
+    model: str
+    config: LLMRateLimitConfig
+    concurrency_limit: int
+    in_flight: int
+    queued: int
+    available_requests: Optional[float] = None
+    available_tokens: Optional[float] = None
+    rate_limited: int
+    retries: int
+
+
+class LLMRateLimitStats(BaseModel):
+    limits: List[LLMRateLimitEntry]
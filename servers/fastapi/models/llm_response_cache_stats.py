@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class LLMResponseCacheStats(BaseModel):
+    enabled: bool
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+    entries: int
+    size_bytes: int
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class OutlineContextStats(BaseModel):
+    requests: int
+    trimmed_requests: int
+    input_tokens: int
+    output_tokens: int
+    tokens_saved: int
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class ParsedDocumentCacheStats(BaseModel):
+    max_size_bytes: int
+    size_bytes: int
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
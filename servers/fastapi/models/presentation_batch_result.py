@@ -0,0 +1,14 @@
+from typing import Optional
+import uuid
+from pydantic import BaseModel
+
+from models.api_error_model import APIErrorModel
+
+
+class PresentationBatchItemResult(BaseModel):
+    index: int
+    status: str
+    presentation_id: Optional[uuid.UUID] = None
+    path: Optional[str] = None
+    edit_path: Optional[str] = None
+    error: Optional[APIErrorModel] = None
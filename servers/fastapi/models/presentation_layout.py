@@ -1,6 +1,6 @@
 from typing import List, Optional
 from fastapi import HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from models.presentation_structure_model import PresentationStructureModel
 
@@ -17,6 +17,8 @@ class PresentationLayoutModel(BaseModel):
     ordered: bool = Field(default=False)
     slides: List[SlideLayoutModel]
 
+    _string: Optional[str] = PrivateAttr(default=None)
+
     def get_slide_layout_index(self, slide_layout_id: str) -> int:
         for index, slide in enumerate(self.slides):
             if slide.id == slide_layout_id:
@@ -31,9 +33,13 @@ class PresentationLayoutModel(BaseModel):
         )
 
     def to_string(self):
+        # Cached layouts are shared between requests, build the prompt text once
+        if self._string is not None:
+            return self._string
         message = f"## Presentation Layout\n\n"
         for index, slide in enumerate(self.slides):
             message += f"### Slide Layout: {index}: \n"
             message += f"- Name: {slide.name or slide.json_schema.get('title')} \n"
             message += f"- Description: {slide.description} \n\n"
+        self._string = message
         return message
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class SchemaCompileCacheStats(BaseModel):
+    hits: int
+    misses: int
+    entries: int
@@ -0,0 +1,9 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SlideGenerationTiming(BaseModel):
+    index: int
+    layout: str
+    content_seconds: float
+    assets_seconds: Optional[float] = None
@@ -1,6 +1,6 @@
 from datetime import datetime
 import secrets
-from typing import Optional
+from typing import List, Optional
 import uuid
 
 from sqlalchemy import JSON, Column
@@ -20,3 +20,12 @@ class AsyncPresentationGenerationTaskModel(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     data: Optional[dict] = Field(sa_column=Column(JSON), default=None)
+    slide_timings: Optional[List[dict]] = Field(sa_column=Column(JSON), default=None)
+
+    # Queue, the request and lease state are internal to the workers
+    presentation_id: Optional[uuid.UUID] = None
+    request: Optional[dict] = Field(sa_column=Column(JSON), default=None, exclude=True)
+    stage: Optional[str] = None
+    attempts: int = Field(default=0, exclude=True)
+    lease_owner: Optional[str] = Field(default=None, index=True, exclude=True)
+    lease_expires_at: Optional[datetime] = Field(default=None, exclude=True)
@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+
+class ImageSearchResultModel(SQLModel, table=True):
+
+    __tablename__ = "image_search_results"
+
+    # provider:normalized query
+    id: str = Field(primary_key=True)
+    provider: str
+    query: str
+    results: List[str] = Field(sa_column=Column(JSON), default_factory=list)
+    created_at: datetime = Field(default_factory=datetime.now)
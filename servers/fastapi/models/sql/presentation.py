@@ -41,6 +41,8 @@ class PresentationModel(SQLModel, table=True):
     include_table_of_contents: bool = Field(sa_column=Column(Boolean), default=False)
     include_title_slide: bool = Field(sa_column=Column(Boolean), default=True)
     web_search: bool = Field(sa_column=Column(Boolean), default=False)
+    # Set while slides are generated, hides the partial presentation
+    generating: bool = Field(sa_column=Column(Boolean), default=False)
 
     def get_new_presentation(self):
         return PresentationModel(
@@ -0,0 +1,22 @@
+from datetime import datetime
+import secrets
+from typing import List, Optional
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+
+class PresentationGenerationBatchModel(SQLModel, table=True):
+
+    __tablename__ = "presentation_generation_batches"
+
+    id: str = Field(
+        default_factory=lambda: f"batch-{secrets.token_hex(32)}", primary_key=True
+    )
+    status: str
+    total: int
+    completed: int = Field(default=0)
+    failed: int = Field(default=0)
+    results: Optional[List[dict]] = Field(sa_column=Column(JSON), default=None)
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
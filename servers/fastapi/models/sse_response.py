@@ -38,3 +38,36 @@ class SSECompleteResponse(BaseModel):
             event="response",
             data=json.dumps({"type": "complete", self.key: self.value}),
         ).to_string()
+
+
+class SSESlideResponse(BaseModel):
+    # "slide" when a slide is first generated, "patch" when its assets are ready
+    type: str
+    index: int
+    slide: object
+
+    def to_string(self):
+        return SSEResponse(
+            event="response",
+            data=json.dumps({"type": self.type, "index": self.index, "slide": self.slide}),
+        ).to_string()
+
+
+class SSEBatchProgressResponse(BaseModel):
+    # Sent whenever a presentation of a batch starts, completes or fails
+    index: int
+    status: str
+    result: object
+
+    def to_string(self):
+        return SSEResponse(
+            event="response",
+            data=json.dumps(
+                {
+                    "type": "progress",
+                    "index": self.index,
+                    "status": self.status,
+                    "result": self.result,
+                }
+            ),
+        ).to_string()
@@ -0,0 +1,240 @@
+import asyncio
+import re
+from typing import Dict, List, Optional, Tuple
+
+from constants.llm import (
+    DEFAULT_OUTLINE_CONTEXT_TOKEN_BUDGET,
+    MODEL_CONTEXT_WINDOWS,
+    OUTLINE_CONTEXT_WINDOW_SHARE,
+)
+from models.document_chunk import DocumentChunk
+from models.outline_context_stats import OutlineContextStats
+from services.llm_rate_limiter import estimate_text_tokens
+from services.score_based_chunker import ScoreBasedChunker
+from utils.get_env import get_outline_context_token_budget_env
+from utils.llm_provider import get_model, is_ollama_selected
+from utils.ollama import get_ollama_model_context_length
+from utils.parsers import parse_int_or_none
+
+WORD_PATTERN = re.compile(r"\w{3,}")
+
+
+def get_words(text: str) -> set[str]:
+    return set(WORD_PATTERN.findall(text.lower()))
+
+
+def split_text(text: str, max_characters: int) -> List[str]:
+    # Splits on paragraphs where possible, long paragraphs are cut
+    pieces = []
+    current = ""
+    for paragraph in text.split("\n\n"):
+        while len(paragraph) > max_characters:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(paragraph[:max_characters])
+            paragraph = paragraph[max_characters:]
+        if current and len(current) + len(paragraph) + 2 > max_characters:
+            pieces.append(current)
+            current = ""
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+class ContextBudgeter:
+    """
+    Fits uploaded documents into the outline prompt. Documents within the
+    token budget are passed as they are. Larger ones are split into sections
+    by heading with ScoreBasedChunker, ranked by heading score and overlap
+    with the presentation prompt, and the best sections are kept in document
+    order. Sections are split to an even share of the budget per slide, so
+    the context covers at least as many topics as there are slides.
+
+    The budget is OUTLINE_CONTEXT_TOKEN_BUDGET when set. Otherwise it is
+    the default budget, limited to a share of the model context window.
+    Documents for models with an unknown context window are not trimmed.
+    """
+
+    def __init__(self):
+        self.chunker = ScoreBasedChunker()
+        self._requests = 0
+        self._trimmed_requests = 0
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._unknown_models: set[Optional[str]] = set()
+        self._ollama_context_windows: Dict[str, Optional[int]] = {}
+
+    def get_token_budget(
+        self, model: Optional[str], context_window: Optional[int] = None
+    ) -> Optional[int]:
+        # An explicit budget wins over the context window limit
+        budget = parse_int_or_none(get_outline_context_token_budget_env())
+        if budget:
+            return budget
+
+        if context_window is None:
+            context_window = max(
+                (
+                    (len(prefix), window)
+                    for prefix, window in MODEL_CONTEXT_WINDOWS.items()
+                    if model and model.startswith(prefix)
+                ),
+                default=(0, None),
+            )[1]
+        if context_window is None:
+            if model not in self._unknown_models:
+                self._unknown_models.add(model)
+                print(
+                    f"Warning: Context window of {model} is unknown, documents "
+                    "in the outline prompt are not trimmed. Set "
+                    "OUTLINE_CONTEXT_TOKEN_BUDGET to limit them."
+                )
+            return None
+        return min(
+            DEFAULT_OUTLINE_CONTEXT_TOKEN_BUDGET,
+            int(context_window * OUTLINE_CONTEXT_WINDOW_SHARE),
+        )
+
+    async def get_ollama_context_window(self, model: str) -> Optional[int]:
+        if model not in self._ollama_context_windows:
+            try:
+                context_length = await get_ollama_model_context_length(model)
+            except Exception as e:
+                print(f"Could not get context length of {model} from Ollama: {e}")
+                context_length = None
+            self._ollama_context_windows[model] = context_length
+        return self._ollama_context_windows[model]
+
+    async def get_context(
+        self,
+        documents: List[str],
+        n_slides: int,
+        prompt: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> str:
+        model = model or get_model()
+        context_window = None
+        if model and is_ollama_selected():
+            context_window = await self.get_ollama_context_window(model)
+        return await asyncio.to_thread(
+            self.select_context,
+            documents,
+            n_slides,
+            prompt,
+            self.get_token_budget(model, context_window),
+        )
+
+    def select_context(
+        self,
+        documents: List[str],
+        n_slides: int,
+        prompt: Optional[str],
+        token_budget: Optional[int],
+    ) -> str:
+        documents = [each for each in documents if each and each.strip()]
+        context = "\n\n".join(documents)
+        input_tokens = estimate_text_tokens(context)
+
+        if token_budget is not None and input_tokens > token_budget:
+            context = self._select_chunks(documents, n_slides, prompt, token_budget)
+            self._trimmed_requests += 1
+
+        output_tokens = estimate_text_tokens(context)
+        self._requests += 1
+        self._input_tokens += input_tokens
+        self._output_tokens += output_tokens
+        if output_tokens < input_tokens:
+            print(
+                f"Outline context trimmed from ~{input_tokens} to "
+                f"~{output_tokens} tokens"
+            )
+        return context
+
+    def get_chunks(self, document: str) -> List[DocumentChunk]:
+        headings = self.chunker.extract_headings(document)
+        heading_scores = self.chunker.score_headings(headings)
+        chunks = self.chunker.get_chunks_from_headings(
+            document, headings, heading_scores, top_k=len(headings)
+        )
+
+        # Text before the first heading usually introduces the document
+        first_heading_line = next(
+            (
+                index
+                for index, line in enumerate(document.split("\n"))
+                if line.strip().startswith("#")
+            ),
+            None,
+        )
+        preamble = (
+            document
+            if first_heading_line is None
+            else "\n".join(document.split("\n")[:first_heading_line])
+        ).strip()
+        if preamble:
+            chunks.insert(
+                0,
+                DocumentChunk(
+                    heading="",
+                    content=preamble,
+                    heading_index=-1,
+                    score=max(heading_scores, default=0.0),
+                ),
+            )
+        return chunks
+
+    def _select_chunks(
+        self,
+        documents: List[str],
+        n_slides: int,
+        prompt: Optional[str],
+        token_budget: int,
+    ) -> str:
+        prompt_words = get_words(prompt or "")
+        # Each section gets at most an even share, so every slide has context
+        chunk_budget = max(1, token_budget // max(n_slides, 1))
+
+        ranked: List[Tuple[float, int, int, str]] = []
+        for document_index, document in enumerate(documents):
+            position = 0
+            for chunk in self.get_chunks(document):
+                text = f"{chunk.heading}\n{chunk.content}".strip()
+                score = chunk.score
+                if prompt_words:
+                    overlap = len(prompt_words & get_words(text)) / len(prompt_words)
+                    score += 10.0 * overlap
+                # 4 characters per token, the same estimate as the budget
+                for index, piece in enumerate(split_text(text, chunk_budget * 4)):
+                    # Later pieces of a section rank slightly lower
+                    piece_score = score - 0.1 * index
+                    ranked.append((piece_score, document_index, position, piece))
+                    position += 1
+        ranked.sort(key=lambda each: (-each[0], each[1], each[2]))
+
+        # Counted in characters, including the blank lines between pieces
+        max_characters = token_budget * 4
+        selected = []
+        used_characters = 0
+        for _, document_index, position, text in ranked:
+            characters = len(text) + (2 if selected else 0)
+            if used_characters + characters > max_characters:
+                continue
+            used_characters += characters
+            selected.append((document_index, position, text))
+
+        selected.sort()
+        return "\n\n".join(text for _, _, text in selected)
+
+    def get_stats(self) -> OutlineContextStats:
+        return OutlineContextStats(
+            requests=self._requests,
+            trimmed_requests=self._trimmed_requests,
+            input_tokens=self._input_tokens,
+            output_tokens=self._output_tokens,
+            tokens_saved=self._input_tokens - self._output_tokens,
+        )
+
+
+CONTEXT_BUDGETER = ContextBudgeter()
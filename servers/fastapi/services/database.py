@@ -12,14 +12,16 @@ from models.sql.async_presentation_generation_status import (
     AsyncPresentationGenerationTaskModel,
 )
 from models.sql.image_asset import ImageAsset
+from models.sql.image_search_result import ImageSearchResultModel
 from models.sql.key_value import KeyValueSqlModel
 from models.sql.ollama_pull_status import OllamaPullStatus
 from models.sql.presentation import PresentationModel
+from models.sql.presentation_generation_batch import PresentationGenerationBatchModel
 from models.sql.slide import SlideModel
 from models.sql.presentation_layout_code import PresentationLayoutCodeModel
 from models.sql.template import TemplateModel
 from models.sql.webhook_subscription import WebhookSubscription
-from utils.db_utils import get_database_url_and_connect_args
+from utils.db_utils import add_missing_columns, get_database_url_and_connect_args
 
 
 database_url, connect_args = get_database_url_and_connect_args()
@@ -50,22 +52,24 @@ async def get_container_db_async_session() -> AsyncGenerator[AsyncSession, None]
 
 # Create Database and Tables
 async def create_db_and_tables():
+    tables = [
+        PresentationModel.__table__,
+        SlideModel.__table__,
+        KeyValueSqlModel.__table__,
+        ImageAsset.__table__,
+        ImageSearchResultModel.__table__,
+        PresentationLayoutCodeModel.__table__,
+        TemplateModel.__table__,
+        WebhookSubscription.__table__,
+        AsyncPresentationGenerationTaskModel.__table__,
+        PresentationGenerationBatchModel.__table__,
+    ]
     async with sql_engine.begin() as conn:
         await conn.run_sync(
-            lambda sync_conn: SQLModel.metadata.create_all(
-                sync_conn,
-                tables=[
-                    PresentationModel.__table__,
-                    SlideModel.__table__,
-                    KeyValueSqlModel.__table__,
-                    ImageAsset.__table__,
-                    PresentationLayoutCodeModel.__table__,
-                    TemplateModel.__table__,
-                    WebhookSubscription.__table__,
-                    AsyncPresentationGenerationTaskModel.__table__,
-                ],
-            )
+            lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=tables)
         )
+        # Tables of earlier versions get the columns added since
+        await conn.run_sync(lambda sync_conn: add_missing_columns(sync_conn, tables))
 
     async with container_db_engine.begin() as conn:
         await conn.run_sync(
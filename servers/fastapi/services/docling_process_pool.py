@@ -0,0 +1,180 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+from typing import Any, Callable, Optional, Tuple
+
+from constants.documents import DEFAULT_DOCLING_PARSE_TIMEOUT
+from models.docling_pool_stats import DoclingPoolStats
+from utils.get_env import get_docling_max_workers_env, get_docling_parse_timeout_env
+from utils.parsers import parse_float_or_none, parse_int_or_none
+
+
+def initialize_docling_process():
+    # Imported here, so the server process never loads docling itself
+    from services.docling_service import get_docling_service
+
+    get_docling_service()
+
+
+def is_docling_process_ready() -> bool:
+    return True
+
+
+def parse_to_markdown_in_process(
+    file_path: str, page_range: Optional[Tuple[int, int]] = None
+) -> str:
+    from services.docling_service import get_docling_service
+
+    return get_docling_service().parse_to_markdown(file_path, page_range)
+
+
+class DoclingProcessPool:
+    """
+    Runs docling conversions in a dedicated process pool (DOCLING_MAX_WORKERS,
+    defaults to the number of cores), so parsing a large document neither
+    blocks the event loop nor holds the GIL of the server process.
+
+    Every pool process builds one DoclingService and loads its pipelines as
+    it starts. warm_up() starts all processes ahead of the first upload and
+    sets the readiness flag once they are warm.
+
+    A call that exceeds its timeout (DOCLING_PARSE_TIMEOUT) while running
+    can't be interrupted inside its process, so the pool's processes are
+    terminated and the pool is recreated. Calls that were running in the
+    terminated pool are retried once on the new one. A caller that goes away
+    (e.g. a client disconnect) only drops its call if it is still queued, a
+    running call is left to finish so other callers' parses are unaffected.
+    """
+
+    def __init__(self, initializer: Callable[[], Any] = initialize_docling_process):
+        self._initializer = initializer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._status = "cold"
+        self._warmed_workers = 0
+
+    def get_max_workers(self) -> int:
+        return parse_int_or_none(get_docling_max_workers_env()) or os.cpu_count() or 1
+
+    def get_timeout(self) -> float:
+        return (
+            parse_float_or_none(get_docling_parse_timeout_env())
+            or DEFAULT_DOCLING_PARSE_TIMEOUT
+        )
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        if not self._executor:
+            # Spawned, forking a process with a running event loop is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.get_max_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self._initializer,
+            )
+        return self._executor
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+    ):
+        timeout = timeout or self.get_timeout()
+        for attempt in range(2):
+            executor = self.get_executor()
+            future = executor.submit(func, *args)
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except BrokenProcessPool:
+                self.restart(executor)
+                if attempt:
+                    raise
+            except asyncio.TimeoutError:
+                # Still queued calls are just dropped, running ones need
+                # their process gone
+                if not future.cancel():
+                    self.restart(executor)
+                raise
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+
+    @property
+    def ready(self) -> bool:
+        return self._status == "ready"
+
+    def warm_up(self):
+        if self._warm_up_task and not self._warm_up_task.done():
+            return
+        self._warm_up_task = asyncio.create_task(self._warm_up())
+
+    async def _warm_up(self):
+        self._status = "warming"
+        self._warmed_workers = 0
+        executor = self.get_executor()
+        max_workers = self.get_max_workers()
+        try:
+            # Processes spawn on submit, one per call while none is idle
+            futures = [
+                asyncio.wrap_future(executor.submit(is_docling_process_ready))
+                for _ in range(max_workers)
+            ]
+            for future in asyncio.as_completed(futures):
+                await future
+                self._warmed_workers += 1
+            self._status = "ready"
+            print(f"Docling warmed up in {max_workers} processes")
+        except Exception as exc:
+            self._status = "failed"
+            print("Warning: Unable to warm up docling, continuing without it:", exc)
+
+    def get_stats(self) -> DoclingPoolStats:
+        return DoclingPoolStats(
+            status=self._status,
+            ready=self.ready,
+            max_workers=self.get_max_workers(),
+            warmed_workers=self._warmed_workers,
+        )
+
+    async def parse_to_markdown(
+        self,
+        file_path: str,
+        page_range: Optional[Tuple[int, int]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        return await self.run(
+            parse_to_markdown_in_process, file_path, page_range, timeout=timeout
+        )
+
+    def restart(self, executor: ProcessPoolExecutor):
+        # Another call may have restarted the pool already
+        if self._executor is not executor:
+            return
+        self._executor = None
+        self._status = "cold"
+        self._warmed_workers = 0
+        self._shutdown(executor)
+
+        # The new processes are warmed up again if warm up is in use
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+            self.warm_up()
+
+    def close(self):
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+        if self._executor:
+            self._shutdown(self._executor)
+            self._executor = None
+
+    def _shutdown(self, executor: ProcessPoolExecutor):
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+
+DOCLING_PROCESS_POOL = DoclingProcessPool()
@@ -1,3 +1,5 @@
+from typing import Optional, Tuple
+
 from docling.document_converter import (
     DocumentConverter,
     PdfFormatOption,
@@ -7,11 +9,12 @@ from docling.document_converter import (
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.datamodel.base_models import InputFormat
 
+from constants.documents import DOCLING_PIPELINE_OPTIONS
+
 
 class DoclingService:
     def __init__(self):
-        self.pipeline_options = PdfPipelineOptions()
-        self.pipeline_options.do_ocr = False
+        self.pipeline_options = PdfPipelineOptions(**DOCLING_PIPELINE_OPTIONS)
 
         self.converter = DocumentConverter(
             allowed_formats=[InputFormat.PPTX, InputFormat.PDF, InputFormat.DOCX],
@@ -28,6 +31,33 @@ class DoclingService:
             },
         )
 
-    def parse_to_markdown(self, file_path: str) -> str:
-        result = self.converter.convert(file_path)
+    def warm_up(self):
+        # Pipelines (and the PDF layout models) load lazily on first convert
+        for input_format in (InputFormat.PDF, InputFormat.DOCX, InputFormat.PPTX):
+            self.converter.initialize_pipeline(input_format)
+
+    def parse_to_markdown(
+        self, file_path: str, page_range: Optional[Tuple[int, int]] = None
+    ) -> str:
+        # Page range is 1-based and inclusive
+        if page_range:
+            result = self.converter.convert(file_path, page_range=page_range)
+        else:
+            result = self.converter.convert(file_path)
         return result.document.export_to_markdown()
+
+
+# One warm converter per process, shared by every parse in it
+_docling_service: Optional[DoclingService] = None
+
+
+def get_docling_service() -> DoclingService:
+    global _docling_service
+    if _docling_service is None:
+        docling_service = DoclingService()
+        try:
+            docling_service.warm_up()
+        except Exception as exc:
+            print("Warning: Unable to warm up docling, continuing without it:", exc)
+        _docling_service = docling_service
+    return _docling_service
@@ -1,16 +1,29 @@
 import mimetypes
 from fastapi import HTTPException
 import os, asyncio
-from typing import List, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 import pdfplumber
 
 from constants.documents import (
     PDF_MIME_TYPES,
+    PDF_PAGE_IMAGE_RESOLUTION,
+    PDF_PAGES_PER_SECTION,
     POWERPOINT_TYPES,
     TEXT_MIME_TYPES,
     WORD_TYPES,
 )
-from services.docling_service import DoclingService
+from services.docling_process_pool import DOCLING_PROCESS_POOL
+from services.parsed_document_cache import PARSED_DOCUMENT_CACHE
+from utils.get_env import get_outline_context_max_pages_env
+from utils.parsers import parse_int_or_none
+
+
+def get_outline_context_max_pages() -> Optional[int]:
+    """
+    Pages of each PDF used as outline context (OUTLINE_CONTEXT_MAX_PAGES),
+    so outlines of large PDFs start without converting the whole file.
+    """
+    return parse_int_or_none(get_outline_context_max_pages_env())
 
 
 class DocumentsLoader:
@@ -18,8 +31,6 @@ class DocumentsLoader:
     def __init__(self, file_paths: List[str]):
         self._file_paths = file_paths
 
-        self.docling_service = DoclingService()
-
         self._documents: List[str] = []
         self._images: List[List[str]] = []
 
@@ -33,55 +44,156 @@ class DocumentsLoader:
 
     async def load_documents(
         self,
-        temp_dir: str,
+        temp_dir: Optional[str] = None,
         load_text: bool = True,
         load_images: bool = False,
+        max_pdf_pages: Optional[int] = None,
     ):
-        documents: List[str] = []
-        images: List[str] = []
-
         for file_path in self._file_paths:
             if not os.path.exists(file_path):
                 raise HTTPException(
                     status_code=404, detail=f"File {file_path} not found"
                 )
 
-            document = ""
-            imgs = []
-
-            mime_type = mimetypes.guess_type(file_path)[0]
-            if mime_type in PDF_MIME_TYPES:
-                document, imgs = await self.load_pdf(
-                    file_path, load_text, load_images, temp_dir
+        # Files are parsed in parallel, docling runs in its process pool
+        tasks = [
+            asyncio.create_task(
+                self.load_document(
+                    file_path, temp_dir, load_text, load_images, max_pdf_pages
                 )
-            elif mime_type in TEXT_MIME_TYPES:
-                document = await self.load_text(file_path)
-            elif mime_type in POWERPOINT_TYPES:
-                document = self.load_powerpoint(file_path)
-            elif mime_type in WORD_TYPES:
-                document = self.load_msword(file_path)
+            )
+            for file_path in self._file_paths
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self._documents = [document for document, _ in results]
+        self._images = [imgs for _, imgs in results]
+
+    async def load_document(
+        self,
+        file_path: str,
+        temp_dir: Optional[str],
+        load_text: bool,
+        load_images: bool,
+        max_pdf_pages: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
+        document = ""
+        imgs = []
+
+        mime_type = mimetypes.guess_type(file_path)[0]
+        if mime_type in PDF_MIME_TYPES:
+            document, imgs = await self.load_pdf(
+                file_path, load_text, load_images, temp_dir, max_pdf_pages
+            )
+        elif mime_type in TEXT_MIME_TYPES:
+            document = await self.load_text(file_path)
+        elif mime_type in POWERPOINT_TYPES:
+            document = await self.load_powerpoint(file_path)
+        elif mime_type in WORD_TYPES:
+            document = await self.load_msword(file_path)
+
+        return document, imgs
+
+    async def parse_to_markdown(self, file_path: str) -> str:
+        # Files parsed before, by content, are served from the cache
+        return await PARSED_DOCUMENT_CACHE.get_markdown(
+            file_path, lambda: self.parse_with_docling(file_path)
+        )
 
-            documents.append(document)
-            images.append(imgs)
+    async def parse_with_docling(
+        self, file_path: str, page_range: Optional[Tuple[int, int]] = None
+    ) -> str:
+        try:
+            return await DOCLING_PROCESS_POOL.parse_to_markdown(file_path, page_range)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=504,
+                detail=f"Timed out parsing {os.path.basename(file_path)}",
+            )
+
+    async def parse_pdf_to_markdown(
+        self, file_path: str, max_pages: Optional[int] = None
+    ) -> str:
+        async def parse():
+            sections = [
+                section
+                async for section in self.stream_pdf_sections(file_path, max_pages)
+            ]
+            return "\n\n".join(sections)
+
+        return await PARSED_DOCUMENT_CACHE.get_markdown(
+            file_path,
+            parse,
+            {"max_pages": max_pages, "pages_per_section": PDF_PAGES_PER_SECTION},
+        )
 
-        self._documents = documents
-        self._images = images
+    async def stream_pdf_sections(
+        self, file_path: str, max_pages: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Yields the markdown of a PDF in sections of PDF_PAGES_PER_SECTION
+        pages, in page order, as soon as each section and the ones before it
+        are converted. Sections are converted in parallel across the docling
+        processes. Only the first max_pages pages are converted when given.
+        """
+        try:
+            page_count = await asyncio.to_thread(self.get_pdf_page_count, file_path)
+        except Exception as e:
+            print(f"Warning: Unable to count pages of {file_path}: {e}")
+            yield await self.parse_with_docling(file_path)
+            return
+
+        if max_pages:
+            page_count = min(page_count, max_pages)
+        page_ranges = [
+            (start, min(start + PDF_PAGES_PER_SECTION - 1, page_count))
+            for start in range(1, page_count + 1, PDF_PAGES_PER_SECTION)
+        ]
+        if not page_ranges:
+            return
+
+        # Sections wait here rather than in the pool, where waiting would
+        # count towards their parse timeout
+        semaphore = asyncio.Semaphore(DOCLING_PROCESS_POOL.get_max_workers())
+
+        async def parse_section(page_range: Tuple[int, int]) -> str:
+            async with semaphore:
+                return await self.parse_with_docling(file_path, page_range)
+
+        tasks = [
+            asyncio.create_task(parse_section(page_range)) for page_range in page_ranges
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def load_pdf(
         self,
         file_path: str,
         load_text: bool,
         load_images: bool,
-        temp_dir: str,
+        temp_dir: Optional[str],
+        max_pages: Optional[int] = None,
     ) -> Tuple[str, List[str]]:
         image_paths = []
         document: str = ""
 
         if load_text:
-            document = self.docling_service.parse_to_markdown(file_path)
+            document = await self.parse_pdf_to_markdown(file_path, max_pages)
 
         if load_images:
-            image_paths = await self.get_page_images_from_pdf_async(file_path, temp_dir)
+            image_paths = await PARSED_DOCUMENT_CACHE.get_page_images(
+                file_path,
+                temp_dir,
+                lambda: self.get_page_images_from_pdf_async(file_path, temp_dir),
+            )
 
         return document, image_paths
 
@@ -89,18 +201,23 @@ class DocumentsLoader:
         with open(file_path, "r") as file:
             return await asyncio.to_thread(file.read)
 
-    def load_msword(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_msword(self, file_path: str) -> str:
+        return await self.parse_to_markdown(file_path)
 
-    def load_powerpoint(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_powerpoint(self, file_path: str) -> str:
+        return await self.parse_to_markdown(file_path)
+
+    @classmethod
+    def get_pdf_page_count(cls, file_path: str) -> int:
+        with pdfplumber.open(file_path) as pdf:
+            return len(pdf.pages)
 
     @classmethod
     def get_page_images_from_pdf(cls, file_path: str, temp_dir: str) -> List[str]:
         with pdfplumber.open(file_path) as pdf:
             images = []
             for page in pdf.pages:
-                img = page.to_image(resolution=150)
+                img = page.to_image(resolution=PDF_PAGE_IMAGE_RESOLUTION)
                 image_path = os.path.join(temp_dir, f"page_{page.page_number}.png")
                 img.save(image_path)
                 images.append(image_path)
@@ -0,0 +1,155 @@
+import asyncio
+import os
+from typing import Callable, Collection, List, Optional
+
+from sqlmodel import select
+
+from constants.presentation import DEFAULT_GENERATED_IMAGE_REUSE_THRESHOLD
+from models.sql.image_asset import ImageAsset
+from services.database import async_session_maker
+from services.icon_finder_service import ICON_FINDER_SERVICE
+from utils.get_env import get_generated_image_reuse_threshold_env
+from utils.parsers import parse_float_or_none
+
+
+class GeneratedImageIndex:
+    """
+    Similarity index over the prompts of images generated by DALL-E 3 and
+    Gemini, so a new prompt close enough to a past one (cosine similarity of
+    at least GENERATED_IMAGE_REUSE_THRESHOLD) reuses that image instead of
+    generating a new one. Prompts are embedded with the MiniLM model already
+    used for icon search and the index is seeded from existing image assets.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        embedding_function: Optional[Callable[[List[str]], List]] = None,
+    ):
+        self.collection_name = "generated_images"
+        self.client = client
+        self.embedding_function = embedding_function
+        self.collection = None
+        self._init_lock = asyncio.Lock()
+
+    def get_threshold(self) -> float:
+        threshold = parse_float_or_none(get_generated_image_reuse_threshold_env())
+        if threshold is None:
+            return DEFAULT_GENERATED_IMAGE_REUSE_THRESHOLD
+        return threshold
+
+    def is_enabled(self) -> bool:
+        # A threshold above 1 can never match
+        return self.get_threshold() <= 1
+
+    def _initialize_collection(self) -> bool:
+        self.client = self.client or ICON_FINDER_SERVICE.get_client()
+        self.embedding_function = (
+            self.embedding_function or ICON_FINDER_SERVICE.get_embedding_function()
+        )
+        if not self.client or not self.embedding_function:
+            return False
+        self.collection = self.client.get_or_create_collection(
+            name=self.collection_name, metadata={"hnsw:space": "cosine"}
+        )
+        return True
+
+    async def _ensure_collection_initialized(self) -> bool:
+        if self.collection:
+            return True
+        async with self._init_lock:
+            if self.collection:
+                return True
+            try:
+                if not await asyncio.to_thread(self._initialize_collection):
+                    return False
+                if self.collection.count() == 0:
+                    await self._seed_from_image_assets()
+                return True
+            except Exception as exc:
+                print("Warning: Generated image index unavailable:", exc)
+                self.collection = None
+                return False
+
+    async def _seed_from_image_assets(self):
+        async with async_session_maker() as sql_session:
+            image_assets = await sql_session.scalars(
+                select(ImageAsset).where(ImageAsset.is_uploaded == False)
+            )
+            image_assets = [
+                each
+                for each in image_assets
+                if each.extras
+                and each.extras.get("prompt")
+                and not each.extras.get("reused")
+            ]
+        for image_asset in image_assets:
+            await self._add(image_asset)
+
+    async def find(
+        self, prompt_text: str, exclude_paths: Collection[str] = ()
+    ) -> Optional[str]:
+        """
+        Returns the path of a previously generated image whose prompt is
+        similar enough to `prompt_text`, if any. Images in `exclude_paths`
+        (e.g. already used in the same presentation) are skipped.
+        """
+        if not self.is_enabled():
+            return None
+        if not await self._ensure_collection_initialized():
+            return None
+        try:
+            embeddings = await asyncio.to_thread(
+                self.embedding_function, [prompt_text]
+            )
+            result = await asyncio.to_thread(
+                self.collection.query,
+                query_embeddings=[list(embeddings[0])],
+                n_results=len(exclude_paths) + 1,
+            )
+        except Exception as exc:
+            print("Warning: Generated image lookup failed:", exc)
+            return None
+
+        distances = result.get("distances", [[]])[0]
+        metadatas = result.get("metadatas", [[]])[0]
+        for distance, metadata in zip(distances, metadatas):
+            # Cosine distance is 1 - cosine similarity
+            if 1 - distance < self.get_threshold():
+                return None
+            path = metadata.get("path")
+            if path and path not in exclude_paths and os.path.exists(path):
+                return path
+        return None
+
+    async def add(self, image_asset: ImageAsset):
+        if not self.is_enabled():
+            return
+        if not await self._ensure_collection_initialized():
+            return
+        await self._add(image_asset)
+
+    async def _add(self, image_asset: ImageAsset):
+        prompt_text = get_generated_image_prompt_text(image_asset.extras)
+        try:
+            embeddings = await asyncio.to_thread(
+                self.embedding_function, [prompt_text]
+            )
+            await asyncio.to_thread(
+                self.collection.upsert,
+                ids=[str(image_asset.id)],
+                embeddings=[list(embeddings[0])],
+                documents=[prompt_text],
+                metadatas=[{"path": image_asset.path}],
+            )
+        except Exception as exc:
+            print("Warning: Failed to index generated image:", exc)
+
+
+def get_generated_image_prompt_text(extras: dict) -> str:
+    prompt = extras.get("prompt") or ""
+    theme_prompt = extras.get("theme_prompt")
+    return f"{prompt}, {theme_prompt}" if theme_prompt else prompt
+
+
+GENERATED_IMAGE_INDEX = GeneratedImageIndex()
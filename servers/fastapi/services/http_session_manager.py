@@ -0,0 +1,86 @@
+import asyncio
+from typing import Dict, Tuple
+
+import aiohttp
+
+from constants.http import (
+    DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+)
+from utils.get_env import (
+    get_http_max_connections_per_host_env,
+    get_http_timeout_env,
+)
+from utils.parsers import parse_int_or_none
+
+
+class HttpSessionManager:
+    """
+    Application scoped aiohttp sessions for all outbound requests, so
+    connections (and DNS lookups) are reused instead of being set up for
+    every image, webhook or Next.js call. Sessions are created lazily for
+    the running event loop and closed on application shutdown, or when a
+    new loop replaces theirs. Callers must not close the returned session.
+    """
+
+    def __init__(self):
+        # One session per trust_env, external calls honour proxy settings
+        self._sessions: Dict[
+            bool, Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]
+        ] = {}
+
+    def get_timeout(self) -> aiohttp.ClientTimeout:
+        total = parse_int_or_none(get_http_timeout_env()) or DEFAULT_HTTP_TIMEOUT
+        return aiohttp.ClientTimeout(total=total, connect=HTTP_CONNECT_TIMEOUT)
+
+    def get_max_connections_per_host(self) -> int:
+        return (
+            parse_int_or_none(get_http_max_connections_per_host_env())
+            or DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST
+        )
+
+    def get_session(self, trust_env: bool = False) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session, session_loop = self._sessions.get(trust_env, (None, None))
+        if session is None or session.closed or session_loop is not loop:
+            if session is not None and not session.closed:
+                self._discard(session, session_loop)
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_MAX_CONNECTIONS,
+                    limit_per_host=self.get_max_connections_per_host(),
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ),
+                timeout=self.get_timeout(),
+                trust_env=trust_env,
+            )
+            self._sessions[trust_env] = (session, loop)
+        return session
+
+    def _discard(
+        self, session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop
+    ):
+        if loop.is_closed():
+            # Its connections went away with the loop, only mark it closed
+            session.detach()
+        else:
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def start(self):
+        self.get_session()
+        self.get_session(trust_env=True)
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session, _ in sessions:
+            if not session.closed:
+                await session.close()
+
+
+HTTP_SESSION_MANAGER = HttpSessionManager()
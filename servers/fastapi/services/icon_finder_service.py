@@ -1,11 +1,29 @@
 import asyncio
+from collections import OrderedDict
 import json
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 
+from constants.icons import (
+    DEFAULT_ICON_EMBEDDINGS_PATH,
+    DEFAULT_ICON_SEARCH_BACKEND,
+    ICON_SEARCH_BATCH_WINDOW,
+    ICON_SEARCH_CACHE_MAX_ENTRIES,
+)
+from services.numpy_icon_index import (
+    NumpyIconIndex,
+    get_icon_documents_fingerprint,
+)
+from utils.get_env import get_icon_embeddings_path_env, get_icon_search_backend_env
+
+
+def normalize_icon_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
 
 class IconFinderService:
     def __init__(self):
@@ -14,6 +32,12 @@ class IconFinderService:
         self.collection = None
         self.embedding_function: Optional[ONNXMiniLM_L6_V2] = None
         self._init_lock = asyncio.Lock()
+        # Results by (normalized query, k), least recently used first
+        self._cache: OrderedDict[Tuple[str, int], List[str]] = OrderedDict()
+        # Queries waiting for the next batched collection query
+        self._pending: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
 
     def _load_icon_seed(self) -> list[dict]:
         try:
@@ -51,7 +75,86 @@ class IconFinderService:
             print("Warning: Unable to download icon embeddings, continuing without them:", exc)
             return False
 
+    def get_client(self) -> Optional[chromadb.PersistentClient]:
+        return self.client if self._ensure_client() else None
+
+    def get_embedding_function(self) -> Optional[ONNXMiniLM_L6_V2]:
+        return self.embedding_function if self._ensure_embedding_function() else None
+
+    def _get_icon_documents(self) -> Tuple[List[str], List[str]]:
+        documents: List[str] = []
+        ids: List[str] = []
+        for each in self._load_icon_seed():
+            try:
+                if each["name"].split("-")[-1] != "bold":
+                    continue
+                doc_text = f"{each['name']} {each.get('tags', '')}"
+                documents.append(doc_text)
+                ids.append(each["name"])
+            except Exception:
+                continue
+        return ids, documents
+
+    def get_backend(self) -> str:
+        return (get_icon_search_backend_env() or DEFAULT_ICON_SEARCH_BACKEND).lower()
+
+    def get_embeddings_path(self) -> str:
+        return get_icon_embeddings_path_env() or DEFAULT_ICON_EMBEDDINGS_PATH
+
+    def _load_icon_embeddings(
+        self, documents: List[str]
+    ) -> Optional[NumpyIconIndex]:
+        try:
+            return NumpyIconIndex.load(
+                self.get_embeddings_path(),
+                self.embedding_function,
+                get_icon_documents_fingerprint(documents),
+            )
+        except Exception as exc:
+            print("Warning: Unable to load icon embeddings, rebuilding them:", exc)
+            return None
+
+    def build_icon_embeddings(self) -> Optional[NumpyIconIndex]:
+        """
+        Embeds the icon documents and saves them as the icon embeddings
+        artifact, loaded on later starts instead of re-embedding.
+        Run at image build time by build_icon_embeddings.py.
+        """
+        if not self._ensure_embedding_function():
+            return None
+        ids, documents = self._get_icon_documents()
+        if not documents:
+            return None
+
+        try:
+            index = NumpyIconIndex.build(ids, documents, self.embedding_function)
+        except Exception as exc:
+            print("Warning: Unable to embed icons, continuing without them:", exc)
+            return None
+        try:
+            index.save(
+                self.get_embeddings_path(), get_icon_documents_fingerprint(documents)
+            )
+        except Exception as exc:
+            print("Warning: Unable to save icon embeddings:", exc)
+        return index
+
+    def _initialize_numpy_index(self) -> bool:
+        if not self._ensure_embedding_function():
+            return False
+        _, documents = self._get_icon_documents()
+        if not documents:
+            return False
+
+        self.collection = (
+            self._load_icon_embeddings(documents) or self.build_icon_embeddings()
+        )
+        return bool(self.collection)
+
     def _initialize_icons_collection(self) -> bool:
+        if self.get_backend() == "numpy":
+            return self._initialize_numpy_index()
+
         if not self._ensure_client():
             return False
         if not self._ensure_embedding_function():
@@ -65,19 +168,7 @@ class IconFinderService:
         except Exception:
             pass
 
-        icons = self._load_icon_seed()
-        documents: List[str] = []
-        ids: List[str] = []
-        for each in icons:
-            try:
-                if each["name"].split("-")[-1] != "bold":
-                    continue
-                doc_text = f"{each['name']} {each.get('tags', '')}"
-                documents.append(doc_text)
-                ids.append(each["name"])
-            except Exception:
-                continue
-
+        ids, documents = self._get_icon_documents()
         if not documents:
             return False
 
@@ -87,7 +178,16 @@ class IconFinderService:
                 embedding_function=self.embedding_function,
                 metadata={"hnsw:space": "cosine"},
             )
-            self.collection.add(documents=documents, ids=ids)
+            # Seeded from the embeddings artifact when there is one
+            icon_embeddings = self._load_icon_embeddings(documents)
+            if icon_embeddings:
+                self.collection.add(
+                    documents=documents,
+                    ids=icon_embeddings.ids,
+                    embeddings=np.array(icon_embeddings.embeddings),
+                )
+            else:
+                self.collection.add(documents=documents, ids=ids)
             return True
         except Exception as exc:
             print("Warning: Unable to seed icons collection, continuing without it:", exc)
@@ -108,20 +208,97 @@ class IconFinderService:
                 print("Warning: Icons collection unavailable, continuing without it")
             return bool(initialized and self.collection)
 
-    async def search_icons(self, query: str, k: int = 1):
-        if not await self._ensure_collection_initialized():
-            return []
-        try:
-            result = await asyncio.to_thread(
-                self.collection.query,
-                query_texts=[query],
-                n_results=k,
+    def warm_up(self):
+        """
+        Initializes the icons collection in the background, so it is ready
+        before the first presentation needs icons.
+        """
+        if not self._warm_up_task:
+            self._warm_up_task = asyncio.create_task(
+                self._ensure_collection_initialized()
             )
-            ids = result.get("ids", [[]])[0]
-            return [f"/static/icons/bold/{each}.svg" for each in ids]
-        except Exception as exc:
-            print("Warning: Icon search failed, continuing without results:", exc)
+
+    async def search_icons(self, query: str, k: int = 1):
+        return (await self.search_icons_batch([query], k))[0]
+
+    async def search_icons_batch(self, queries: List[str], k: int = 1):
+        """
+        Returns icon urls for each query, in order. Queries from concurrent
+        callers (e.g. every slide of a deck) are collected for a short window
+        and resolved with a single collection query, so they are embedded in
+        one ONNX pass. Results are memoized by normalized query text.
+        """
+        if not queries:
             return []
+        if not await self._ensure_collection_initialized():
+            return [[] for _ in queries]
+
+        keys = [(normalize_icon_query(query), k) for query in queries]
+        results: Dict[Tuple[str, int], List[str] | asyncio.Future] = {}
+        for key in keys:
+            if key in results:
+                continue
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                results[key] = self._cache[key]
+            else:
+                results[key] = self._get_pending(key)
+
+        return [list(await self._get_result(results[key])) for key in keys]
+
+    async def _get_result(self, result):
+        if isinstance(result, asyncio.Future):
+            return await asyncio.shield(result)
+        return result
+
+    def _get_pending(self, key: Tuple[str, int]) -> asyncio.Future:
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+        if not self._flush_task or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        return future
+
+    async def _flush_pending(self):
+        # Queries that arrive while a batch is in flight go into the next one
+        while self._pending:
+            await asyncio.sleep(ICON_SEARCH_BATCH_WINDOW)
+            pending, self._pending = self._pending, {}
+            await self._query_pending(pending)
+
+    async def _query_pending(self, pending: Dict[Tuple[str, int], asyncio.Future]):
+        # n_results is per collection query, so queries are grouped by k
+        pending_by_k: Dict[int, Dict[str, asyncio.Future]] = {}
+        for (query, k), future in pending.items():
+            pending_by_k.setdefault(k, {})[query] = future
+
+        for k, futures in pending_by_k.items():
+            queries = list(futures.keys())
+            try:
+                result = await asyncio.to_thread(
+                    self.collection.query,
+                    query_texts=queries,
+                    n_results=k,
+                )
+                ids = result.get("ids") or []
+            except Exception as exc:
+                print("Warning: Icon search failed, continuing without results:", exc)
+                for future in futures.values():
+                    if not future.done():
+                        future.set_result([])
+                continue
+
+            for index, query in enumerate(queries):
+                each = ids[index] if index < len(ids) else []
+                urls = [f"/static/icons/bold/{icon}.svg" for icon in each]
+                self._cache[(query, k)] = urls
+                self._cache.move_to_end((query, k))
+                future = futures[query]
+                if not future.done():
+                    future.set_result(urls)
+            while len(self._cache) > ICON_SEARCH_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
 
 
 ICON_FINDER_SERVICE = IconFinderService()
@@ -0,0 +1,192 @@
+import asyncio
+from collections import Counter
+import heapq
+import itertools
+import random
+from typing import Awaitable, Callable, Dict, List, Tuple, TypeVar
+
+import aiohttp
+import httpx
+import openai
+
+from constants.presentation import (
+    DEFAULT_IMAGE_GENERATION_CONCURRENCY,
+    DEFAULT_IMAGE_GENERATION_MAX_RETRIES,
+    IMAGE_GENERATION_RETRY_BASE_DELAY,
+    IMAGE_GENERATION_RETRY_MAX_DELAY,
+)
+from models.image_generation_stats import (
+    ImageGenerationProviderStats,
+    ImageGenerationStats,
+)
+from services.llm_rate_limiter import get_retry_after, get_status_code
+from utils.get_env import (
+    get_image_generation_concurrency_env,
+    get_image_generation_max_retries_env,
+)
+from utils.parsers import parse_int_or_none
+
+T = TypeVar("T")
+
+NETWORK_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    aiohttp.ClientConnectionError,
+    httpx.TransportError,
+    openai.APIConnectionError,
+)
+
+
+def is_transient_error(e: Exception) -> bool:
+    # Rate limits, server errors and network failures may pass on retry,
+    # other errors (bad request, invalid API key) will not
+    status_code = get_status_code(e)
+    if status_code is None and isinstance(e, aiohttp.ClientResponseError):
+        status_code = e.status
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+    return isinstance(e, NETWORK_ERRORS)
+
+
+class PrioritySemaphore:
+    """
+    Semaphore that wakes waiters by priority (lowest first), then in
+    arrival order.
+    """
+
+    def __init__(self, value: int):
+        self.value = value
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int):
+        if self.value > 0 and not self.queued:
+            self.value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot was handed over just before cancellation, pass it on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.value += 1
+
+
+class ImageProviderState:
+    def __init__(self, provider: str, max_concurrency: int):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.semaphore = PrioritySemaphore(max_concurrency)
+        self.in_flight = 0
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.placeholder_reasons: Counter = Counter()
+
+
+class ImageGenerationScheduler:
+    """
+    Runs image provider calls with a per-provider concurrency cap
+    (IMAGE_GENERATION_CONCURRENCY), retries transient failures with jittered
+    backoff and serves queued calls by priority, so images of the first
+    slides are fetched before the rest of the deck. Also counts images that
+    degraded to the placeholder.
+    """
+
+    def __init__(self):
+        self._states: Dict[str, ImageProviderState] = {}
+
+    def get_max_concurrency(self, provider: str) -> int:
+        return parse_int_or_none(
+            get_image_generation_concurrency_env()
+        ) or DEFAULT_IMAGE_GENERATION_CONCURRENCY.get(provider, 4)
+
+    def get_max_retries(self) -> int:
+        max_retries = parse_int_or_none(get_image_generation_max_retries_env())
+        if max_retries is None:
+            return DEFAULT_IMAGE_GENERATION_MAX_RETRIES
+        return max_retries
+
+    def get_state(self, provider: str) -> ImageProviderState:
+        state = self._states.get(provider)
+        if not state:
+            state = ImageProviderState(provider, self.get_max_concurrency(provider))
+            self._states[provider] = state
+        return state
+
+    async def run(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        priority: int = 0,
+    ) -> T:
+        state = self.get_state(provider)
+        max_retries = self.get_max_retries()
+
+        for attempt in range(max_retries + 1):
+            await state.semaphore.acquire(priority)
+            state.in_flight += 1
+            state.requests += 1
+            try:
+                return await call()
+            except Exception as e:
+                if attempt >= max_retries or not is_transient_error(e):
+                    state.failures += 1
+                    raise
+                delay = min(
+                    IMAGE_GENERATION_RETRY_MAX_DELAY,
+                    IMAGE_GENERATION_RETRY_BASE_DELAY * 2**attempt,
+                ) * random.uniform(0.5, 1.0)
+                # Retrying before the provider's Retry-After only gets another 429
+                retry_after = get_retry_after(e)
+                if retry_after is not None:
+                    delay = max(retry_after, delay)
+                print(
+                    f"Image generation with {provider} failed ({e}), "
+                    f"retrying in {delay:.1f}s"
+                )
+            finally:
+                state.in_flight -= 1
+                state.semaphore.release()
+
+            state.retries += 1
+            await asyncio.sleep(delay)
+
+    def record_placeholder(self, provider: str, reason: str):
+        self.get_state(provider).placeholder_reasons[reason] += 1
+
+    def get_stats(self) -> ImageGenerationStats:
+        return ImageGenerationStats(
+            providers=[
+                ImageGenerationProviderStats(
+                    provider=state.provider,
+                    max_concurrency=state.max_concurrency,
+                    in_flight=state.in_flight,
+                    queued=state.semaphore.queued,
+                    requests=state.requests,
+                    retries=state.retries,
+                    failures=state.failures,
+                    placeholders=sum(state.placeholder_reasons.values()),
+                    placeholder_reasons=dict(state.placeholder_reasons),
+                )
+                for state in self._states.values()
+            ]
+        )
+
+
+IMAGE_GENERATION_SCHEDULER = ImageGenerationScheduler()
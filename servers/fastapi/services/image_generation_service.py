@@ -1,12 +1,33 @@
 import asyncio
 import os
-import aiohttp
+import shutil
+from typing import List, Optional, Set
+import uuid
 from google import genai
 from google.genai.types import GenerateContentConfig
 from openai import AsyncOpenAI
+from constants.presentation import (
+    PLACEHOLDER_IMAGE_PATH,
+    STOCK_IMAGE_RESULTS_PER_QUERY,
+)
 from models.image_prompt import ImagePrompt
 from models.sql.image_asset import ImageAsset
+from services.generated_image_index import (
+    GENERATED_IMAGE_INDEX,
+    get_generated_image_prompt_text,
+)
+from services.http_session_manager import HTTP_SESSION_MANAGER
+from services.image_generation_scheduler import IMAGE_GENERATION_SCHEDULER
+from services.image_search_cache import IMAGE_SEARCH_CACHE
 from utils.download_helpers import download_file
+from enums.llm_provider import LLMProvider
+from services.llm_client import LLM_CLIENT_REGISTRY
+from utils.get_env import (
+    get_generated_image_format_env,
+    get_generated_image_max_size_env,
+    get_google_api_key_env,
+    get_reuse_generated_images_env,
+)
 from utils.get_env import get_pexels_api_key_env
 from utils.get_env import get_pixabay_api_key_env
 from utils.image_provider import (
@@ -14,15 +35,28 @@ from utils.image_provider import (
     is_pixabay_selected,
     is_gemini_flash_selected,
     is_dalle3_selected,
+    get_selected_image_provider,
 )
-import uuid
+from utils.image_utils import save_image_bytes
+from utils.parsers import parse_bool_or_none, parse_int_or_none
 
 
 class ImageGenerationService:
 
-    def __init__(self, output_directory: str):
+    def __init__(
+        self, output_directory: str, reuse_generated_images: Optional[bool] = None
+    ):
         self.output_directory = output_directory
+        # Opt-in, defaults to REUSE_GENERATED_IMAGES
+        if reuse_generated_images is None:
+            reuse_generated_images = bool(
+                parse_bool_or_none(get_reuse_generated_images_env())
+            )
+        self.reuse_generated_images = reuse_generated_images
         self.image_gen_func = self.get_image_gen_func()
+        self.used_image_urls: Set[str] = set()
+        # Generated images used by this presentation, never reused in it again
+        self.used_generated_images: Set[str] = set()
 
     def get_image_gen_func(self):
         if is_pixabay_selected():
@@ -38,47 +72,91 @@ class ImageGenerationService:
     def is_stock_provider_selected(self):
         return is_pixels_selected() or is_pixabay_selected()
 
-    async def generate_image(self, prompt: ImagePrompt) -> str | ImageAsset:
+    def get_provider_name(self) -> str:
+        image_provider = get_selected_image_provider()
+        return image_provider.value if image_provider else "none"
+
+    async def generate_image(
+        self, prompt: ImagePrompt, priority: int = 0
+    ) -> str | ImageAsset:
         """
         Generates an image based on the provided prompt.
         - If no image generation function is available, returns a placeholder image.
         - If the stock provider is selected, it uses the prompt directly,
         otherwise it uses the full image prompt with theme.
         - Output Directory is used for saving the generated image not the stock provider.
+        - Provider calls are scheduled by priority, lower values first.
         """
+        provider = self.get_provider_name()
         if not self.image_gen_func:
             print("No image generation function found. Using placeholder image.")
-            return "/static/images/placeholder.jpg"
+            IMAGE_GENERATION_SCHEDULER.record_placeholder(provider, "no_provider")
+            return PLACEHOLDER_IMAGE_PATH
 
         image_prompt = prompt.get_image_prompt(
             with_theme=not self.is_stock_provider_selected()
         )
         print(f"Request - Generating Image for {image_prompt}")
 
+        extras = {
+            "prompt": prompt.prompt,
+            "theme_prompt": prompt.theme_prompt,
+        }
+
         try:
+            reused_image_path = None
             if self.is_stock_provider_selected():
-                image_path = await self.image_gen_func(image_prompt)
+                image_path = await IMAGE_GENERATION_SCHEDULER.run(
+                    provider, lambda: self.image_gen_func(image_prompt), priority
+                )
             else:
-                image_path = await self.image_gen_func(
-                    image_prompt, self.output_directory
+                # Similar prompts reuse an image generated earlier
+                if self.reuse_generated_images:
+                    reused_image_path = await GENERATED_IMAGE_INDEX.find(
+                        get_generated_image_prompt_text(extras),
+                        self.used_generated_images,
+                    )
+                    # Slides look up concurrently, the first one takes the image
+                    if reused_image_path in self.used_generated_images:
+                        reused_image_path = None
+                    elif reused_image_path:
+                        self.used_generated_images.add(reused_image_path)
+                image_path = reused_image_path or await IMAGE_GENERATION_SCHEDULER.run(
+                    provider,
+                    lambda: self.image_gen_func(image_prompt, self.output_directory),
+                    priority,
                 )
             if image_path:
                 if image_path.startswith("http"):
                     return image_path
                 elif os.path.exists(image_path):
-                    return ImageAsset(
+                    if reused_image_path:
+                        print(f"Reusing generated image {reused_image_path}")
+                        return ImageAsset(
+                            path=await self.copy_generated_image(image_path),
+                            is_uploaded=False,
+                            extras={
+                                **extras,
+                                "reused": True,
+                                "reused_from": reused_image_path,
+                            },
+                        )
+                    self.used_generated_images.add(image_path)
+                    image_asset = ImageAsset(
                         path=image_path,
                         is_uploaded=False,
-                        extras={
-                            "prompt": prompt.prompt,
-                            "theme_prompt": prompt.theme_prompt,
-                        },
+                        extras=extras,
                     )
-            raise Exception(f"Image not found at {image_path}")
+                    await GENERATED_IMAGE_INDEX.add(image_asset)
+                    return image_asset
+            IMAGE_GENERATION_SCHEDULER.record_placeholder(provider, "not_found")
+            print(f"Image not found at {image_path}. Using placeholder image.")
+            return PLACEHOLDER_IMAGE_PATH
 
         except Exception as e:
             print(f"Error generating image: {e}")
-            return "/static/images/placeholder.jpg"
+            IMAGE_GENERATION_SCHEDULER.record_placeholder(provider, "error")
+            return PLACEHOLDER_IMAGE_PATH
 
     async def generate_image_openai(self, prompt: str, output_directory: str) -> str:
         client = AsyncOpenAI()
@@ -92,40 +170,105 @@ class ImageGenerationService:
         image_url = result.data[0].url
         return await download_file(image_url, output_directory)
 
-    async def generate_image_google(self, prompt: str, output_directory: str) -> str:
-        client = genai.Client()
-        response = await asyncio.to_thread(
-            client.models.generate_content,
+    def get_google_client(self) -> genai.Client:
+        api_key = get_google_api_key_env()
+        if not api_key:
+            raise Exception("Google API Key is not set")
+        # Shared with the LLM client, so its connection pool is reused
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.GOOGLE,
+            None,
+            api_key,
+            lambda: genai.Client(api_key=api_key),
+        )
+
+    async def generate_image_google(
+        self, prompt: str, output_directory: str
+    ) -> Optional[str]:
+        client = self.get_google_client()
+        response = await client.aio.models.generate_content(
             model="gemini-2.5-flash-image-preview",
             contents=[prompt],
             config=GenerateContentConfig(response_modalities=["TEXT", "IMAGE"]),
         )
 
+        image_path = None
         for part in response.candidates[0].content.parts:
             if part.text is not None:
                 print(part.text)
             elif part.inline_data is not None:
-                image_path = os.path.join(output_directory, f"{uuid.uuid4()}.jpg")
-                with open(image_path, "wb") as f:
-                    f.write(part.inline_data.data)
+                image_path = await self.save_generated_image(
+                    part.inline_data.data,
+                    output_directory,
+                    part.inline_data.mime_type,
+                )
 
         return image_path
 
+    async def save_generated_image(
+        self, data: bytes, output_directory: str, mime_type: Optional[str]
+    ) -> str:
+        image_format = get_generated_image_format_env()
+        max_size = parse_int_or_none(get_generated_image_max_size_env())
+        if not (image_format or max_size):
+            return save_image_bytes(data, output_directory, mime_type)
+
+        # Decoding and resizing is CPU bound, keep it off the event loop
+        return await asyncio.to_thread(
+            save_image_bytes,
+            data,
+            output_directory,
+            mime_type,
+            image_format,
+            max_size,
+        )
+
+    async def copy_generated_image(self, image_path: str) -> str:
+        # A copy, so deleting the source presentation keeps this one intact
+        copy_path = os.path.join(
+            self.output_directory,
+            f"{uuid.uuid4()}{os.path.splitext(image_path)[1]}",
+        )
+        await asyncio.to_thread(shutil.copyfile, image_path, copy_path)
+        return copy_path
+
+    def pick_unused_image(self, image_urls: List[str]) -> Optional[str]:
+        if not image_urls:
+            return None
+        # Slides of the same presentation get different hits for similar prompts
+        for image_url in image_urls:
+            if image_url not in self.used_image_urls:
+                self.used_image_urls.add(image_url)
+                return image_url
+        return image_urls[0]
+
     async def get_image_from_pexels(self, prompt: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://api.pexels.com/v1/search?query={prompt}&per_page=1",
-                headers={"Authorization": f"{get_pexels_api_key_env()}"},
-            )
-            data = await response.json()
-            image_url = data["photos"][0]["src"]["large"]
-            return image_url
+        image_urls = await IMAGE_SEARCH_CACHE.get_results(
+            "pexels", prompt, lambda: self.search_pexels(prompt)
+        )
+        return self.pick_unused_image(image_urls)
 
     async def get_image_from_pixabay(self, prompt: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={prompt}&image_type=photo&per_page=3"
-            )
+        image_urls = await IMAGE_SEARCH_CACHE.get_results(
+            "pixabay", prompt, lambda: self.search_pixabay(prompt)
+        )
+        return self.pick_unused_image(image_urls)
+
+    async def search_pexels(self, prompt: str) -> List[str]:
+        session = HTTP_SESSION_MANAGER.get_session(trust_env=True)
+        async with session.get(
+            f"https://api.pexels.com/v1/search?query={prompt}&per_page={STOCK_IMAGE_RESULTS_PER_QUERY}",
+            headers={"Authorization": f"{get_pexels_api_key_env()}"},
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return [photo["src"]["large"] for photo in data["photos"]]
+
+    async def search_pixabay(self, prompt: str) -> List[str]:
+        session = HTTP_SESSION_MANAGER.get_session(trust_env=True)
+        async with session.get(
+            f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={prompt}&image_type=photo&per_page={STOCK_IMAGE_RESULTS_PER_QUERY}"
+        ) as response:
+            response.raise_for_status()
             data = await response.json()
-            image_url = data["hits"][0]["largeImageURL"]
-            return image_url
+        return [hit["largeImageURL"] for hit in data["hits"]]
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta
+import re
+from typing import Awaitable, Callable, Dict, List
+
+from constants.presentation import DEFAULT_IMAGE_SEARCH_CACHE_TTL
+from models.sql.image_search_result import ImageSearchResultModel
+from services.database import async_session_maker
+from utils.get_env import get_image_search_cache_ttl_env
+from utils.parsers import parse_int_or_none
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class ImageSearchCache:
+    """
+    Persistent cache of stock image search results (Pexels, Pixabay) keyed
+    by provider and normalized query. Identical searches running at the same
+    time share one request to the provider. Lookup or storage failures fall
+    back to searching the provider directly.
+    """
+
+    def __init__(self):
+        self._searches: Dict[str, asyncio.Task] = {}
+
+    def get_ttl(self) -> int:
+        ttl = parse_int_or_none(get_image_search_cache_ttl_env())
+        return DEFAULT_IMAGE_SEARCH_CACHE_TTL if ttl is None else ttl
+
+    def get_key(self, provider: str, query: str) -> str:
+        normalized_query = WHITESPACE_PATTERN.sub(" ", query).strip().lower()
+        return f"{provider}:{normalized_query}"
+
+    async def get_results(
+        self,
+        provider: str,
+        query: str,
+        search: Callable[[], Awaitable[List[str]]],
+    ) -> List[str]:
+        key = self.get_key(provider, query)
+
+        task = self._searches.get(key)
+        if not task or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(
+                self._get_results(key, provider, query, search)
+            )
+            self._searches[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self._searches.get(key) is task:
+                self._searches.pop(key)
+
+    async def _get_results(
+        self,
+        key: str,
+        provider: str,
+        query: str,
+        search: Callable[[], Awaitable[List[str]]],
+    ) -> List[str]:
+        try:
+            async with async_session_maker() as sql_session:
+                cached = await sql_session.get(ImageSearchResultModel, key)
+                if cached and cached.results and (
+                    datetime.now() - cached.created_at
+                    < timedelta(seconds=self.get_ttl())
+                ):
+                    return cached.results
+        except Exception as e:
+            print(f"Warning: Failed to read image search cache: {e}")
+
+        results = await search()
+
+        if results:
+            try:
+                async with async_session_maker() as sql_session:
+                    await sql_session.merge(
+                        ImageSearchResultModel(
+                            id=key, provider=provider, query=query, results=results
+                        )
+                    )
+                    await sql_session.commit()
+            except Exception as e:
+                print(f"Warning: Failed to store image search results: {e}")
+
+        return results
+
+
+IMAGE_SEARCH_CACHE = ImageSearchCache()
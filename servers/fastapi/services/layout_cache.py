@@ -0,0 +1,162 @@
+import asyncio
+from dataclasses import dataclass
+import time
+from typing import Dict, Optional
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from constants.presentation import DEFAULT_LAYOUT_CACHE_TTL
+from models.layout_cache_stats import LayoutCacheStats
+from models.presentation_layout import PresentationLayoutModel
+from models.sql.presentation_layout_code import PresentationLayoutCodeModel
+from services.database import async_session_maker
+from services.http_session_manager import HTTP_SESSION_MANAGER
+from utils.get_env import get_layout_cache_ttl_env
+from utils.llm_calls.generate_slide_content import get_response_schema
+from utils.parsers import parse_int_or_none
+
+
+@dataclass
+class LayoutCacheEntry:
+    layout: PresentationLayoutModel
+    etag: Optional[str]
+    fetched_at: float
+    source_version: Optional[str] = None
+
+
+class LayoutCache:
+    """
+    In-process cache of template layouts fetched from the Next.js server.
+    Entries are revalidated with their ETag once LAYOUT_CACHE_TTL expires
+    and invalidated when templates are saved or deleted. Custom templates can
+    be edited through any process, so their entries are also refetched when
+    the layout codes in the database change. Cached layouts are shared
+    between requests and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, LayoutCacheEntry] = {}
+        self._fetches: Dict[str, asyncio.Task] = {}
+        self._versions: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._invalidations = 0
+
+    def get_ttl(self) -> int:
+        ttl = parse_int_or_none(get_layout_cache_ttl_env())
+        return DEFAULT_LAYOUT_CACHE_TTL if ttl is None else ttl
+
+    async def get(self, layout_name: str) -> PresentationLayoutModel:
+        entry = self._entries.get(layout_name)
+        source_version = await self._get_source_version(layout_name)
+        if (
+            entry
+            and entry.source_version == source_version
+            and time.monotonic() - entry.fetched_at < self.get_ttl()
+        ):
+            self._hits += 1
+            return entry.layout
+
+        # Concurrent requests for the same layout share a single fetch
+        fetch = self._fetches.get(layout_name)
+        if not fetch or fetch.get_loop() is not asyncio.get_running_loop():
+            fetch = asyncio.create_task(
+                self._fetch(layout_name, entry, source_version)
+            )
+            self._fetches[layout_name] = fetch
+        try:
+            return await asyncio.shield(fetch)
+        finally:
+            if fetch.done() and self._fetches.get(layout_name) is fetch:
+                self._fetches.pop(layout_name)
+
+    def invalidate(self, layout_name: str):
+        self._versions[layout_name] = self._versions.get(layout_name, 0) + 1
+        self._fetches.pop(layout_name, None)
+        if self._entries.pop(layout_name, None):
+            self._invalidations += 1
+
+    def clear(self):
+        for layout_name in list(self._entries):
+            self.invalidate(layout_name)
+
+    def get_stats(self) -> LayoutCacheStats:
+        return LayoutCacheStats(
+            ttl=self.get_ttl(),
+            layouts=list(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            revalidations=self._revalidations,
+            invalidations=self._invalidations,
+        )
+
+    async def _get_source_version(self, layout_name: str) -> Optional[str]:
+        # Layout codes of a custom template, changed when it is saved anywhere
+        if not layout_name.startswith("custom-"):
+            return None
+        try:
+            presentation = uuid.UUID(layout_name.removeprefix("custom-"))
+        except ValueError:
+            return None
+        try:
+            async with async_session_maker() as sql_session:
+                result = await sql_session.execute(
+                    select(
+                        func.count(), func.max(PresentationLayoutCodeModel.updated_at)
+                    ).where(PresentationLayoutCodeModel.presentation == presentation)
+                )
+                count, updated_at = result.one()
+        except Exception as e:
+            print(f"Warning: Failed to read layout codes of {layout_name}: {e}")
+            return None
+        return f"{count}:{updated_at}"
+
+    async def _fetch(
+        self,
+        layout_name: str,
+        entry: Optional[LayoutCacheEntry],
+        source_version: Optional[str] = None,
+    ) -> PresentationLayoutModel:
+        version = self._versions.get(layout_name, 0)
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else {}
+
+        url = f"http://localhost/api/template?group={layout_name}"
+        session = HTTP_SESSION_MANAGER.get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and entry:
+                self._revalidations += 1
+                entry.fetched_at = time.monotonic()
+                entry.source_version = source_version
+                return entry.layout
+            if response.status != 200:
+                error_text = await response.text()
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Template '{layout_name}' not found: {error_text}",
+                )
+            layout_json = await response.json()
+            etag = response.headers.get("ETag")
+
+        self._misses += 1
+        layout = PresentationLayoutModel(**layout_json)
+
+        # Prompt text and response schemas are compiled once per fetched layout
+        layout.to_string()
+        for slide_layout in layout.slides:
+            get_response_schema(slide_layout)
+
+        # Templates saved while fetching must not be overwritten by stale data
+        if self._versions.get(layout_name, 0) == version:
+            self._entries[layout_name] = LayoutCacheEntry(
+                layout=layout,
+                etag=etag,
+                fetched_at=time.monotonic(),
+                source_version=source_version,
+            )
+        return layout
+
+
+LAYOUT_CACHE = LayoutCache()
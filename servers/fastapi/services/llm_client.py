@@ -1,7 +1,10 @@
 import asyncio
+from datetime import datetime
+import inspect
+import threading
 import dirtyjson
 import json
-from typing import AsyncGenerator, List, Optional
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
 from fastapi import HTTPException
 from openai import AsyncOpenAI
 from openai.types.chat.chat_completion_chunk import (
@@ -20,6 +23,7 @@ from google.genai.types import Tool as GoogleTool
 from anthropic import AsyncAnthropic
 from anthropic.types import Message as AnthropicMessage
 from anthropic import MessageStreamEvent as AnthropicMessageStreamEvent
+from constants.llm import LLM_BATCH_POLL_INTERVAL
 from enums.llm_provider import LLMProvider
 from models.llm_message import (
     AnthropicAssistantMessage,
@@ -38,7 +42,15 @@ from models.llm_tool_call import (
     OpenAIToolCall,
     OpenAIToolCallFunction,
 )
+from models.llm_client_pool_stats import LLMClientPoolEntry, LLMClientPoolStats
 from models.llm_tools import LLMDynamicTool, LLMTool
+from services.llm_rate_limiter import (
+    LLM_RATE_LIMITER,
+    estimate_tokens,
+    record_llm_usage,
+)
+from services.llm_response_cache import LLM_RESPONSE_CACHE
+from services.schema_compile_cache import SCHEMA_COMPILE_CACHE
 from services.llm_tool_calls_handler import LLMToolCallsHandler
 from utils.async_iterator import iterator_to_async
 from utils.dummy_functions import do_nothing_async
@@ -62,6 +74,115 @@ from utils.schema_utils import (
 )
 
 
+class LLMClientRegistry:
+    """
+    Process wide registry of provider SDK clients.
+    Clients are keyed by provider, base url and api key, so their keep-alive
+    connection pools are shared by every LLMClient. A client is only rebuilt
+    when the key or url for its provider changes, or when it was created on
+    a different event loop. Evicted clients are closed on their own loop.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, Optional[str], str], Any] = {}
+        self._entries: Dict[Tuple[str, Optional[str], str], dict] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._closing: set[asyncio.Task] = set()
+
+    def get_client(
+        self,
+        provider: LLMProvider,
+        base_url: Optional[str],
+        api_key: str,
+        factory: Callable[[], Any],
+    ):
+        key = (provider.value, base_url, api_key)
+        loop = self._get_running_loop()
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None and self._entries[key]["loop"] is loop:
+                self._hits += 1
+                self._entries[key]["uses"] += 1
+                return client
+
+            # Keys or urls changed (or the loop did), older clients are stale
+            for each in list(self._clients.keys()):
+                if each[0] == provider.value:
+                    self._evict(each)
+
+            self._misses += 1
+            client = factory()
+            self._clients[key] = client
+            self._entries[key] = {
+                "loop": loop,
+                "created_at": datetime.now(),
+                "uses": 1,
+            }
+            return client
+
+    def get_stats(self) -> LLMClientPoolStats:
+        with self._lock:
+            return LLMClientPoolStats(
+                clients=[
+                    LLMClientPoolEntry(
+                        provider=key[0],
+                        base_url=key[1],
+                        created_at=entry["created_at"],
+                        uses=entry["uses"],
+                    )
+                    for key, entry in self._entries.items()
+                ],
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def _evict(self, key: Tuple[str, Optional[str], str]):
+        client = self._clients.pop(key)
+        entry = self._entries.pop(key)
+        self._evictions += 1
+        self._close(client, entry["loop"])
+
+    def _close(self, client: Any, loop: Optional[asyncio.AbstractEventLoop]):
+        close = getattr(client, "close", None)
+        if close is None:
+            return
+        if not inspect.iscoroutinefunction(close):
+            close()
+            return
+
+        running_loop = self._get_running_loop()
+        loop = loop or running_loop
+        if loop is None or loop.is_closed():
+            # Its connections went away with the loop
+            return
+        if loop is running_loop:
+            task = loop.create_task(self._close_async(close))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        else:
+            # Runs once the loop the client belongs to runs again
+            asyncio.run_coroutine_threadsafe(self._close_async(close), loop)
+
+    async def _close_async(self, close: Callable[[], Any]):
+        try:
+            await close()
+        except Exception as e:
+            print(f"Failed to close evicted LLM client: {e}")
+
+    def _get_running_loop(self):
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+
+LLM_CLIENT_REGISTRY = LLMClientRegistry()
+
+
 class LLMClient:
     def __init__(self):
         self.llm_provider = get_llm_provider()
@@ -87,6 +208,13 @@ class LLMClient:
     def disable_thinking(self) -> bool:
         return parse_bool_or_none(get_disable_thinking_env()) or False
 
+    # ? Usage
+    def _get_openai_stream_options(self) -> Optional[dict]:
+        # Compatible servers may reject stream options, only OpenAI is asked
+        if self.llm_provider != LLMProvider.OPENAI:
+            return None
+        return {"include_usage": True}
+
     # ? Clients
     def _get_client(self):
         match self.llm_provider:
@@ -107,44 +235,69 @@ class LLMClient:
                 )
 
     def _get_openai_client(self):
-        if not get_openai_api_key_env():
+        api_key = get_openai_api_key_env()
+        if not api_key:
             raise HTTPException(
                 status_code=400,
                 detail="OpenAI API Key is not set",
             )
-        return AsyncOpenAI()
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.OPENAI,
+            None,
+            api_key,
+            lambda: AsyncOpenAI(api_key=api_key),
+        )
 
     def _get_google_client(self):
-        if not get_google_api_key_env():
+        api_key = get_google_api_key_env()
+        if not api_key:
             raise HTTPException(
                 status_code=400,
                 detail="Google API Key is not set",
             )
-        return genai.Client()
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.GOOGLE,
+            None,
+            api_key,
+            lambda: genai.Client(api_key=api_key),
+        )
 
     def _get_anthropic_client(self):
-        if not get_anthropic_api_key_env():
+        api_key = get_anthropic_api_key_env()
+        if not api_key:
             raise HTTPException(
                 status_code=400,
                 detail="Anthropic API Key is not set",
             )
-        return AsyncAnthropic()
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.ANTHROPIC,
+            None,
+            api_key,
+            lambda: AsyncAnthropic(api_key=api_key),
+        )
 
     def _get_ollama_client(self):
-        return AsyncOpenAI(
-            base_url=(get_ollama_url_env() or "http://localhost:11434") + "/v1",
-            api_key="ollama",
+        base_url = (get_ollama_url_env() or "http://localhost:11434") + "/v1"
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.OLLAMA,
+            base_url,
+            "ollama",
+            lambda: AsyncOpenAI(base_url=base_url, api_key="ollama"),
         )
 
     def _get_custom_client(self):
-        if not get_custom_llm_url_env():
+        base_url = get_custom_llm_url_env()
+        if not base_url:
             raise HTTPException(
                 status_code=400,
                 detail="Custom LLM URL is not set",
             )
-        return AsyncOpenAI(
-            base_url=get_custom_llm_url_env(),
-            api_key=get_custom_llm_api_key_env() or "null",
+        api_key = get_custom_llm_api_key_env() or "null"
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.CUSTOM,
+            base_url,
+            api_key,
+            lambda: AsyncOpenAI(base_url=base_url, api_key=api_key),
         )
 
     # ? Prompts
@@ -204,6 +357,7 @@ class LLMClient:
             tools=tools,
             extra_body=extra_body,
         )
+        record_llm_usage(response.usage.total_tokens if response.usage else None)
         tool_calls = response.choices[0].message.tool_calls
         if tool_calls:
             parsed_tool_calls = [
@@ -267,6 +421,11 @@ class LLMClient:
             ),
         )
 
+        record_llm_usage(
+            response.usage_metadata.total_token_count
+            if response.usage_metadata
+            else None
+        )
         content = response.candidates[0].content
         response_parts = content.parts
 
@@ -329,6 +488,7 @@ class LLMClient:
             tools=tools,
             max_tokens=max_tokens or 4000,
         )
+        record_llm_usage(response.usage.input_tokens + response.usage.output_tokens)
         text_content = None
         tool_calls: List[AnthropicToolCall] = []
         for content in response.content:
@@ -406,6 +566,26 @@ class LLMClient:
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
+        content = await LLM_RATE_LIMITER.run(
+            self.llm_provider.value,
+            model,
+            lambda: self._generate(model, messages, max_tokens, parsed_tools),
+            estimate_tokens(messages, max_tokens),
+        )
+        if content is None:
+            raise HTTPException(
+                status_code=400,
+                detail="LLM did not return any content",
+            )
+        return content
+
+    async def _generate(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int],
+        parsed_tools: Optional[List[dict]],
+    ) -> str | None:
         content = None
         match self.llm_provider:
             case LLMProvider.OPENAI:
@@ -437,11 +617,6 @@ class LLMClient:
                 content = await self._generate_custom(
                     model=model, messages=messages, max_tokens=max_tokens
                 )
-        if content is None:
-            raise HTTPException(
-                status_code=400,
-                detail="LLM did not return any content",
-            )
         return content
 
     # ? Generate Structured Content
@@ -464,11 +639,7 @@ class LLMClient:
             self.use_tool_calls_for_structured_output()
         )
         if strict and depth == 0:
-            response_schema = ensure_strict_json_schema(
-                response_schema,
-                path=(),
-                root=response_schema,
-            )
+            response_schema = self._get_strict_response_schema(response_schema)
         if use_tool_calls_for_structured_output and depth == 0:
             if all_tools is None:
                 all_tools = []
@@ -505,6 +676,7 @@ class LLMClient:
             tools=all_tools,
             extra_body=extra_body,
         )
+        record_llm_usage(response.usage.total_tokens if response.usage else None)
 
         content = response.choices[0].message.content
 
@@ -579,8 +751,8 @@ class LLMClient:
                         {
                             "name": "ResponseSchema",
                             "description": "Provide response to the user",
-                            "parameters": remove_titles_from_schema(
-                                flatten_json_schema(response_format)
+                            "parameters": self._get_google_tool_schema(
+                                response_format
                             ),
                         }
                     ]
@@ -609,6 +781,11 @@ class LLMClient:
             ),
         )
 
+        record_llm_usage(
+            response.usage_metadata.total_token_count
+            if response.usage_metadata
+            else None
+        )
         content = response.candidates[0].content
         response_parts = content.parts
         text_content = None
@@ -686,6 +863,7 @@ class LLMClient:
                 *(tools or []),
             ],
         )
+        record_llm_usage(response.usage.input_tokens + response.usage.output_tokens)
         tool_calls: List[AnthropicToolCall] = []
         for content in response.content:
             if content.type == "tool_use":
@@ -777,6 +955,40 @@ class LLMClient:
     ) -> dict:
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
+        cache_key = self._get_response_cache_key(
+            model, messages, response_format, strict, parsed_tools
+        )
+        if cache_key:
+            cached_content = await LLM_RESPONSE_CACHE.get(cache_key)
+            if cached_content is not None:
+                return cached_content
+
+        content = await LLM_RATE_LIMITER.run(
+            self.llm_provider.value,
+            model,
+            lambda: self._generate_structured(
+                model, messages, response_format, strict, parsed_tools, max_tokens
+            ),
+            estimate_tokens(messages, max_tokens),
+        )
+        if content is None:
+            raise HTTPException(
+                status_code=400,
+                detail="LLM did not return any content",
+            )
+        if cache_key:
+            await self._store_cached_response(cache_key, content)
+        return content
+
+    async def _generate_structured(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: dict,
+        strict: bool,
+        parsed_tools: Optional[List[dict]],
+        max_tokens: Optional[int],
+    ) -> dict | None:
         content = None
         match self.llm_provider:
             case LLMProvider.OPENAI:
@@ -820,11 +1032,6 @@ class LLMClient:
                     strict=strict,
                     max_tokens=max_tokens,
                 )
-        if content is None:
-            raise HTTPException(
-                status_code=400,
-                detail="LLM did not return any content",
-            )
         return content
 
     # ? Stream Unstructured Content
@@ -851,8 +1058,11 @@ class LLMClient:
             tools=tools,
             extra_body=extra_body,
             stream=True,
+            stream_options=self._get_openai_stream_options(),
         ):
             event: OpenAIChatCompletionChunk = event
+            if event.usage:
+                record_llm_usage(event.usage.total_tokens)
             if not event.choices:
                 continue
 
@@ -940,6 +1150,7 @@ class LLMClient:
             google_tools = [GoogleTool(function_declarations=[tool]) for tool in tools]
 
         generated_contents = []
+        usage_metadata = None
         tool_calls: List[GoogleToolCall] = []
         async for event in iterator_to_async(client.models.generate_content_stream)(
             model=model,
@@ -951,6 +1162,8 @@ class LLMClient:
                 max_output_tokens=max_tokens,
             ),
         ):
+            # Usage of streamed responses is cumulative
+            usage_metadata = event.usage_metadata or usage_metadata
             if not (
                 event.candidates
                 and event.candidates[0].content
@@ -973,6 +1186,8 @@ class LLMClient:
                         )
                     )
 
+        record_llm_usage(usage_metadata.total_token_count if usage_metadata else None)
+
         if tool_calls:
             tool_call_messages = await self.tool_calls_handler.handle_tool_calls_google(
                 tool_calls
@@ -1036,6 +1251,10 @@ class LLMClient:
                             input=event.content_block.input,
                         )
                     )
+            final_message = await stream.get_final_message()
+            record_llm_usage(
+                final_message.usage.input_tokens + final_message.usage.output_tokens
+            )
 
         if tool_calls:
             tool_call_messages = (
@@ -1097,6 +1316,20 @@ class LLMClient:
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
+        return LLM_RATE_LIMITER.stream(
+            self.llm_provider.value,
+            model,
+            lambda: self._stream(model, messages, max_tokens, parsed_tools),
+            estimate_tokens(messages, max_tokens),
+        )
+
+    def _stream(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int],
+        parsed_tools: Optional[List[dict]],
+    ):
         match self.llm_provider:
             case LLMProvider.OPENAI:
                 return self._stream_openai(
@@ -1149,11 +1382,7 @@ class LLMClient:
             self.use_tool_calls_for_structured_output()
         )
         if strict and depth == 0:
-            response_schema = ensure_strict_json_schema(
-                response_schema,
-                path=(),
-                root=response_schema,
-            )
+            response_schema = self._get_strict_response_schema(response_schema)
 
         if use_tool_calls_for_structured_output and depth == 0:
             if all_tools is None:
@@ -1198,8 +1427,11 @@ class LLMClient:
             ),
             extra_body=extra_body,
             stream=True,
+            stream_options=self._get_openai_stream_options(),
         ):
             event: OpenAIChatCompletionChunk = event
+            if event.usage:
+                record_llm_usage(event.usage.total_tokens)
             if not event.choices:
                 continue
 
@@ -1300,8 +1532,8 @@ class LLMClient:
                         {
                             "name": "ResponseSchema",
                             "description": "Provide response to the user",
-                            "parameters": remove_titles_from_schema(
-                                flatten_json_schema(response_format)
+                            "parameters": self._get_google_tool_schema(
+                                response_format
                             ),
                         }
                     ]
@@ -1311,6 +1543,7 @@ class LLMClient:
         parsed_messages = self._get_google_messages(messages)
 
         generated_contents = []
+        usage_metadata = None
         tool_calls: List[GoogleToolCall] = []
         has_response_schema_tool_call = False
         async for event in iterator_to_async(client.models.generate_content_stream)(
@@ -1333,6 +1566,8 @@ class LLMClient:
                 max_output_tokens=max_tokens,
             ),
         ):
+            # Usage of streamed responses is cumulative
+            usage_metadata = event.usage_metadata or usage_metadata
             if not (
                 event.candidates
                 and event.candidates[0].content
@@ -1360,6 +1595,8 @@ class LLMClient:
                         )
                     )
 
+        record_llm_usage(usage_metadata.total_token_count if usage_metadata else None)
+
         if tool_calls and not has_response_schema_tool_call:
             tool_call_messages = await self.tool_calls_handler.handle_tool_calls_google(
                 tool_calls
@@ -1446,6 +1683,10 @@ class LLMClient:
                             input=event.content_block.input,
                         )
                     )
+            final_message = await stream.get_final_message()
+            record_llm_usage(
+                final_message.usage.input_tokens + final_message.usage.output_tokens
+            )
 
         if tool_calls and not has_response_schema_tool_call:
             tool_call_messages = (
@@ -1521,6 +1762,33 @@ class LLMClient:
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
+        cache_key = self._get_response_cache_key(
+            model, messages, response_format, strict, parsed_tools
+        )
+
+        def get_stream():
+            return LLM_RATE_LIMITER.stream(
+                self.llm_provider.value,
+                model,
+                lambda: self._stream_structured(
+                    model, messages, response_format, strict, parsed_tools, max_tokens
+                ),
+                estimate_tokens(messages, max_tokens),
+            )
+
+        if cache_key:
+            return self._stream_structured_with_cache(cache_key, get_stream)
+        return get_stream()
+
+    def _stream_structured(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: dict,
+        strict: bool,
+        parsed_tools: Optional[List[dict]],
+        max_tokens: Optional[int],
+    ):
         match self.llm_provider:
             case LLMProvider.OPENAI:
                 return self._stream_openai_structured(
@@ -1564,6 +1832,256 @@ class LLMClient:
                     max_tokens=max_tokens,
                 )
 
+    # ? Batch Structured Content
+    def supports_batch(self) -> bool:
+        return self.llm_provider in (LLMProvider.OPENAI, LLMProvider.ANTHROPIC)
+
+    async def _generate_openai_structured_batch(
+        self,
+        model: str,
+        requests: Dict[str, Tuple[List[LLMMessage], dict]],
+        strict: bool = False,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, dict]:
+        client: AsyncOpenAI = self._client
+
+        lines = []
+        for custom_id, (messages, response_format) in requests.items():
+            response_schema = response_format
+            if strict:
+                response_schema = self._get_strict_response_schema(response_schema)
+            body = {
+                "model": model,
+                "messages": [message.model_dump() for message in messages],
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "ResponseSchema",
+                        "strict": strict,
+                        "schema": response_schema,
+                    },
+                },
+            }
+            if max_tokens:
+                body["max_completion_tokens"] = max_tokens
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+
+        input_file = await client.files.create(
+            file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        print(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(LLM_BATCH_POLL_INTERVAL)
+            batch = await client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            print(f"Warning: OpenAI batch {batch.id} ended as {batch.status}")
+
+        # Expired batches still return the requests that were completed
+        results = {}
+        if not batch.output_file_id:
+            return results
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            content = response["body"]["choices"][0]["message"].get("content")
+            if not content:
+                continue
+            try:
+                results[entry["custom_id"]] = dict(dirtyjson.loads(content))
+            except Exception:
+                continue
+        return results
+
+    async def _generate_anthropic_structured_batch(
+        self,
+        model: str,
+        requests: Dict[str, Tuple[List[LLMMessage], dict]],
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, dict]:
+        client: AsyncAnthropic = self._client
+
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": model,
+                        "system": self._get_system_prompt(messages),
+                        "messages": [
+                            message.model_dump()
+                            for message in self._get_anthropic_messages(messages)
+                        ],
+                        "max_tokens": max_tokens or 4000,
+                        "tools": [
+                            {
+                                "name": "ResponseSchema",
+                                "description": "A response to the user's message",
+                                "input_schema": response_format,
+                            }
+                        ],
+                        "tool_choice": {"type": "tool", "name": "ResponseSchema"},
+                    },
+                }
+                for custom_id, (messages, response_format) in requests.items()
+            ]
+        )
+        print(f"Submitted Anthropic batch {batch.id} with {len(requests)} requests")
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(LLM_BATCH_POLL_INTERVAL)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                continue
+            for content in entry.result.message.content:
+                if content.type == "tool_use" and content.name == "ResponseSchema":
+                    results[entry.custom_id] = content.input
+        return results
+
+    async def generate_structured_batch(
+        self,
+        model: str,
+        requests: List[Tuple[List[LLMMessage], dict]],
+        strict: bool = False,
+        max_tokens: Optional[int] = None,
+    ) -> List[dict | None]:
+        """
+        Generates structured content for (messages, response_format) requests
+        through the provider's batch API. It costs less than individual calls
+        but can take up to 24 hours. Requests the batch could not answer are
+        returned as None.
+        """
+        if not self.supports_batch():
+            raise HTTPException(
+                status_code=400,
+                detail="Batch generation is only supported with OpenAI and Anthropic",
+            )
+
+        contents: List[dict | None] = [None] * len(requests)
+        cache_keys = [
+            self._get_response_cache_key(
+                model, messages, response_format, strict, None
+            )
+            for messages, response_format in requests
+        ]
+        for index, cache_key in enumerate(cache_keys):
+            if cache_key:
+                contents[index] = await LLM_RESPONSE_CACHE.get(cache_key)
+
+        pending = {
+            f"request-{index}": index
+            for index, content in enumerate(contents)
+            if content is None
+        }
+        if not pending:
+            return contents
+
+        pending_requests = {
+            custom_id: requests[index] for custom_id, index in pending.items()
+        }
+        match self.llm_provider:
+            case LLMProvider.OPENAI:
+                results = await self._generate_openai_structured_batch(
+                    model=model,
+                    requests=pending_requests,
+                    strict=strict,
+                    max_tokens=max_tokens,
+                )
+            case LLMProvider.ANTHROPIC:
+                results = await self._generate_anthropic_structured_batch(
+                    model=model,
+                    requests=pending_requests,
+                    max_tokens=max_tokens,
+                )
+
+        for custom_id, content in results.items():
+            index = pending[custom_id]
+            contents[index] = content
+            if cache_keys[index]:
+                await self._store_cached_response(cache_keys[index], content)
+        return contents
+
+    # ? Schema compilation
+    def _get_strict_response_schema(self, response_schema: dict) -> dict:
+        return SCHEMA_COMPILE_CACHE.compile(
+            response_schema,
+            f"{self.llm_provider.value}_strict",
+            lambda schema: ensure_strict_json_schema(schema, path=(), root=schema),
+        )
+
+    def _get_google_tool_schema(self, response_schema: dict) -> dict:
+        return SCHEMA_COMPILE_CACHE.compile(
+            response_schema,
+            "google_tool",
+            lambda schema: remove_titles_from_schema(flatten_json_schema(schema)),
+        )
+
+    # ? Response cache
+    def _get_response_cache_key(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: dict,
+        strict: bool,
+        parsed_tools: Optional[List[dict]],
+    ) -> Optional[str]:
+        # Tool calls (web search) make responses non-deterministic
+        if parsed_tools or not LLM_RESPONSE_CACHE.is_enabled():
+            return None
+        return LLM_RESPONSE_CACHE.get_key(
+            self.llm_provider.value, model, messages, response_format, strict
+        )
+
+    async def _store_cached_response(self, cache_key: str, content: dict):
+        try:
+            await LLM_RESPONSE_CACHE.set(cache_key, content)
+        except Exception as e:
+            print(f"Warning: Failed to cache LLM response: {e}")
+
+    async def _stream_structured_with_cache(
+        self,
+        cache_key: str,
+        get_stream: Callable[[], AsyncGenerator[str, None]],
+    ) -> AsyncGenerator[str, None]:
+        cached_content = await LLM_RESPONSE_CACHE.get(cache_key)
+        if cached_content is not None:
+            yield json.dumps(cached_content)
+            return
+
+        streamed_text = ""
+        async for chunk in get_stream():
+            streamed_text += chunk
+            yield chunk
+
+        try:
+            content = dict(dirtyjson.loads(streamed_text))
+        except Exception:
+            return
+        await self._store_cached_response(cache_key, content)
+
     # ? Web search
     async def _search_openai(self, query: str) -> str:
         client: AsyncOpenAI = self._client
@@ -0,0 +1,445 @@
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import json
+import random
+import time
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from constants.llm import (
+    DEFAULT_LLM_MAX_CONCURRENCY,
+    DEFAULT_LLM_MAX_RETRIES,
+    LLM_RATE_LIMIT_STATUS_CODES,
+    LLM_RETRY_BASE_DELAY,
+    LLM_RETRY_MAX_DELAY,
+)
+from models.llm_message import LLMMessage
+from models.llm_rate_limit_stats import (
+    LLMRateLimitConfig,
+    LLMRateLimitEntry,
+    LLMRateLimitStats,
+)
+from utils.get_env import (
+    get_llm_max_concurrency_env,
+    get_llm_max_retries_env,
+    get_llm_rate_limits_env,
+    get_llm_requests_per_minute_env,
+    get_llm_tokens_per_minute_env,
+)
+from utils.parsers import parse_int_or_none
+
+T = TypeVar("T")
+
+# Tokens reported by the provider for the call currently being rate limited
+LLM_USAGE: ContextVar[Optional[List[int]]] = ContextVar("llm_usage", default=None)
+
+
+def estimate_text_tokens(text: str) -> int:
+    # Roughly 4 characters per token, good enough for budgeting
+    return len(text) // 4
+
+
+def estimate_tokens(messages: List[LLMMessage], max_tokens: Optional[int] = None):
+    return sum(
+        estimate_text_tokens(str(getattr(each, "content", "") or ""))
+        for each in messages
+    ) + (max_tokens or 0)
+
+
+def record_llm_usage(tokens: Optional[int]):
+    # Called by LLM clients with the total tokens of each provider response
+    usage = LLM_USAGE.get()
+    if usage is not None and isinstance(tokens, int):
+        usage.append(tokens)
+
+
+async def track_llm_usage(
+    stream: AsyncIterable[T], usage: List[int]
+) -> AsyncGenerator[T, None]:
+    # The caller runs between chunks, so usage is only tracked while waiting
+    iterator = stream.__aiter__()
+    while True:
+        token = LLM_USAGE.set(usage)
+        try:
+            chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            LLM_USAGE.reset(token)
+        yield chunk
+
+
+def get_status_code(e: Exception) -> Optional[int]:
+    # OpenAI and Anthropic use status_code, Google uses code
+    for attribute in ("status_code", "code"):
+        value = getattr(e, attribute, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def get_retry_after(e: Exception) -> Optional[float]:
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated_at = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.capacity / 60)
+        self.updated_at = now
+
+    def get_wait_time(self, amount: float) -> float:
+        self.refill()
+        # Requests larger than the whole budget only wait for a full bucket
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0
+        return (amount - self.tokens) * 60 / self.capacity
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+    def reconcile(self, consumed: float, used: float):
+        # Refunds an overestimate, an underestimate is owed by later calls
+        self.refill()
+        self.tokens = min(
+            self.capacity, self.tokens + min(consumed, self.capacity) - used
+        )
+
+
+class LLMRateLimitState:
+    """
+    Limits for one provider and model. Concurrency follows AIMD: it grows by
+    one slot per window of successful calls and halves when the provider
+    rate limits us, never going above the configured maximum.
+    """
+
+    def __init__(self, config: LLMRateLimitConfig):
+        self.config = config
+        self.concurrency_limit = float(config.max_concurrency)
+        self.request_bucket: Optional[TokenBucket] = None
+        self.token_bucket: Optional[TokenBucket] = None
+        self.in_flight = 0
+        self.queued = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.blocked_until = 0.0
+        self.last_decrease_at = 0.0
+        self.rate_limited = 0
+        self.retries = 0
+        self.configure(config, force=True)
+
+    def configure(self, config: LLMRateLimitConfig, force: bool = False):
+        if config == self.config and not force:
+            return
+        self.config = config
+        self.concurrency_limit = min(
+            self.concurrency_limit, float(config.max_concurrency)
+        )
+        self.request_bucket = (
+            TokenBucket(config.requests_per_minute)
+            if config.requests_per_minute
+            else None
+        )
+        self.token_bucket = (
+            TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        )
+
+    def get_concurrency_limit(self) -> int:
+        return max(1, int(self.concurrency_limit))
+
+    def on_success(self):
+        self.concurrency_limit = min(
+            float(self.config.max_concurrency),
+            self.concurrency_limit + 1 / self.concurrency_limit,
+        )
+
+    def on_rate_limited(self, delay: float):
+        now = time.monotonic()
+        self.rate_limited += 1
+        self.blocked_until = max(self.blocked_until, now + delay)
+        # Calls already in flight will hit the same limit, count it only once
+        if now - self.last_decrease_at >= 1:
+            self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+            self.last_decrease_at = now
+
+
+class LLMRateLimiter:
+    """
+    Process-wide governor for LLM calls, keyed by provider and model so that
+    every presentation being generated shares the same budget. Calls wait for
+    a slot in FIFO order, and the tokens per minute budget is corrected with
+    the usage providers report through record_llm_usage.
+
+    Defaults come from LLM_MAX_CONCURRENCY, LLM_REQUESTS_PER_MINUTE and
+    LLM_TOKENS_PER_MINUTE. LLM_RATE_LIMITS can override them with a JSON
+    object keyed by "provider" or "provider:model", e.g.
+    {"openai:gpt-4.1": {"max_concurrency": 8, "tokens_per_minute": 30000}}.
+    """
+
+    def __init__(self):
+        self._states: Dict[Tuple[str, str], LLMRateLimitState] = {}
+
+    def get_config(self, provider: str, model: str) -> LLMRateLimitConfig:
+        config = {
+            "max_concurrency": parse_int_or_none(get_llm_max_concurrency_env())
+            or DEFAULT_LLM_MAX_CONCURRENCY,
+            "requests_per_minute": parse_int_or_none(
+                get_llm_requests_per_minute_env()
+            ),
+            "tokens_per_minute": parse_int_or_none(get_llm_tokens_per_minute_env()),
+        }
+        overrides = self._get_overrides()
+        for key in (provider, f"{provider}:{model}"):
+            config.update(overrides.get(key) or {})
+        config["max_concurrency"] = max(1, int(config["max_concurrency"]))
+        return LLMRateLimitConfig(**config)
+
+    def get_max_retries(self) -> int:
+        max_retries = parse_int_or_none(get_llm_max_retries_env())
+        if max_retries is None or max_retries < 0:
+            return DEFAULT_LLM_MAX_RETRIES
+        return max_retries
+
+    async def run(
+        self,
+        provider: str,
+        model: str,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+    ) -> T:
+        state = self._get_state(provider, model)
+        attempt = 0
+        while True:
+            await self._acquire(state, estimated_tokens)
+            usage: List[int] = []
+            token = LLM_USAGE.set(usage)
+            try:
+                result = await call()
+                state.on_success()
+                return result
+            except Exception as e:
+                delay = self._get_retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                self._on_rate_limited(state, provider, model, e, delay)
+                attempt += 1
+            finally:
+                LLM_USAGE.reset(token)
+                self._reconcile_usage(state, estimated_tokens, usage)
+                self._release(state)
+
+    async def stream(
+        self,
+        provider: str,
+        model: str,
+        get_stream: Callable[[], AsyncIterable[T]],
+        estimated_tokens: int = 0,
+    ) -> AsyncGenerator[T, None]:
+        state = self._get_state(provider, model)
+        attempt = 0
+        while True:
+            await self._acquire(state, estimated_tokens)
+            usage: List[int] = []
+            started = False
+            try:
+                async for chunk in track_llm_usage(get_stream(), usage):
+                    started = True
+                    yield chunk
+                state.on_success()
+                return
+            except Exception as e:
+                # Chunks already sent to the caller can not be taken back
+                delay = None if started else self._get_retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                self._on_rate_limited(state, provider, model, e, delay)
+                attempt += 1
+            finally:
+                self._reconcile_usage(state, estimated_tokens, usage)
+                self._release(state)
+
+    def get_stats(self) -> LLMRateLimitStats:
+        limits = []
+        for (provider, model), state in self._states.items():
+            if state.request_bucket:
+                state.request_bucket.refill()
+            if state.token_bucket:
+                state.token_bucket.refill()
+            limits.append(
+                LLMRateLimitEntry(
+                    provider=provider,
+                    model=model,
+                    config=state.config,
+                    concurrency_limit=state.get_concurrency_limit(),
+                    in_flight=state.in_flight,
+                    queued=state.queued,
+                    available_requests=(
+                        state.request_bucket.tokens if state.request_bucket else None
+                    ),
+                    available_tokens=(
+                        state.token_bucket.tokens if state.token_bucket else None
+                    ),
+                    rate_limited=state.rate_limited,
+                    retries=state.retries,
+                )
+            )
+        return LLMRateLimitStats(limits=limits)
+
+    def _get_overrides(self) -> dict:
+        rate_limits = get_llm_rate_limits_env()
+        if not rate_limits:
+            return {}
+        try:
+            overrides = json.loads(rate_limits)
+        except json.JSONDecodeError:
+            print("Warning: Ignoring invalid LLM_RATE_LIMITS")
+            return {}
+        return overrides if isinstance(overrides, dict) else {}
+
+    def _get_state(self, provider: str, model: str) -> LLMRateLimitState:
+        config = self.get_config(provider, model)
+        state = self._states.get((provider, model))
+        if state is None:
+            state = LLMRateLimitState(config)
+            self._states[(provider, model)] = state
+        else:
+            state.configure(config)
+        return state
+
+    def _get_retry_delay(self, e: Exception, attempt: int) -> Optional[float]:
+        if get_status_code(e) not in LLM_RATE_LIMIT_STATUS_CODES:
+            return None
+        if attempt >= self.get_max_retries():
+            return None
+        retry_after = get_retry_after(e)
+        if retry_after is not None:
+            return min(retry_after, LLM_RETRY_MAX_DELAY)
+        delay = min(LLM_RETRY_MAX_DELAY, LLM_RETRY_BASE_DELAY * 2**attempt)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _on_rate_limited(
+        self,
+        state: LLMRateLimitState,
+        provider: str,
+        model: str,
+        e: Exception,
+        delay: float,
+    ):
+        state.on_rate_limited(delay)
+        state.retries += 1
+        print(
+            f"Rate limited by {provider} ({model}): status {get_status_code(e)}, "
+            f"retrying in {delay:.1f}s with concurrency {state.get_concurrency_limit()}"
+        )
+
+    async def _acquire(self, state: LLMRateLimitState, estimated_tokens: int):
+        state.queued += 1
+        try:
+            await self._acquire_slot(state)
+            try:
+                await self._acquire_budget(state, estimated_tokens)
+            except asyncio.CancelledError:
+                self._release(state)
+                raise
+        finally:
+            state.queued -= 1
+
+    async def _acquire_slot(self, state: LLMRateLimitState):
+        # Newcomers only skip the queue when nobody is waiting in it
+        if not state.waiters and state.in_flight < state.get_concurrency_limit():
+            state.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            # The slot is handed over by _wake_waiters
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in state.waiters:
+                state.waiters.remove(waiter)
+            elif not waiter.cancelled():
+                # Pass on a slot this waiter has already been handed
+                self._release(state)
+            raise
+
+    async def _acquire_budget(self, state: LLMRateLimitState, estimated_tokens: int):
+        while True:
+            wait_time = max(
+                state.blocked_until - time.monotonic(),
+                state.request_bucket.get_wait_time(1) if state.request_bucket else 0,
+                (
+                    state.token_bucket.get_wait_time(estimated_tokens)
+                    if state.token_bucket
+                    else 0
+                ),
+            )
+            if wait_time <= 0:
+                break
+            await asyncio.sleep(wait_time)
+
+        if state.request_bucket:
+            state.request_bucket.consume(1)
+        if state.token_bucket:
+            state.token_bucket.consume(estimated_tokens)
+
+    def _release(self, state: LLMRateLimitState):
+        state.in_flight -= 1
+        self._wake_waiters(state)
+
+    def _wake_waiters(self, state: LLMRateLimitState):
+        while state.waiters and state.in_flight < state.get_concurrency_limit():
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                state.in_flight += 1
+                waiter.set_result(None)
+
+    def _reconcile_usage(
+        self, state: LLMRateLimitState, estimated_tokens: int, usage: List[int]
+    ):
+        if usage and state.token_bucket:
+            state.token_bucket.reconcile(estimated_tokens, sum(usage))
+
+
+LLM_RATE_LIMITER = LLMRateLimiter()
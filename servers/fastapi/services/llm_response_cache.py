@@ -0,0 +1,196 @@
+import asyncio
+from contextlib import closing
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from constants.llm import (
+    DEFAULT_LLM_RESPONSE_CACHE_MAX_SIZE_MB,
+    DEFAULT_LLM_RESPONSE_CACHE_TTL,
+)
+from models.llm_message import LLMMessage
+from models.llm_response_cache_stats import LLMResponseCacheStats
+from utils.get_env import (
+    get_app_data_directory_env,
+    get_llm_response_cache_env,
+    get_llm_response_cache_max_size_mb_env,
+    get_llm_response_cache_ttl_env,
+)
+from utils.parsers import parse_bool_or_none, parse_int_or_none
+
+# Prompts inject the current date and time, which must not be part of the key.
+# Only that value is left out, timestamps in the content itself are kept.
+CURRENT_TIME_PATTERN = re.compile(
+    r"(Current Date and Time:?\s*)\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",
+    re.IGNORECASE,
+)
+
+
+class LLMResponseCache:
+    """
+    Opt-in (LLM_RESPONSE_CACHE=true) cache of structured LLM responses.
+    Entries are keyed by a hash of provider, model, messages (without the
+    injected current time) and response schema and stored in SQLite in the
+    app data directory, with a TTL and least recently used eviction once the
+    size limit is reached.
+    """
+
+    def __init__(self):
+        self._db_path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def is_enabled(self) -> bool:
+        return parse_bool_or_none(get_llm_response_cache_env()) or False
+
+    def get_ttl(self) -> int:
+        return (
+            parse_int_or_none(get_llm_response_cache_ttl_env())
+            or DEFAULT_LLM_RESPONSE_CACHE_TTL
+        )
+
+    def get_max_size_bytes(self) -> int:
+        max_size_mb = (
+            parse_int_or_none(get_llm_response_cache_max_size_mb_env())
+            or DEFAULT_LLM_RESPONSE_CACHE_MAX_SIZE_MB
+        )
+        return max_size_mb * 1024 * 1024
+
+    def get_key(
+        self,
+        provider: str,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: dict,
+        strict: bool,
+    ) -> str:
+        normalized_messages = []
+        for message in messages:
+            dumped = message.model_dump(mode="json")
+            if isinstance(dumped.get("content"), str):
+                dumped["content"] = CURRENT_TIME_PATTERN.sub(r"\1", dumped["content"])
+            normalized_messages.append(dumped)
+
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "messages": normalized_messages,
+                "response_format": response_format,
+                "strict": strict,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[dict]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: dict):
+        await asyncio.to_thread(self._set, key, value)
+
+    def get_stats(self) -> LLMResponseCacheStats:
+        entries, size_bytes = 0, 0
+        if self.is_enabled():
+            with self._lock:
+                with closing(self._connect()) as connection, connection:
+                    entries, size_bytes = connection.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                    ).fetchone()
+
+        return LLMResponseCacheStats(
+            enabled=self.is_enabled(),
+            hits=self._hits,
+            misses=self._misses,
+            stores=self._stores,
+            evictions=self._evictions,
+            entries=entries,
+            size_bytes=size_bytes,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._db_path:
+            self._db_path = os.path.join(
+                get_app_data_directory_env(), "llm_response_cache.db"
+            )
+            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+            with closing(sqlite3.connect(self._db_path)) as connection, connection:
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS responses (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                    """
+                )
+        return sqlite3.connect(self._db_path)
+
+    def _get(self, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and now - row[1] <= self.get_ttl():
+                    connection.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                        (now, key),
+                    )
+                    self._hits += 1
+                    return json.loads(row[0])
+
+                if row:
+                    connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._evictions += 1
+                self._misses += 1
+                return None
+
+    def _set(self, key: str, value: dict):
+        now = time.time()
+        serialized = json.dumps(value)
+        with self._lock:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, serialized, len(serialized), now, now),
+                )
+                self._stores += 1
+
+                expired = connection.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (now - self.get_ttl(),),
+                ).rowcount
+                self._evictions += expired
+
+                # Evict least recently used entries until under the size limit
+                total_size = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()[0]
+                max_size = self.get_max_size_bytes()
+                if total_size <= max_size:
+                    return
+                for each_key, each_size in connection.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+                ).fetchall():
+                    if total_size <= max_size:
+                        break
+                    connection.execute(
+                        "DELETE FROM responses WHERE key = ?", (each_key,)
+                    )
+                    total_size -= each_size
+                    self._evictions += 1
+
+
+LLM_RESPONSE_CACHE = LLMResponseCache()
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from constants.icons import ICON_EMBEDDINGS_VERSION
+
+EmbeddingFunction = Callable[[List[str]], List]
+
+
+def normalize_embeddings(embeddings) -> np.ndarray:
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def get_icon_documents_fingerprint(documents: List[str]) -> str:
+    payload = json.dumps([ICON_EMBEDDINGS_VERSION, documents])
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class NumpyIconIndex:
+    """
+    Icon index held in memory as a matrix of normalized embeddings. Search is
+    a single matrix product with top-k, no HNSW graph or Chroma client.
+
+    The matrix is stored as a .npy file (memory-mapped on load) next to a
+    .json file with the icon ids of its rows, the artifact version and a
+    fingerprint of the embedded documents. Exposes the same query() as a
+    Chroma collection so IconFinderService can use either.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        embedding_function: EmbeddingFunction,
+    ):
+        self.ids = ids
+        self.embeddings = embeddings
+        self.embedding_function = embedding_function
+
+    @staticmethod
+    def get_ids_path(embeddings_path: str) -> str:
+        return os.path.splitext(embeddings_path)[0] + ".json"
+
+    @classmethod
+    def build(
+        cls,
+        ids: List[str],
+        documents: List[str],
+        embedding_function: EmbeddingFunction,
+    ) -> "NumpyIconIndex":
+        embeddings = normalize_embeddings(embedding_function(documents))
+        return cls(ids, embeddings, embedding_function)
+
+    @classmethod
+    def load(
+        cls,
+        embeddings_path: str,
+        embedding_function: EmbeddingFunction,
+        fingerprint: Optional[str] = None,
+    ) -> Optional["NumpyIconIndex"]:
+        """
+        Loads a saved index. Returns None when there is none, or when it was
+        built by another artifact version or from other documents.
+        """
+        ids_path = cls.get_ids_path(embeddings_path)
+        if not (os.path.exists(embeddings_path) and os.path.exists(ids_path)):
+            return None
+        with open(ids_path, "r") as f:
+            metadata = json.load(f)
+        if metadata.get("version") != ICON_EMBEDDINGS_VERSION or (
+            fingerprint and metadata.get("fingerprint") != fingerprint
+        ):
+            print(f"Warning: Icon embeddings at {embeddings_path} are outdated")
+            return None
+        ids = metadata["ids"]
+        embeddings = np.load(embeddings_path, mmap_mode="r")
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(ids):
+            print(f"Warning: Icon embeddings at {embeddings_path} are invalid")
+            return None
+        return cls(ids, embeddings, embedding_function)
+
+    def save(self, embeddings_path: str, fingerprint: Optional[str] = None):
+        os.makedirs(os.path.dirname(embeddings_path) or ".", exist_ok=True)
+        np.save(embeddings_path, np.asarray(self.embeddings, dtype=np.float32))
+        with open(self.get_ids_path(embeddings_path), "w") as f:
+            json.dump(
+                {
+                    "version": ICON_EMBEDDINGS_VERSION,
+                    "fingerprint": fingerprint,
+                    "ids": self.ids,
+                },
+                f,
+            )
+
+    def query(self, query_texts: List[str], n_results: int = 1) -> dict:
+        if not query_texts or not self.ids:
+            return {"ids": [[] for _ in query_texts]}
+
+        queries = normalize_embeddings(self.embedding_function(query_texts))
+        # Cosine similarity of every query against every icon
+        scores = queries @ self.embeddings.T
+        n_results = min(n_results, len(self.ids))
+
+        top_k = np.argpartition(-scores, n_results - 1, axis=1)[:, :n_results]
+        top_k_scores = np.take_along_axis(scores, top_k, axis=1)
+        order = np.argsort(-top_k_scores, axis=1)
+        top_k = np.take_along_axis(top_k, order, axis=1)
+        top_k_scores = np.take_along_axis(top_k_scores, order, axis=1)
+
+        return {
+            "ids": [[self.ids[index] for index in row] for row in top_k],
+            "distances": (1 - top_k_scores).tolist(),
+        }
@@ -0,0 +1,250 @@
+import asyncio
+from collections import OrderedDict
+import hashlib
+from importlib import metadata
+import json
+import os
+import re
+import shutil
+from typing import Awaitable, Callable, Dict, List, Optional
+import uuid
+
+from constants.documents import (
+    DEFAULT_PARSED_DOCUMENT_CACHE_MAX_SIZE,
+    DOCLING_PIPELINE_OPTIONS,
+    PDF_PAGE_IMAGE_RESOLUTION,
+)
+from models.parsed_document_cache_stats import ParsedDocumentCacheStats
+from utils.asset_directory_utils import get_parsed_documents_directory
+from utils.get_env import get_parsed_document_cache_max_size_env
+from utils.parsers import parse_int_or_none
+
+MARKDOWN_FILE_NAME = "document.md"
+PAGE_NUMBER_PATTERN = re.compile(r"page_(\d+)\.png$")
+
+
+def get_docling_version() -> Optional[str]:
+    try:
+        return metadata.version("docling")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class ParsedDocumentCache:
+    """
+    Content addressed cache of parsed documents in the app data directory.
+    Entries are keyed by the SHA-256 of the file bytes plus the parsing
+    options, so re-uploads of the same file skip docling entirely. Stores the
+    markdown of a document, or the page images of a PDF, one directory per
+    entry. The least recently used entries are evicted once the cache
+    outgrows PARSED_DOCUMENT_CACHE_MAX_SIZE bytes (0 disables the cache).
+    """
+
+    def __init__(self):
+        # Entry sizes by key, least recently used first. Loaded on first use.
+        self._entries: Optional[OrderedDict[str, int]] = None
+        self._loads: Dict[str, asyncio.Task] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_max_size(self) -> int:
+        max_size = parse_int_or_none(get_parsed_document_cache_max_size_env())
+        return DEFAULT_PARSED_DOCUMENT_CACHE_MAX_SIZE if max_size is None else max_size
+
+    def get_options(self, kind: str) -> dict:
+        if kind == "markdown":
+            return {
+                "docling": get_docling_version(),
+                "pipeline_options": DOCLING_PIPELINE_OPTIONS,
+            }
+        return {"resolution": PDF_PAGE_IMAGE_RESOLUTION}
+
+    def get_key(
+        self, file_path: str, kind: str, options: Optional[dict] = None
+    ) -> str:
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(chunk)
+        options = json.dumps(
+            [kind, self.get_options(kind), options or {}], sort_keys=True
+        )
+        return hashlib.sha256(
+            f"{file_hash.hexdigest()}:{options}".encode()
+        ).hexdigest()
+
+    async def get_markdown(
+        self,
+        file_path: str,
+        parse: Callable[[], Awaitable[str]],
+        options: Optional[dict] = None,
+    ) -> str:
+        def load(entry_directory: str) -> str:
+            with open(os.path.join(entry_directory, MARKDOWN_FILE_NAME), "r") as f:
+                return f.read()
+
+        def store(entry_directory: str, document: str):
+            with open(os.path.join(entry_directory, MARKDOWN_FILE_NAME), "w") as f:
+                f.write(document)
+
+        return await self._get(file_path, "markdown", parse, load, store, options)
+
+    async def get_page_images(
+        self,
+        file_path: str,
+        temp_dir: str,
+        render: Callable[[], Awaitable[List[str]]],
+    ) -> List[str]:
+        # Cached pages are copied, callers may clean up their temp dir
+        def load(entry_directory: str) -> List[str]:
+            pages = sorted(
+                (int(match.group(1)), each)
+                for each in os.listdir(entry_directory)
+                if (match := PAGE_NUMBER_PATTERN.match(each))
+            )
+            image_paths = []
+            for _, each in pages:
+                image_path = os.path.join(temp_dir, each)
+                shutil.copyfile(os.path.join(entry_directory, each), image_path)
+                image_paths.append(image_path)
+            return image_paths
+
+        def store(entry_directory: str, image_paths: List[str]):
+            for each in image_paths:
+                shutil.copyfile(
+                    each, os.path.join(entry_directory, os.path.basename(each))
+                )
+
+        return await self._get(file_path, "images", render, load, store)
+
+    async def _get(
+        self,
+        file_path: str,
+        kind: str,
+        produce,
+        load,
+        store,
+        options: Optional[dict] = None,
+    ):
+        if self.get_max_size() <= 0:
+            return await produce()
+
+        try:
+            key = await asyncio.to_thread(self.get_key, file_path, kind, options)
+        except Exception as e:
+            print(f"Warning: Failed to hash {file_path} for the document cache: {e}")
+            return await produce()
+
+        # Files with the same content loading at the same time share one parse
+        task = self._loads.get(key)
+        if not task or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._load(key, produce, load, store))
+            self._loads[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self._loads.get(key) is task:
+                self._loads.pop(key)
+
+    async def _load(self, key: str, produce, load, store):
+        entries = await asyncio.to_thread(self._get_entries)
+        entry_directory = os.path.join(get_parsed_documents_directory(), key)
+        if key in entries:
+            try:
+                result = await asyncio.to_thread(load, entry_directory)
+                entries.move_to_end(key)
+                self._hits += 1
+                # Keeps the LRU order across restarts
+                try:
+                    os.utime(entry_directory)
+                except OSError:
+                    pass
+                return result
+            except Exception as e:
+                print(f"Warning: Failed to read parsed document {key}: {e}")
+                entries.pop(key, None)
+
+        self._misses += 1
+        result = await produce()
+
+        try:
+            entries[key] = await asyncio.to_thread(
+                self._write_entry, entry_directory, store, result
+            )
+            entries.move_to_end(key)
+            await self._evict()
+        except Exception as e:
+            print(f"Warning: Failed to store parsed document {key}: {e}")
+
+        return result
+
+    def _write_entry(self, entry_directory: str, store, result) -> int:
+        # Written aside and renamed, so readers never see a partial entry
+        temp_directory = f"{entry_directory}.{uuid.uuid4()}.tmp"
+        os.makedirs(temp_directory)
+        try:
+            store(temp_directory, result)
+            shutil.rmtree(entry_directory, ignore_errors=True)
+            os.replace(temp_directory, entry_directory)
+        finally:
+            shutil.rmtree(temp_directory, ignore_errors=True)
+        return self._get_size(entry_directory)
+
+    async def _evict(self):
+        entries = self._get_entries()
+        max_size = self.get_max_size()
+        size = sum(entries.values())
+        evicted = []
+        while entries and size > max_size:
+            key, entry_size = entries.popitem(last=False)
+            size -= entry_size
+            evicted.append(os.path.join(get_parsed_documents_directory(), key))
+            self._evictions += 1
+
+        for each in evicted:
+            await asyncio.to_thread(shutil.rmtree, each, ignore_errors=True)
+
+    def _get_size(self, entry_directory: str) -> int:
+        return sum(
+            os.path.getsize(os.path.join(entry_directory, each))
+            for each in os.listdir(entry_directory)
+        )
+
+    def _get_entries(self) -> OrderedDict[str, int]:
+        if self._entries is None:
+            # Entries of earlier runs, ordered by their last use
+            directory = get_parsed_documents_directory()
+            entries = []
+            for each in os.listdir(directory):
+                entry_directory = os.path.join(directory, each)
+                if each.endswith(".tmp") or not os.path.isdir(entry_directory):
+                    continue
+                try:
+                    entries.append(
+                        (
+                            os.path.getmtime(entry_directory),
+                            each,
+                            self._get_size(entry_directory),
+                        )
+                    )
+                except OSError:
+                    continue
+            self._entries = OrderedDict(
+                (key, size) for _, key, size in sorted(entries)
+            )
+        return self._entries
+
+    def get_stats(self) -> ParsedDocumentCacheStats:
+        entries = self._get_entries()
+        return ParsedDocumentCacheStats(
+            max_size_bytes=self.get_max_size(),
+            size_bytes=sum(entries.values()),
+            entries=len(entries),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+
+PARSED_DOCUMENT_CACHE = ParsedDocumentCache()
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Set
+import uuid
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from constants.presentation import (
+    DEFAULT_PRESENTATION_GENERATION_MAX_ATTEMPTS,
+    PRESENTATION_GENERATION_LEASE_SECONDS,
+    PRESENTATION_GENERATION_RETRY_DELAY,
+)
+from enums.presentation_generation_stage import PresentationGenerationStage
+from models.api_error_model import APIErrorModel
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.sql.async_presentation_generation_status import (
+    AsyncPresentationGenerationTaskModel,
+)
+from utils.get_env import get_presentation_generation_max_attempts_env
+from utils.parsers import parse_int_or_none
+
+
+class PresentationGenerationQueue:
+    """
+    Durable queue of async presentation generation tasks backed by the
+    async_presentation_generation_tasks table, so it survives restarts and
+    can be shared by several worker processes.
+
+    Workers claim a pending task with a conditional update and keep a lease
+    on it while it runs. Tasks whose lease expired are claimed again and
+    resume from the outlines, structure and slides their presentation
+    already saved.
+    """
+
+    def __init__(self):
+        self._listeners: Set[asyncio.Event] = set()
+
+    def get_max_attempts(self) -> int:
+        max_attempts = parse_int_or_none(get_presentation_generation_max_attempts_env())
+        if not max_attempts or max_attempts < 1:
+            return DEFAULT_PRESENTATION_GENERATION_MAX_ATTEMPTS
+        return max_attempts
+
+    def add_listener(self, event: asyncio.Event):
+        self._listeners.add(event)
+
+    def remove_listener(self, event: asyncio.Event):
+        self._listeners.discard(event)
+
+    def notify(self):
+        for event in self._listeners:
+            event.set()
+
+    async def enqueue(
+        self,
+        sql_session: AsyncSession,
+        request: GeneratePresentationRequest,
+        presentation_id: uuid.UUID,
+    ) -> AsyncPresentationGenerationTaskModel:
+        task = AsyncPresentationGenerationTaskModel(
+            status="pending",
+            message="Queued for generation",
+            data=None,
+            presentation_id=presentation_id,
+            request=request.model_dump(mode="json"),
+        )
+        sql_session.add(task)
+        await sql_session.commit()
+
+        # Wakes up workers running in this process
+        self.notify()
+        return task
+
+    async def claim(
+        self, sql_session: AsyncSession, worker_id: str, limit: int
+    ) -> List[str]:
+        now = datetime.now()
+        claimable = and_(
+            AsyncPresentationGenerationTaskModel.status == "pending",
+            # Tasks queued before the durable queue existed can not be resumed
+            AsyncPresentationGenerationTaskModel.presentation_id.is_not(None),
+            or_(
+                AsyncPresentationGenerationTaskModel.lease_expires_at.is_(None),
+                AsyncPresentationGenerationTaskModel.lease_expires_at < now,
+            ),
+        )
+        candidates = await sql_session.scalars(
+            select(AsyncPresentationGenerationTaskModel.id)
+            .where(claimable)
+            .order_by(AsyncPresentationGenerationTaskModel.created_at)
+            .limit(limit)
+        )
+
+        claimed = []
+        for task_id in candidates.all():
+            # Only one worker can win the conditional update for a task
+            result = await sql_session.execute(
+                update(AsyncPresentationGenerationTaskModel)
+                .where(AsyncPresentationGenerationTaskModel.id == task_id, claimable)
+                .values(
+                    lease_owner=worker_id,
+                    lease_expires_at=now
+                    + timedelta(seconds=PRESENTATION_GENERATION_LEASE_SECONDS),
+                    attempts=AsyncPresentationGenerationTaskModel.attempts + 1,
+                    updated_at=now,
+                )
+            )
+            if result.rowcount == 1:
+                claimed.append(task_id)
+        await sql_session.commit()
+        return claimed
+
+    async def renew_lease(
+        self, sql_session: AsyncSession, task_id: str, worker_id: str
+    ) -> bool:
+        result = await sql_session.execute(
+            update(AsyncPresentationGenerationTaskModel)
+            .where(
+                AsyncPresentationGenerationTaskModel.id == task_id,
+                AsyncPresentationGenerationTaskModel.lease_owner == worker_id,
+            )
+            .values(
+                lease_expires_at=datetime.now()
+                + timedelta(seconds=PRESENTATION_GENERATION_LEASE_SECONDS)
+            )
+        )
+        await sql_session.commit()
+        return result.rowcount == 1
+
+    async def release(self, sql_session: AsyncSession, task_id: str, worker_id: str):
+        await sql_session.execute(
+            update(AsyncPresentationGenerationTaskModel)
+            .where(
+                AsyncPresentationGenerationTaskModel.id == task_id,
+                AsyncPresentationGenerationTaskModel.lease_owner == worker_id,
+            )
+            .values(lease_owner=None, lease_expires_at=None)
+        )
+        await sql_session.commit()
+
+    async def retry_later(
+        self,
+        sql_session: AsyncSession,
+        task: AsyncPresentationGenerationTaskModel,
+        error: APIErrorModel,
+    ) -> bool:
+        """
+        Puts a failed task back in the queue, unless it ran out of attempts.
+        """
+        if task.attempts >= self.get_max_attempts():
+            return False
+
+        delay = PRESENTATION_GENERATION_RETRY_DELAY * 2 ** max(task.attempts - 1, 0)
+        task.message = (
+            f"Retrying after failure (attempt {task.attempts} of "
+            f"{self.get_max_attempts()})"
+        )
+        task.error = error.model_dump(mode="json")
+        task.lease_owner = None
+        # The task can not be claimed again before the lease expires
+        task.lease_expires_at = datetime.now() + timedelta(seconds=delay)
+        task.updated_at = datetime.now()
+        sql_session.add(task)
+        await sql_session.commit()
+        return True
+
+    def set_stage_completed(
+        self,
+        sql_session: AsyncSession,
+        task: AsyncPresentationGenerationTaskModel,
+        stage: PresentationGenerationStage,
+    ):
+        # Committed together with the data saved for the stage
+        task.stage = stage.value
+        task.updated_at = datetime.now()
+        sql_session.add(task)
+
+
+PRESENTATION_GENERATION_QUEUE = PresentationGenerationQueue()
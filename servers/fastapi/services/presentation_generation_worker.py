@@ -0,0 +1,167 @@
+import asyncio
+import os
+import secrets
+import socket
+import traceback
+from typing import Dict, Optional
+
+from constants.presentation import (
+    DEFAULT_PRESENTATION_WORKER_CONCURRENCY,
+    PRESENTATION_GENERATION_LEASE_SECONDS,
+    PRESENTATION_GENERATION_POLL_INTERVAL,
+)
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.sql.async_presentation_generation_status import (
+    AsyncPresentationGenerationTaskModel,
+)
+from services.database import async_session_maker
+from services.presentation_generation_queue import PRESENTATION_GENERATION_QUEUE
+from utils.get_env import (
+    get_can_change_keys_env,
+    get_presentation_worker_concurrency_env,
+)
+from utils.parsers import parse_int_or_none
+from utils.user_config import update_env_with_user_config
+
+
+def load_user_config():
+    # Tasks run outside of requests, where the user config middleware does this
+    if get_can_change_keys_env() != "false":
+        update_env_with_user_config()
+
+
+class PresentationGenerationWorker:
+    """
+    Claims tasks from the presentation generation queue and runs up to
+    max_concurrency of them at a time. Runs inside the API process unless
+    DISABLE_IN_PROCESS_WORKER is set, and standalone through worker.py.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{secrets.token_hex(4)}"
+        self._max_concurrency = max_concurrency
+        self._running_tasks: Dict[str, asyncio.Task] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+        self._wake_up: Optional[asyncio.Event] = None
+
+    def get_max_concurrency(self) -> int:
+        max_concurrency = self._max_concurrency or parse_int_or_none(
+            get_presentation_worker_concurrency_env()
+        )
+        if not max_concurrency or max_concurrency < 1:
+            return DEFAULT_PRESENTATION_WORKER_CONCURRENCY
+        return max_concurrency
+
+    def start(self):
+        if self._loop_task and not self._loop_task.done():
+            return
+        self._loop_task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        tasks = list(self._running_tasks.values())
+        if self._loop_task:
+            tasks.append(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        # Cancelled tasks release their lease and are resumed by the next worker
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop_task = None
+
+    async def run(self):
+        self._wake_up = asyncio.Event()
+        PRESENTATION_GENERATION_QUEUE.add_listener(self._wake_up)
+        load_user_config()
+        print(f"Presentation generation worker {self.worker_id} started")
+        try:
+            while True:
+                self._wake_up.clear()
+                await self._claim_tasks()
+                try:
+                    await asyncio.wait_for(
+                        self._wake_up.wait(), PRESENTATION_GENERATION_POLL_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            PRESENTATION_GENERATION_QUEUE.remove_listener(self._wake_up)
+
+    async def _claim_tasks(self):
+        free_slots = self.get_max_concurrency() - len(self._running_tasks)
+        if free_slots <= 0:
+            return
+        try:
+            async with async_session_maker() as sql_session:
+                task_ids = await PRESENTATION_GENERATION_QUEUE.claim(
+                    sql_session, self.worker_id, free_slots
+                )
+        except Exception as e:
+            print(f"Warning: Failed to claim presentation generation tasks: {e}")
+            return
+
+        for task_id in task_ids:
+            print(f"Worker {self.worker_id} claimed {task_id}")
+            task = asyncio.create_task(self._process(task_id))
+            self._running_tasks[task_id] = task
+            task.add_done_callback(
+                lambda _, task_id=task_id: self._on_task_done(task_id)
+            )
+
+    def _on_task_done(self, task_id: str):
+        self._running_tasks.pop(task_id, None)
+        if self._wake_up:
+            self._wake_up.set()
+
+    async def _process(self, task_id: str):
+        # Imported here as the handler lives with the presentation endpoints
+        from api.v1.ppt.endpoints.presentation import generate_presentation_handler
+
+        heartbeat = asyncio.create_task(
+            self._renew_lease(task_id, asyncio.current_task())
+        )
+        try:
+            # Providers and keys may have been changed in the UI since
+            load_user_config()
+            async with async_session_maker() as sql_session:
+                async_status = await sql_session.get(
+                    AsyncPresentationGenerationTaskModel, task_id
+                )
+                await generate_presentation_handler(
+                    GeneratePresentationRequest(**async_status.request),
+                    async_status.presentation_id,
+                    async_status,
+                    sql_session,
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            traceback.print_exc()
+        finally:
+            heartbeat.cancel()
+            try:
+                async with async_session_maker() as sql_session:
+                    await PRESENTATION_GENERATION_QUEUE.release(
+                        sql_session, task_id, self.worker_id
+                    )
+            except Exception as e:
+                print(f"Warning: Failed to release {task_id}: {e}")
+
+    async def _renew_lease(self, task_id: str, job: asyncio.Task):
+        while True:
+            await asyncio.sleep(PRESENTATION_GENERATION_LEASE_SECONDS / 3)
+            try:
+                async with async_session_maker() as sql_session:
+                    renewed = await PRESENTATION_GENERATION_QUEUE.renew_lease(
+                        sql_session, task_id, self.worker_id
+                    )
+            except Exception as e:
+                print(f"Warning: Failed to renew lease on {task_id}: {e}")
+                continue
+
+            if not renewed:
+                # Another worker took over after our lease expired
+                print(f"Lost lease on {task_id}, stopping")
+                job.cancel()
+                return
+
+
+PRESENTATION_GENERATION_WORKER = PresentationGenerationWorker()
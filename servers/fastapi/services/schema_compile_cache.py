@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from copy import deepcopy
+import hashlib
+import json
+import threading
+from typing import Callable, Tuple
+
+from constants.llm import SCHEMA_COMPILE_CACHE_MAX_ENTRIES
+from models.schema_compile_cache_stats import SchemaCompileCacheStats
+
+
+class SchemaCompileCache:
+    """
+    Caches response schemas after the recursive transforms applied before
+    they are sent to a provider (field removal, strict mode, flattening).
+    Entries are keyed by the kind of transform and a fingerprint of the
+    source schema, and every caller gets its own copy so the SDKs and
+    in-place transforms can never modify a cached schema.
+    """
+
+    def __init__(self):
+        # Compiled schemas are stored serialized, loading them is a cheap copy
+        self._entries: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_fingerprint(self, schema: dict) -> str:
+        payload = json.dumps(schema, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def compile(
+        self, schema: dict, kind: str, build: Callable[[dict], dict]
+    ) -> dict:
+        """
+        Returns a copy of build(schema), running build only the first time
+        this schema is compiled for `kind`. build receives a copy it may
+        mutate.
+        """
+        key = (kind, self.get_fingerprint(schema))
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return json.loads(compiled)
+
+        compiled = build(deepcopy(schema))
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = json.dumps(compiled)
+            while len(self._entries) > SCHEMA_COMPILE_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> SchemaCompileCacheStats:
+        return SchemaCompileCacheStats(
+            hits=self._hits, misses=self._misses, entries=len(self._entries)
+        )
+
+
+SCHEMA_COMPILE_CACHE = SchemaCompileCache()
@@ -1,9 +1,9 @@
 import asyncio
-import aiohttp
 from sqlmodel import select
 from enums.webhook_event import WebhookEvent
 from models.sql.webhook_subscription import WebhookSubscription
 from services.database import get_async_session
+from services.http_session_manager import HTTP_SESSION_MANAGER
 
 
 class WebhookService:
@@ -42,13 +42,13 @@ class WebhookService:
             headers["Authorization"] = f"Bearer {subscription.secret}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    subscription.url,
-                    json=data,
-                    headers=headers,
-                ) as _:
-                    pass
+            session = HTTP_SESSION_MANAGER.get_session(trust_env=True)
+            async with session.post(
+                subscription.url,
+                json=data,
+                headers=headers,
+            ) as _:
+                pass
 
         except Exception as e:
             print(f"Error sending request to webhook {subscription.id}: {e}")
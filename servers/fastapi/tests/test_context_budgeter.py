@@ -0,0 +1,99 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+from services.context_budgeter import ContextBudgeter
+from services.llm_rate_limiter import estimate_text_tokens
+
+
+def _section(heading: str, topic: str, words: int = 200) -> str:
+    return f"{heading}\n" + " ".join([topic] * words)
+
+
+DOCUMENT = "\n\n".join(
+    [
+        "Quarterly report of the company.",
+        _section("# Overview", "overview"),
+        _section("## Revenue", "revenue"),
+        _section("## Hiring", "hiring"),
+        _section("## Solar panels", "solar"),
+        _section("## Logistics", "logistics"),
+    ]
+)
+
+
+def test_documents_within_budget_are_passed_unchanged():
+    budgeter = ContextBudgeter()
+
+    context = budgeter.select_context(["first", "", "second"], 5, None, 1000)
+
+    assert context == "first\n\nsecond"
+    assert budgeter.get_stats().tokens_saved == 0
+
+
+def test_large_documents_keep_best_sections_in_document_order():
+    budgeter = ContextBudgeter()
+    token_budget = estimate_text_tokens(DOCUMENT) // 2
+
+    context = budgeter.select_context(
+        [DOCUMENT], 3, "Our solar panels business", token_budget
+    )
+
+    assert estimate_text_tokens(context) <= token_budget
+    assert context.startswith("Quarterly report of the company.")
+    # Matches the prompt, so it is kept over later sections of equal score
+    assert "## Solar panels" in context
+    assert context.index("# Overview") < context.index("## Solar panels")
+    assert "## Logistics" not in context
+
+    stats = budgeter.get_stats()
+    assert (stats.requests, stats.trimmed_requests) == (1, 1)
+    assert stats.tokens_saved == stats.input_tokens - stats.output_tokens > 0
+
+
+def test_default_token_budget_is_limited_by_model_context_window():
+    budgeter = ContextBudgeter()
+
+    assert budgeter.get_token_budget("gpt-4.1") == 32000
+    assert budgeter.get_token_budget("gpt-4-0613") == 4096
+    assert budgeter.get_token_budget("gpt-4-turbo-2024-04-09") == 32000
+    assert budgeter.get_token_budget("o1-mini") == 32000
+    assert budgeter.get_token_budget("llama3.2:3b", context_window=8192) == 4096
+
+
+def test_documents_for_unknown_models_are_not_trimmed():
+    budgeter = ContextBudgeter()
+
+    assert budgeter.get_token_budget("llama3.2:3b") is None
+    context = budgeter.select_context([DOCUMENT], 3, None, None)
+    assert context == DOCUMENT
+    assert budgeter.get_stats().trimmed_requests == 0
+
+
+def test_ollama_models_are_limited_by_reported_context_length():
+    budgeter = ContextBudgeter()
+    token_budget = estimate_text_tokens(DOCUMENT) // 2
+
+    async def fake_context_length(model):
+        return token_budget * 2
+
+    with (
+        patch.dict(os.environ, {"LLM": "ollama", "OLLAMA_MODEL": "llama3.2:3b"}),
+        patch(
+            "services.context_budgeter.get_ollama_model_context_length",
+            side_effect=fake_context_length,
+        ) as get_context_length,
+    ):
+        for _ in range(2):
+            context = asyncio.run(budgeter.get_context([DOCUMENT], 3))
+            assert estimate_text_tokens(context) <= token_budget
+
+    get_context_length.assert_called_once_with("llama3.2:3b")
+
+
+def test_explicit_token_budget_overrides_model_context_window():
+    budgeter = ContextBudgeter()
+
+    with patch.dict(os.environ, {"OUTLINE_CONTEXT_TOKEN_BUDGET": "500000"}):
+        assert budgeter.get_token_budget("claude-sonnet-4-20250514") == 500000
+        assert budgeter.get_token_budget("llama3.2:3b") == 500000
@@ -0,0 +1,130 @@
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services import docling_service
+from services.docling_process_pool import DoclingProcessPool
+from services.documents_loader import DocumentsLoader
+
+
+def test_process_pool_runs_calls_in_parallel_processes():
+    pool = DoclingProcessPool(initializer=os.getpid)
+
+    async def run():
+        # Starts the processes outside of the timing
+        await asyncio.gather(*(pool.run(time.sleep, 0) for _ in range(2)))
+        started_at = time.perf_counter()
+        await asyncio.gather(*(pool.run(time.sleep, 1) for _ in range(2)))
+        return time.perf_counter() - started_at, await pool.run(os.getpid)
+
+    with patch.dict(os.environ, {"DOCLING_MAX_WORKERS": "2"}):
+        try:
+            elapsed, pid = asyncio.run(run())
+        finally:
+            pool.close()
+
+    assert elapsed < 1.8
+    assert pid != os.getpid()
+
+
+def test_process_pool_restarts_after_timeout():
+    pool = DoclingProcessPool(initializer=os.getpid)
+
+    async def run():
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run(time.sleep, 30, timeout=0.5)
+        return await pool.run(os.getpid)
+
+    with patch.dict(os.environ, {"DOCLING_MAX_WORKERS": "1"}):
+        try:
+            assert asyncio.run(run()) != os.getpid()
+        finally:
+            pool.close()
+
+
+def test_process_pool_keeps_other_calls_when_a_caller_is_cancelled():
+    pool = DoclingProcessPool(initializer=os.getpid)
+
+    async def run():
+        await asyncio.gather(*(pool.run(time.sleep, 0) for _ in range(2)))
+        executor = pool.get_executor()
+
+        cancelled = asyncio.create_task(pool.run(time.sleep, 0.5))
+        other = asyncio.create_task(pool.run(time.sleep, 0.3))
+        await asyncio.sleep(0.1)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        await other
+        return executor
+
+    with patch.dict(os.environ, {"DOCLING_MAX_WORKERS": "2"}):
+        try:
+            executor = asyncio.run(run())
+            assert pool._executor is executor
+        finally:
+            pool.close()
+
+
+def test_process_pool_warms_up_every_worker():
+    pool = DoclingProcessPool(initializer=os.getpid)
+
+    async def run():
+        assert pool.get_stats().status == "cold"
+        pool.warm_up()
+        await pool._warm_up_task
+        return pool.get_stats()
+
+    with patch.dict(os.environ, {"DOCLING_MAX_WORKERS": "2"}):
+        try:
+            stats = asyncio.run(run())
+        finally:
+            pool.close()
+
+    assert stats.ready
+    assert (stats.status, stats.warmed_workers) == ("ready", 2)
+
+
+def test_docling_service_is_built_and_warmed_once_per_process():
+    with patch.object(
+        docling_service, "DoclingService"
+    ) as service_class, patch.object(docling_service, "_docling_service", None):
+        first = docling_service.get_docling_service()
+        second = docling_service.get_docling_service()
+
+    assert first is second
+    service_class.assert_called_once()
+    first.warm_up.assert_called_once()
+
+
+def test_documents_are_loaded_in_parallel_and_in_order(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path / "app_data"))
+    paths = []
+    for name in ("a.pdf", "b.docx", "c.txt"):
+        path = tmp_path / name
+        path.write_text(f"content of {name}")
+        paths.append(str(path))
+
+    async def fake_parse(file_path, timeout=None):
+        await asyncio.sleep(0.2 if file_path.endswith(".pdf") else 0.1)
+        return f"markdown of {os.path.basename(file_path)}"
+
+    loader = DocumentsLoader(paths)
+    with patch(
+        "services.documents_loader.DOCLING_PROCESS_POOL.parse_to_markdown",
+        side_effect=fake_parse,
+    ):
+        started_at = time.perf_counter()
+        asyncio.run(loader.load_documents())
+        elapsed = time.perf_counter() - started_at
+
+    assert loader.documents == [
+        "markdown of a.pdf",
+        "markdown of b.docx",
+        "content of c.txt",
+    ]
+    assert loader.images == [[], [], []]
+    assert elapsed < 0.3
@@ -0,0 +1,70 @@
+import asyncio
+from io import BytesIO
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from PIL import Image
+
+from services.image_generation_service import ImageGenerationService
+from utils.image_utils import save_image_bytes
+
+
+def _png_bytes(size=(800, 400)) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGBA", size, (255, 0, 0, 255)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _gemini_response(data: bytes):
+    parts = [
+        SimpleNamespace(text="Here is your image", inline_data=None),
+        SimpleNamespace(
+            text=None, inline_data=SimpleNamespace(data=data, mime_type="image/png")
+        ),
+    ]
+    return SimpleNamespace(
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=parts))]
+    )
+
+
+def test_save_image_bytes_downscales_and_transcodes(tmp_path):
+    data = _png_bytes()
+
+    original = save_image_bytes(data, str(tmp_path), "image/png")
+    webp = save_image_bytes(data, str(tmp_path), "image/png", "webp", 200)
+    jpeg = save_image_bytes(data, str(tmp_path), "image/png", "jpeg", None)
+
+    assert original.endswith(".png")
+    with open(original, "rb") as f:
+        assert f.read() == data
+    with Image.open(webp) as image:
+        assert (image.format, image.size) == ("WEBP", (200, 100))
+    with Image.open(jpeg) as image:
+        assert (image.format, image.size) == ("JPEG", (800, 400))
+
+
+def test_gemini_image_generation_uses_async_client(tmp_path):
+    generate_content = AsyncMock(return_value=_gemini_response(_png_bytes()))
+    client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    )
+    service = ImageGenerationService(str(tmp_path))
+
+    with patch.object(
+        ImageGenerationService, "get_google_client", return_value=client
+    ), patch.dict(
+        os.environ,
+        {"GENERATED_IMAGE_FORMAT": "webp", "GENERATED_IMAGE_MAX_SIZE": "400"},
+    ), patch(
+        "services.image_generation_service.asyncio.to_thread", wraps=asyncio.to_thread
+    ) as to_thread:
+        image_path = asyncio.run(
+            service.generate_image_google("a red square", str(tmp_path))
+        )
+
+    generate_content.assert_awaited_once()
+    # Only the downscale runs on a thread, not the provider call
+    assert to_thread.call_count == 1
+    with Image.open(image_path) as image:
+        assert (image.format, image.size) == ("WEBP", (400, 200))
@@ -0,0 +1,91 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+import chromadb
+
+from models.image_prompt import ImagePrompt
+from models.sql.image_asset import ImageAsset
+from services.generated_image_index import GeneratedImageIndex
+from services.image_generation_service import ImageGenerationService
+
+VOCABULARY = ["solar", "panel", "roof", "wind", "turbine", "field", "sunset"]
+
+
+def embed(texts):
+    # Bag of words over a tiny vocabulary, enough to compare prompts
+    return [
+        [float(word in text.lower()) for word in VOCABULARY] for text in texts
+    ]
+
+
+def _get_index(name: str):
+    index = GeneratedImageIndex(
+        client=chromadb.EphemeralClient(), embedding_function=embed
+    )
+    index.collection_name = name
+    return index
+
+
+def test_generated_image_index_matches_similar_prompts_only(tmp_path):
+    image_path = tmp_path / "solar.jpg"
+    image_path.write_bytes(b"image")
+    index = _get_index("similar_prompts")
+
+    async def run():
+        with patch.object(index, "_seed_from_image_assets", AsyncMock()):
+            await index.add(
+                ImageAsset(
+                    path=str(image_path),
+                    extras={"prompt": "Solar panel on a roof", "theme_prompt": None},
+                )
+            )
+            return (
+                await index.find("solar panel on the roof"),
+                await index.find("wind turbine in a field"),
+            )
+
+    similar, different = asyncio.run(run())
+    assert similar == str(image_path)
+    assert different is None
+
+
+def test_generate_image_reuses_images_of_other_presentations_only(tmp_path):
+    image_path = tmp_path / "solar.jpg"
+    image_path.write_bytes(b"image")
+    other_directory = tmp_path / "other"
+    other_directory.mkdir()
+    index = _get_index("reuse")
+    generate_image_openai = AsyncMock(return_value=str(image_path))
+
+    async def run():
+        with patch.dict(os.environ, {"IMAGE_PROVIDER": "dall-e-3"}), patch(
+            "services.image_generation_service.GENERATED_IMAGE_INDEX", index
+        ), patch.object(index, "_seed_from_image_assets", AsyncMock()):
+            service = ImageGenerationService(
+                str(tmp_path), reuse_generated_images=True
+            )
+            service.image_gen_func = generate_image_openai
+            first = await service.generate_image(ImagePrompt(prompt="Solar panel"))
+            # Not repeated within the same presentation
+            await service.generate_image(ImagePrompt(prompt="solar panel"))
+
+            other = ImageGenerationService(
+                str(other_directory), reuse_generated_images=True
+            )
+            other.image_gen_func = generate_image_openai
+            reused = await other.generate_image(ImagePrompt(prompt="solar panel"))
+
+            # Reuse is opt-in
+            default = ImageGenerationService(str(other_directory))
+            default.image_gen_func = generate_image_openai
+            await default.generate_image(ImagePrompt(prompt="Solar panel"))
+        return first, reused
+
+    first, reused = asyncio.run(run())
+    assert generate_image_openai.await_count == 3
+    assert reused.extras["reused"] is True
+    assert reused.extras["reused_from"] == first.path
+    # Copied, so deleting the first presentation's images keeps it intact
+    assert os.path.dirname(reused.path) == str(other_directory)
+    assert open(reused.path, "rb").read() == b"image"
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+from services.http_session_manager import HttpSessionManager
+
+
+def test_http_session_manager_reuses_sessions_per_loop():
+    manager = HttpSessionManager()
+
+    async def run():
+        session = manager.get_session()
+        assert manager.get_session() is session
+        assert manager.get_session(trust_env=True) is not session
+        assert session.connector.limit_per_host == 20
+        return session
+
+    first = asyncio.run(run())
+    # A new event loop gets its own session, the one of the closed loop is
+    # only detached
+    second = asyncio.run(run())
+    assert second is not first
+    assert first.closed
+
+    asyncio.run(manager.close())
+    assert second.closed
+
+
+def test_http_session_manager_recreates_closed_session():
+    manager = HttpSessionManager()
+
+    async def run():
+        session = manager.get_session()
+        await manager.close()
+        assert session.closed
+        new_session = manager.get_session()
+        assert new_session is not session
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_http_session_manager_closes_replaced_session_on_its_loop():
+    manager = HttpSessionManager()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+
+    async def get_session():
+        return manager.get_session()
+
+    async def run():
+        new_session = manager.get_session()
+        await manager.close()
+        return new_session
+
+    try:
+        old_session = asyncio.run_coroutine_threadsafe(
+            get_session(), other_loop
+        ).result()
+        new_session = asyncio.run(run())
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result()
+        assert old_session.closed
+        assert new_session is not old_session
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from services.icon_finder_service import IconFinderService
+
+
+class FakeCollection:
+    def __init__(self):
+        self.queries = []
+
+    def query(self, query_texts, n_results):
+        self.queries.append(query_texts)
+        return {"ids": [[text.replace(" ", "-")] for text in query_texts]}
+
+
+def test_icon_searches_are_batched_and_memoized():
+    service = IconFinderService()
+    service.collection = FakeCollection()
+
+    async def run():
+        return await asyncio.gather(
+            service.search_icons_batch(["Chart", "rocket  launch"]),
+            service.search_icons_batch(["chart", "Team"]),
+            service.search_icons("team"),
+        )
+
+    first, second, third = asyncio.run(run())
+    cached = asyncio.run(service.search_icons_batch(["ROCKET launch", "team"]))
+
+    assert service.collection.queries == [["chart", "rocket launch", "team"]]
+    assert first == [
+        ["/static/icons/bold/chart.svg"],
+        ["/static/icons/bold/rocket-launch.svg"],
+    ]
+    assert second == [["/static/icons/bold/chart.svg"], ["/static/icons/bold/team.svg"]]
+    assert third == ["/static/icons/bold/team.svg"]
+    assert cached == [
+        ["/static/icons/bold/rocket-launch.svg"],
+        ["/static/icons/bold/team.svg"],
+    ]
+
+
+class SlowCollection(FakeCollection):
+    def query(self, query_texts, n_results):
+        time.sleep(0.05)
+        return super().query(query_texts, n_results)
+
+
+def test_icon_searches_queued_during_a_batch_are_flushed():
+    service = IconFinderService()
+    service.collection = SlowCollection()
+
+    async def run():
+        first = asyncio.create_task(service.search_icons("chart"))
+        # Arrives while the first batch is querying the collection
+        await asyncio.sleep(0.03)
+        second = service.search_icons("rocket")
+        return await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+
+    assert asyncio.run(run()) == [
+        ["/static/icons/bold/chart.svg"],
+        ["/static/icons/bold/rocket.svg"],
+    ]
+    assert service.collection.queries == [["chart"], ["rocket"]]
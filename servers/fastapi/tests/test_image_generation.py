@@ -1,7 +1,7 @@
 import pytest
 import asyncio
 import os
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import MagicMock, Mock, patch, AsyncMock
 import httpx
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
@@ -134,7 +134,9 @@ class TestImageGenerationService:
                                 })
                                 
                                 mock_session = AsyncMock()
-                                mock_session.get = AsyncMock(return_value=mock_response)
+                                mock_response.raise_for_status = MagicMock()
+                                mock_response.__aenter__.return_value = mock_response
+                                mock_session.get = MagicMock(return_value=mock_response)
                                 mock_session.__aenter__ = AsyncMock(return_value=mock_session)
                                 mock_session.__aexit__ = AsyncMock(return_value=None)
                                 
@@ -246,7 +248,9 @@ class TestImageGenerationService:
                 })
                 
                 mock_session = AsyncMock()
-                mock_session.get = AsyncMock(return_value=mock_response)
+                mock_response.raise_for_status = MagicMock()
+                mock_response.__aenter__.return_value = mock_response
+                mock_session.get = MagicMock(return_value=mock_response)
                 mock_session.__aenter__ = AsyncMock(return_value=mock_session)
                 mock_session.__aexit__ = AsyncMock(return_value=None)
                 
@@ -277,7 +281,9 @@ class TestImageGenerationService:
                 })
                 
                 mock_session = AsyncMock()
-                mock_session.get = AsyncMock(return_value=mock_response)
+                mock_response.raise_for_status = MagicMock()
+                mock_response.__aenter__.return_value = mock_response
+                mock_session.get = MagicMock(return_value=mock_response)
                 mock_session.__aenter__ = AsyncMock(return_value=mock_session)
                 mock_session.__aexit__ = AsyncMock(return_value=None)
                 
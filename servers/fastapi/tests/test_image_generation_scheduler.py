@@ -0,0 +1,145 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from services.image_generation_scheduler import (
+    ImageGenerationScheduler,
+    PrioritySemaphore,
+)
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def test_priority_semaphore_serves_lowest_priority_first():
+    order = []
+
+    async def worker(semaphore, priority):
+        await semaphore.acquire(priority)
+        order.append(priority)
+        await asyncio.sleep(0)
+        semaphore.release()
+
+    async def run():
+        semaphore = PrioritySemaphore(1)
+        await semaphore.acquire(0)
+        tasks = [
+            asyncio.create_task(worker(semaphore, priority)) for priority in (5, 1, 3)
+        ]
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert order == [1, 3, 5]
+
+
+def test_scheduler_caps_concurrency_per_provider():
+    scheduler = ImageGenerationScheduler()
+    in_flight = []
+    peak = []
+
+    async def call():
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return "image.jpg"
+
+    async def run():
+        return await asyncio.gather(
+            *(scheduler.run("pexels", call, priority) for priority in range(6))
+        )
+
+    with patch.dict("os.environ", {"IMAGE_GENERATION_CONCURRENCY": "2"}):
+        results = asyncio.run(run())
+
+    assert results == ["image.jpg"] * 6
+    assert max(peak) == 2
+    assert scheduler.get_stats().providers[0].max_concurrency == 2
+
+
+def test_scheduler_retries_and_counts_placeholders():
+    scheduler = ImageGenerationScheduler()
+    attempts = []
+
+    async def flaky_call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ProviderError(429)
+        return "image.jpg"
+
+    async def failing_call():
+        raise ConnectionError("provider down")
+
+    async def run():
+        result = await scheduler.run("dall-e-3", flaky_call)
+        try:
+            await scheduler.run("dall-e-3", failing_call)
+        except Exception:
+            scheduler.record_placeholder("dall-e-3", "error")
+        return result
+
+    with patch(
+        "services.image_generation_scheduler.asyncio.sleep", new_callable=AsyncMock
+    ):
+        with patch.dict("os.environ", {"IMAGE_GENERATION_MAX_RETRIES": "2"}):
+            result = asyncio.run(run())
+
+    assert result == "image.jpg"
+    stats = scheduler.get_stats().providers[0]
+    assert (stats.requests, stats.retries, stats.failures) == (6, 4, 1)
+    assert stats.placeholders == 1
+    assert stats.placeholder_reasons == {"error": 1}
+
+
+def test_scheduler_does_not_retry_permanent_errors():
+    scheduler = ImageGenerationScheduler()
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        raise ProviderError(401)
+
+    async def run():
+        try:
+            await scheduler.run("dall-e-3", call)
+        except ProviderError:
+            pass
+
+    with patch(
+        "services.image_generation_scheduler.asyncio.sleep", new_callable=AsyncMock
+    ) as sleep:
+        asyncio.run(run())
+
+    assert len(attempts) == 1
+    sleep.assert_not_called()
+    stats = scheduler.get_stats().providers[0]
+    assert (stats.requests, stats.retries, stats.failures) == (1, 0, 1)
+
+
+def test_scheduler_waits_at_least_retry_after():
+    scheduler = ImageGenerationScheduler()
+
+    async def call():
+        raise ProviderError(429, {"retry-after": "3"})
+
+    async def run():
+        try:
+            await scheduler.run("pexels", call)
+        except ProviderError:
+            pass
+
+    with patch(
+        "services.image_generation_scheduler.asyncio.sleep", new_callable=AsyncMock
+    ) as sleep:
+        with patch.dict("os.environ", {"IMAGE_GENERATION_MAX_RETRIES": "20"}):
+            asyncio.run(run())
+
+    delays = [call.args[0] for call in sleep.await_args_list]
+    assert len(delays) == 20
+    assert min(delays) >= 3
@@ -0,0 +1,75 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from models.sql.image_search_result import ImageSearchResultModel
+from services.image_generation_service import ImageGenerationService
+from services.image_search_cache import ImageSearchCache
+
+
+async def _get_session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: SQLModel.metadata.create_all(
+                sync_conn, tables=[ImageSearchResultModel.__table__]
+            )
+        )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def test_image_search_cache_single_flight_and_persists():
+    cache = ImageSearchCache()
+    searches = []
+
+    async def search():
+        searches.append(1)
+        await asyncio.sleep(0.01)
+        return ["https://example.com/1.jpg", "https://example.com/2.jpg"]
+
+    async def run():
+        session_maker = await _get_session_maker()
+        with patch("services.image_search_cache.async_session_maker", session_maker):
+            concurrent = await asyncio.gather(
+                *(
+                    cache.get_results("pexels", "Solar  Panels", search)
+                    for _ in range(3)
+                )
+            )
+            cached = await cache.get_results("pexels", "solar panels", search)
+            with patch.dict(os.environ, {"IMAGE_SEARCH_CACHE_TTL": "0"}):
+                expired = await cache.get_results("pexels", "solar panels", search)
+        return concurrent, cached, expired
+
+    concurrent, cached, expired = asyncio.run(run())
+
+    assert len(searches) == 2
+    assert all(each == cached for each in concurrent)
+    assert cached == expired
+    assert cached == ["https://example.com/1.jpg", "https://example.com/2.jpg"]
+
+
+def test_stock_images_are_not_repeated_within_a_presentation():
+    with patch.dict(os.environ, {"IMAGE_PROVIDER": "pexels"}):
+        service = ImageGenerationService("/tmp")
+
+    async def get_results(provider, query, search):
+        return ["https://example.com/1.jpg", "https://example.com/2.jpg"]
+
+    async def run():
+        return [await service.get_image_from_pexels("sunset") for _ in range(3)]
+
+    with patch(
+        "services.image_generation_service.IMAGE_SEARCH_CACHE.get_results",
+        side_effect=get_results,
+    ):
+        image_urls = asyncio.run(run())
+
+    assert image_urls == [
+        "https://example.com/1.jpg",
+        "https://example.com/2.jpg",
+        "https://example.com/1.jpg",
+    ]
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import uuid
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from models.sql.presentation_layout_code import PresentationLayoutCodeModel
+from services.layout_cache import LayoutCache
+
+LAYOUT_JSON = {
+    "name": "general",
+    "ordered": False,
+    "slides": [
+        {
+            "id": "intro",
+            "name": "Intro",
+            "json_schema": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "image": {
+                        "type": "object",
+                        "properties": {"__image_url__": {"type": "string"}},
+                    },
+                },
+            },
+        }
+    ],
+}
+
+
+class FakeResponse:
+    def __init__(self, status, etag="v1"):
+        self.status = status
+        self.headers = {"ETag": etag}
+
+    async def json(self):
+        return LAYOUT_JSON
+
+    async def text(self):
+        return "not found"
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class FakeSession:
+    requests = []
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def __call__(self):
+        return self
+
+    def get(self, url, headers):
+        FakeSession.requests.append(headers)
+        return FakeResponse(self.statuses.pop(0))
+
+
+def test_layout_cache_shares_fetches_and_precompiles_artifacts():
+    cache = LayoutCache()
+    FakeSession.requests = []
+
+    async def run():
+        return await asyncio.gather(*(cache.get("general") for _ in range(5)))
+
+    with patch("services.layout_cache.HTTP_SESSION_MANAGER.get_session", FakeSession([200])):
+        layouts = asyncio.run(run())
+        layout = asyncio.run(cache.get("general"))
+
+    assert len(FakeSession.requests) == 1
+    assert all(each is layout for each in layouts)
+    assert layout._string == layout.to_string()
+
+
+def test_layout_cache_revalidates_with_etag_and_invalidates():
+    cache = LayoutCache()
+    FakeSession.requests = []
+
+    with patch.dict("os.environ", {"LAYOUT_CACHE_TTL": "0"}), patch(
+        "services.layout_cache.HTTP_SESSION_MANAGER.get_session", FakeSession([200, 304, 200])
+    ):
+        first = asyncio.run(cache.get("general"))
+        revalidated = asyncio.run(cache.get("general"))
+        cache.invalidate("general")
+        refetched = asyncio.run(cache.get("general"))
+
+    assert FakeSession.requests == [{}, {"If-None-Match": "v1"}, {}]
+    assert revalidated is first
+    assert refetched is not first
+    stats = cache.get_stats()
+    assert (stats.misses, stats.revalidations, stats.invalidations) == (2, 1, 1)
+
+
+def test_layout_cache_refetches_custom_templates_saved_elsewhere():
+    cache = LayoutCache()
+    FakeSession.requests = []
+    presentation = uuid.uuid4()
+    layout_name = f"custom-{presentation}"
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(
+                    sync_conn, tables=[PresentationLayoutCodeModel.__table__]
+                )
+            )
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as sql_session:
+            layout_code = PresentationLayoutCodeModel(
+                presentation=presentation,
+                layout_id="intro",
+                layout_name="Intro",
+                layout_code="<div />",
+            )
+            sql_session.add(layout_code)
+            await sql_session.commit()
+
+        with patch("services.layout_cache.async_session_maker", session_maker):
+            first = await cache.get(layout_name)
+            cached = await cache.get(layout_name)
+
+            # Saved by another process, which only invalidates its own cache
+            async with session_maker() as sql_session:
+                layout_code.updated_at = datetime.now() + timedelta(seconds=1)
+                await sql_session.merge(layout_code)
+                await sql_session.commit()
+            refetched = await cache.get(layout_name)
+        return first, cached, refetched
+
+    with patch(
+        "services.layout_cache.HTTP_SESSION_MANAGER.get_session", FakeSession([200, 200])
+    ):
+        first, cached, refetched = asyncio.run(run())
+
+    assert len(FakeSession.requests) == 2
+    assert cached is first
+    assert refetched is not first
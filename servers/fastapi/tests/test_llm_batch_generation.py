@@ -0,0 +1,264 @@
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+from anthropic import AsyncAnthropic
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+import httpx
+from openai import AsyncOpenAI
+import pytest
+
+from api.v1.ppt.endpoints.presentation import generate_presentation_sync
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.llm_message import LLMSystemMessage, LLMUserMessage
+from models.presentation_layout import SlideLayoutModel
+from models.presentation_outline_model import SlideOutlineModel
+from services.llm_client import LLMClient
+from utils.slide_generation import generate_slide_contents
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}},
+    "required": ["title"],
+}
+
+
+def _requests(n: int):
+    return [
+        (
+            [
+                LLMSystemMessage(content="Generate a slide"),
+                LLMUserMessage(content=f"Slide {i}"),
+            ],
+            SCHEMA,
+        )
+        for i in range(n)
+    ]
+
+
+def _openai_batch_app(failed_custom_ids=()):
+    app = FastAPI()
+    files = {}
+
+    @app.post("/v1/files")
+    async def create_file(request: Request):
+        form = await request.form()
+        files["input"] = (await form["file"].read()).decode()
+        return {
+            "id": "file-input",
+            "object": "file",
+            "bytes": len(files["input"]),
+            "created_at": 0,
+            "filename": "requests.jsonl",
+            "purpose": "batch",
+            "status": "processed",
+        }
+
+    @app.post("/v1/batches")
+    async def create_batch():
+        output = []
+        for line in files["input"].splitlines():
+            entry = json.loads(line)
+            slide = entry["body"]["messages"][1]["content"]
+            status_code = 500 if entry["custom_id"] in failed_custom_ids else 200
+            output.append(
+                {
+                    "id": f"response-{entry['custom_id']}",
+                    "custom_id": entry["custom_id"],
+                    "response": {
+                        "status_code": status_code,
+                        "body": {
+                            "choices": [
+                                {"message": {"content": json.dumps({"title": slide})}}
+                            ]
+                        },
+                    },
+                }
+            )
+        files["output"] = "\n".join(json.dumps(each) for each in output)
+        return {
+            "id": "batch-1",
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+            "created_at": 0,
+            "input_file_id": "file-input",
+            "output_file_id": "file-output",
+            "status": "completed",
+        }
+
+    @app.get("/v1/files/file-output/content")
+    async def get_file_content():
+        return PlainTextResponse(files["output"])
+
+    return app
+
+
+def _anthropic_batch_app():
+    app = FastAPI()
+    batch = {}
+
+    @app.post("/v1/messages/batches")
+    async def create_batch(request: Request):
+        batch["requests"] = (await request.json())["requests"]
+        return {
+            "id": "msgbatch-1",
+            "type": "message_batch",
+            "processing_status": "in_progress",
+            "request_counts": {
+                "processing": len(batch["requests"]),
+                "succeeded": 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2025-01-01T00:00:00Z",
+            "expires_at": "2025-01-02T00:00:00Z",
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "ended_at": None,
+            "results_url": None,
+        }
+
+    @app.get("/v1/messages/batches/msgbatch-1")
+    async def retrieve_batch():
+        return {
+            "id": "msgbatch-1",
+            "type": "message_batch",
+            "processing_status": "ended",
+            "request_counts": {
+                "processing": 0,
+                "succeeded": len(batch["requests"]),
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2025-01-01T00:00:00Z",
+            "expires_at": "2025-01-02T00:00:00Z",
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "ended_at": "2025-01-01T01:00:00Z",
+            "results_url": "http://stand-in/v1/messages/batches/msgbatch-1/results",
+        }
+
+    @app.get("/v1/messages/batches/msgbatch-1/results")
+    async def get_results():
+        results = []
+        for each in batch["requests"]:
+            slide = each["params"]["messages"][0]["content"]
+            results.append(
+                {
+                    "custom_id": each["custom_id"],
+                    "result": {
+                        "type": "succeeded",
+                        "message": {
+                            "id": f"msg-{each['custom_id']}",
+                            "type": "message",
+                            "role": "assistant",
+                            "model": each["params"]["model"],
+                            "stop_reason": "tool_use",
+                            "stop_sequence": None,
+                            "usage": {"input_tokens": 1, "output_tokens": 1},
+                            "content": [
+                                {
+                                    "type": "tool_use",
+                                    "id": f"tool-{each['custom_id']}",
+                                    "name": "ResponseSchema",
+                                    "input": {"title": slide},
+                                }
+                            ],
+                        },
+                    },
+                }
+            )
+        return PlainTextResponse("\n".join(json.dumps(each) for each in results))
+
+    return app
+
+
+def test_openai_batch_maps_results_back_by_index():
+    async def run():
+        with patch.dict(os.environ, {"LLM": "openai", "OPENAI_API_KEY": "test"}):
+            client = LLMClient()
+        client._client = AsyncOpenAI(
+            api_key="test",
+            base_url="http://stand-in/v1",
+            http_client=httpx.AsyncClient(
+                transport=httpx.ASGITransport(
+                    app=_openai_batch_app(failed_custom_ids={"request-1"})
+                )
+            ),
+        )
+        return await client.generate_structured_batch("gpt-4.1", _requests(3))
+
+    assert asyncio.run(run()) == [{"title": "Slide 0"}, None, {"title": "Slide 2"}]
+
+
+def test_anthropic_batch_maps_results_back_by_index():
+    async def run():
+        with patch.dict(os.environ, {"LLM": "anthropic", "ANTHROPIC_API_KEY": "test"}):
+            client = LLMClient()
+        client._client = AsyncAnthropic(
+            api_key="test",
+            base_url="http://stand-in",
+            http_client=httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=_anthropic_batch_app())
+            ),
+        )
+        with patch("services.llm_client.LLM_BATCH_POLL_INTERVAL", 0):
+            return await client.generate_structured_batch("claude", _requests(3))
+
+    assert asyncio.run(run()) == [{"title": f"Slide {i}"} for i in range(3)]
+
+
+def test_bulk_generation_falls_back_to_realtime_for_missing_slides():
+    layouts = [SlideLayoutModel(id=f"layout-{i}", json_schema={}) for i in range(3)]
+    outlines = [SlideOutlineModel(content=f"Slide {i}") for i in range(3)]
+
+    async def fake_bulk(slide_layouts, slide_outlines, *args):
+        return [
+            None if outline.content == "Slide 1" else {"title": outline.content}
+            for outline in slide_outlines
+        ]
+
+    async def fake_slide_content(slide_layout, outline, *args):
+        return {"title": outline.content, "realtime": True}
+
+    async def run():
+        return {
+            index: content
+            async for index, content, _ in generate_slide_contents(
+                layouts, outlines, "English", bulk=True
+            )
+        }
+
+    with patch(
+        "utils.slide_generation.get_slide_contents_in_bulk", side_effect=fake_bulk
+    ), patch(
+        "utils.slide_generation.get_slide_content_from_type_and_outline",
+        side_effect=fake_slide_content,
+    ):
+        results = asyncio.run(run())
+
+    assert results == {
+        0: {"title": "Slide 0"},
+        1: {"title": "Slide 1", "realtime": True},
+        2: {"title": "Slide 2"},
+    }
+
+
+def test_sync_generation_rejects_bulk_mode():
+    request = GeneratePresentationRequest(
+        content="Solar energy", generation_mode="bulk"
+    )
+
+    with patch(
+        "api.v1.ppt.endpoints.presentation.check_if_api_request_is_valid"
+    ) as check_request:
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(generate_presentation_sync(request, sql_session=None))
+
+    assert error.value.status_code == 400
+    check_request.assert_not_called()
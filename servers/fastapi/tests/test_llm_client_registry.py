@@ -0,0 +1,72 @@
+import asyncio
+import os
+import threading
+from unittest.mock import patch
+
+from enums.llm_provider import LLMProvider
+from services.llm_client import LLMClient, LLMClientRegistry
+
+
+def test_llm_clients_share_pooled_provider_client():
+    registry = LLMClientRegistry()
+
+    async def run():
+        with patch("services.llm_client.LLM_CLIENT_REGISTRY", registry):
+            with patch.dict(os.environ, {"LLM": "openai", "OPENAI_API_KEY": "key-1"}):
+                first = LLMClient()
+                second = LLMClient()
+            with patch.dict(os.environ, {"LLM": "openai", "OPENAI_API_KEY": "key-2"}):
+                third = LLMClient()
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert first._client is second._client
+    assert third._client is not first._client
+
+    stats = registry.get_stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.evictions == 1
+    assert [each.provider for each in stats.clients] == ["openai"]
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed_on = None
+
+    async def close(self):
+        self.closed_on = asyncio.get_running_loop()
+
+
+def test_evicted_clients_are_closed_on_their_loop():
+    registry = LLMClientRegistry()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+
+    async def get_client(api_key):
+        return registry.get_client(LLMProvider.OPENAI, None, api_key, FakeClient)
+
+    async def run():
+        first = await get_client("key-1")
+        second = await get_client("key-2")
+        # Created on another loop, so its close has to run there
+        third = asyncio.run_coroutine_threadsafe(
+            get_client("key-3"), other_loop
+        ).result()
+        await get_client("key-4")
+        await asyncio.sleep(0.05)
+        return first, second, third, asyncio.get_running_loop()
+
+    try:
+        first, second, third, loop = asyncio.run(run())
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+    assert first.closed_on is loop
+    assert second.closed_on is loop
+    assert third.closed_on is other_loop
+    assert registry.get_stats().evictions == 3
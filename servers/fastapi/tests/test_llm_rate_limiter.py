@@ -0,0 +1,170 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from services.llm_rate_limiter import LLMRateLimiter, record_llm_usage
+
+
+class FakeRateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after: str):
+        super().__init__("Too many requests")
+        self.response = type("Response", (), {"headers": {"retry-after": retry_after}})
+
+
+def test_rate_limiter_caps_concurrency(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "2")
+    limiter = LLMRateLimiter()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def call():
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(
+            *[limiter.run("openai", "gpt-4.1", call) for _ in range(6)]
+        )
+
+    assert asyncio.run(run()) == ["ok"] * 6
+    assert max_in_flight == 2
+
+
+def test_rate_limiter_retries_with_retry_after_and_halves_concurrency(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "8")
+    limiter = LLMRateLimiter()
+    attempts = 0
+
+    async def call():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise FakeRateLimitError("0.05")
+        return "ok"
+
+    async def run():
+        return await limiter.run("custom", "llama", call)
+
+    with patch("services.llm_rate_limiter.random.uniform", return_value=1.0):
+        assert asyncio.run(run()) == "ok"
+
+    stats = limiter.get_stats().limits[0]
+    assert attempts == 2
+    assert (stats.rate_limited, stats.retries) == (1, 1)
+    assert stats.concurrency_limit == 4
+    assert stats.in_flight == 0
+
+
+def test_rate_limiter_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_RETRIES", "1")
+    limiter = LLMRateLimiter()
+
+    async def call():
+        raise FakeRateLimitError("0")
+
+    with pytest.raises(FakeRateLimitError):
+        asyncio.run(limiter.run("openai", "gpt-4.1", call))
+
+
+def test_rate_limiter_does_not_retry_stream_after_first_chunk():
+    limiter = LLMRateLimiter()
+    attempts = 0
+
+    async def get_stream():
+        nonlocal attempts
+        attempts += 1
+        yield "chunk"
+        raise FakeRateLimitError("0")
+
+    async def run():
+        return [each async for each in limiter.stream("openai", "gpt-4.1", get_stream)]
+
+    with pytest.raises(FakeRateLimitError):
+        asyncio.run(run())
+    assert attempts == 1
+
+
+def test_rate_limiter_per_model_overrides(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "10")
+    monkeypatch.setenv(
+        "LLM_RATE_LIMITS",
+        '{"openai": {"tokens_per_minute": 1000}, "openai:gpt-4o": {"max_concurrency": 3}}',
+    )
+    limiter = LLMRateLimiter()
+
+    assert limiter.get_config("openai", "gpt-4o").max_concurrency == 3
+    assert limiter.get_config("openai", "gpt-4.1").max_concurrency == 10
+    assert limiter.get_config("openai", "gpt-4.1").tokens_per_minute == 1000
+    assert limiter.get_config("google", "gemini").tokens_per_minute is None
+
+
+def test_rate_limiter_hands_slots_over_in_fifo_order(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "1")
+    limiter = LLMRateLimiter()
+    started = []
+    late_tasks = []
+
+    def get_call(name):
+        async def call():
+            started.append(name)
+            await asyncio.sleep(0.01)
+            if name == 0:
+                # Starts right as the slot is released, before the waiters run
+                late_tasks.append(
+                    asyncio.create_task(limiter.run("openai", "gpt-4.1", get_call(3)))
+                )
+            return name
+
+        return call
+
+    async def run():
+        tasks = [
+            asyncio.create_task(limiter.run("openai", "gpt-4.1", get_call(name)))
+            for name in range(3)
+        ]
+        await asyncio.gather(*tasks)
+        await asyncio.gather(*late_tasks)
+
+    asyncio.run(run())
+    assert started == [0, 1, 2, 3]
+    assert limiter.get_stats().limits[0].in_flight == 0
+
+
+def test_rate_limiter_reconciles_tokens_with_reported_usage(monkeypatch):
+    monkeypatch.setenv("LLM_TOKENS_PER_MINUTE", "1000")
+    limiter = LLMRateLimiter()
+
+    def get_call(used_tokens):
+        async def call():
+            record_llm_usage(used_tokens)
+            return "ok"
+
+        return call
+
+    async def get_stream():
+        yield "chunk"
+        record_llm_usage(50)
+
+    async def run():
+        await limiter.run("openai", "gpt-4.1", get_call(100), estimated_tokens=400)
+        refunded = limiter.get_stats().limits[0].available_tokens
+        await limiter.run("openai", "gpt-4.1", get_call(500), estimated_tokens=100)
+        charged = limiter.get_stats().limits[0].available_tokens
+        async for _ in limiter.stream(
+            "openai", "gpt-4.1", get_stream, estimated_tokens=250
+        ):
+            pass
+        streamed = limiter.get_stats().limits[0].available_tokens
+        return refunded, charged, streamed
+
+    refunded, charged, streamed = asyncio.run(run())
+    assert refunded == pytest.approx(900, abs=1)
+    assert charged == pytest.approx(400, abs=1)
+    assert streamed == pytest.approx(350, abs=1)
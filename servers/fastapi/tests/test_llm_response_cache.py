@@ -0,0 +1,72 @@
+import asyncio
+
+from models.llm_message import LLMSystemMessage, LLMUserMessage
+from services.llm_response_cache import LLMResponseCache
+
+
+def _messages(current_time: str, content: str = "Create an outline"):
+    return [
+        LLMSystemMessage(content=f"Current date and time: {current_time}"),
+        LLMUserMessage(content=content),
+    ]
+
+
+def test_cache_key_ignores_only_the_injected_current_time():
+    cache = LLMResponseCache()
+    schema = {"type": "object"}
+
+    def get_key(current_time, content="Create an outline", model="gpt-4.1"):
+        return cache.get_key(
+            "openai", model, _messages(current_time, content), schema, False
+        )
+
+    first = get_key("2025-01-01 10:00:00")
+
+    assert first == get_key("2025-06-30 23:59:59")
+    assert first != get_key("2025-01-01 10:00:00", model="gpt-4o")
+    # Whitespace and timestamps in the content are part of the prompt
+    assert first != get_key("2025-01-01 10:00:00", "Create   an\noutline")
+    assert get_key(
+        "2025-01-01 10:00:00", "| a | b |\n|---|---|"
+    ) != get_key("2025-01-01 10:00:00", "| a | b |\n| --- | --- |")
+    assert get_key(
+        "2025-01-01 10:00:00", "Launch on 2025-03-01 09:00:00"
+    ) != get_key("2025-01-01 10:00:00", "Launch on 2025-04-01 09:00:00")
+
+
+def test_cache_key_ignores_current_time_of_slide_prompts():
+    cache = LLMResponseCache()
+
+    def get_key(current_time):
+        messages = [
+            LLMSystemMessage(
+                content=f"""
+        ## Current Date and Time
+        {current_time}
+
+        ## Rules
+        - Keep   indentation
+        """
+            )
+        ]
+        return cache.get_key("openai", "gpt-4.1", messages, {}, False)
+
+    assert get_key("2025-01-01 10:00:00") == get_key("2025-06-30 23:59:59")
+
+
+def test_cache_roundtrip_and_stats(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "true")
+    cache = LLMResponseCache()
+
+    async def run():
+        assert await cache.get("key") is None
+        await cache.set("key", {"title": "Hello"})
+        return await cache.get("key")
+
+    assert asyncio.run(run()) == {"title": "Hello"}
+
+    stats = cache.get_stats()
+    assert stats.enabled
+    assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+    assert stats.entries == 1
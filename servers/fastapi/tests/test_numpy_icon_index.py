@@ -0,0 +1,116 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import numpy as np
+
+from services.icon_finder_service import IconFinderService
+from services.numpy_icon_index import NumpyIconIndex
+
+VOCABULARY = ["chart", "rocket", "team", "money", "growth", "people"]
+
+ICONS = [
+    {"name": "chart-bold", "tags": "growth"},
+    {"name": "rocket-bold", "tags": "launch"},
+    {"name": "users-bold", "tags": "team people"},
+    {"name": "coins-bold", "tags": "money"},
+    {"name": "coins-light", "tags": "money"},
+]
+
+
+def embed(texts):
+    return [
+        [float(word in text.lower()) + 0.01 for word in VOCABULARY] for text in texts
+    ]
+
+
+def test_numpy_icon_index_round_trips_through_memory_mapped_file(tmp_path):
+    embeddings_path = str(tmp_path / "icon_embeddings.npy")
+    index = NumpyIconIndex.build(
+        ["chart-bold", "users-bold", "coins-bold"],
+        ["chart-bold growth", "users-bold team people", "coins-bold money"],
+        embed,
+    )
+    index.save(embeddings_path)
+
+    loaded = NumpyIconIndex.load(embeddings_path, embed)
+
+    assert isinstance(loaded.embeddings, np.memmap)
+    assert np.allclose(np.linalg.norm(loaded.embeddings, axis=1), 1)
+    result = loaded.query(["money", "team of people", "growth chart"], n_results=2)
+    assert [ids[0] for ids in result["ids"]] == [
+        "coins-bold",
+        "users-bold",
+        "chart-bold",
+    ]
+    assert all(len(ids) == 2 for ids in result["ids"])
+    assert loaded.query(["money"], n_results=10)["ids"][0][0] == "coins-bold"
+    assert NumpyIconIndex.load(str(tmp_path / "missing.npy"), embed) is None
+
+
+def test_icon_finder_service_uses_numpy_backend(tmp_path):
+    service = IconFinderService()
+    service.embedding_function = embed
+
+    with patch.dict(
+        os.environ,
+        {
+            "ICON_SEARCH_BACKEND": "numpy",
+            "ICON_EMBEDDINGS_PATH": str(tmp_path / "icon_embeddings.npy"),
+        },
+    ), patch.object(IconFinderService, "_load_icon_seed", return_value=ICONS):
+        urls = asyncio.run(service.search_icons_batch(["Money", "rocket"]))
+
+    assert isinstance(service.collection, NumpyIconIndex)
+    assert service.collection.ids == [
+        "chart-bold",
+        "rocket-bold",
+        "users-bold",
+        "coins-bold",
+    ]
+    assert urls == [
+        ["/static/icons/bold/coins-bold.svg"],
+        ["/static/icons/bold/rocket-bold.svg"],
+    ]
+    assert os.path.exists(tmp_path / "icon_embeddings.json")
+
+
+def test_icon_embeddings_artifact_is_loaded_instead_of_re_embedding(tmp_path):
+    embedded = []
+
+    def counting_embed(texts):
+        embedded.extend(texts)
+        return embed(texts)
+
+    env = {
+        "ICON_SEARCH_BACKEND": "numpy",
+        "ICON_EMBEDDINGS_PATH": str(tmp_path / "icon_embeddings.npy"),
+    }
+    with patch.dict(os.environ, env), patch.object(
+        IconFinderService, "_load_icon_seed", return_value=ICONS
+    ):
+        builder = IconFinderService()
+        builder.embedding_function = counting_embed
+        assert len(builder.build_icon_embeddings().ids) == 4
+
+        embedded.clear()
+        service = IconFinderService()
+        service.embedding_function = counting_embed
+
+        async def run():
+            service.warm_up()
+            await service._warm_up_task
+            return await service.search_icons("money")
+
+        assert asyncio.run(run()) == ["/static/icons/bold/coins-bold.svg"]
+        # Only the query was embedded, the icons came from the artifact
+        assert embedded == ["money"]
+
+    # Icons changed since the artifact was built, so it is rebuilt
+    with patch.dict(os.environ, env), patch.object(
+        IconFinderService, "_load_icon_seed", return_value=ICONS[:2]
+    ):
+        service = IconFinderService()
+        service.embedding_function = embed
+        assert service._initialize_icons_collection()
+        assert service.collection.ids == ["chart-bold", "rocket-bold"]
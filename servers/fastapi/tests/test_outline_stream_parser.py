@@ -0,0 +1,34 @@
+import json
+
+from utils.outline_stream_parser import OutlineStreamParser
+
+
+def test_outline_stream_parser_emits_slides_as_objects_close():
+    outlines = {
+        "slides": [
+            {"content": "# Title\n\nA {braced} \"quoted\" intro"},
+            {"content": "Second slide with [brackets] and a \\ backslash"},
+            {"content": "Closing slide"},
+        ]
+    }
+    text = json.dumps(outlines)
+    parser = OutlineStreamParser()
+
+    emitted_at = []
+    for position in range(0, len(text), 7):
+        for slide in parser.feed(text[position : position + 7]):
+            emitted_at.append((slide.content, position))
+
+    assert [content for content, _ in emitted_at] == [
+        slide["content"] for slide in outlines["slides"]
+    ]
+    # The first slide is available long before the stream ends
+    assert emitted_at[0][1] < text.index("Second slide")
+
+
+def test_outline_stream_parser_ignores_incomplete_slide():
+    parser = OutlineStreamParser()
+
+    assert parser.feed('{"slides": [{"content": "First"}, {"content": "Sec') != []
+    assert parser.slides[0].content == "First"
+    assert len(parser.slides) == 1
@@ -0,0 +1,100 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+from services.documents_loader import DocumentsLoader
+from services.parsed_document_cache import ParsedDocumentCache
+
+
+def _write(path, content):
+    path.write_text(content)
+    return str(path)
+
+
+def test_documents_with_same_content_are_parsed_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path / "app_data"))
+    first = _write(tmp_path / "report.pdf", "same bytes")
+    reupload = _write(tmp_path / "report-copy.pdf", "same bytes")
+    other = _write(tmp_path / "other.pdf", "other bytes")
+    parsed = []
+
+    async def fake_parse(file_path, timeout=None):
+        parsed.append(os.path.basename(file_path))
+        await asyncio.sleep(0.01)
+        return f"markdown of {os.path.basename(file_path)}"
+
+    cache = ParsedDocumentCache()
+    with patch(
+        "services.documents_loader.PARSED_DOCUMENT_CACHE", cache
+    ), patch(
+        "services.documents_loader.DOCLING_PROCESS_POOL.parse_to_markdown",
+        side_effect=fake_parse,
+    ):
+        loader = DocumentsLoader([first, reupload, other])
+        asyncio.run(loader.load_documents())
+        # A later run, e.g. the outline stage of the same deck
+        later = DocumentsLoader([reupload])
+        asyncio.run(later.load_documents())
+
+    assert parsed == ["report.pdf", "other.pdf"]
+    assert loader.documents == [
+        "markdown of report.pdf",
+        "markdown of report.pdf",
+        "markdown of other.pdf",
+    ]
+    assert later.documents == ["markdown of report.pdf"]
+    stats = cache.get_stats()
+    assert (stats.entries, stats.hits, stats.misses) == (2, 1, 2)
+
+    # Entries survive restarts
+    restarted = ParsedDocumentCache()
+    assert restarted.get_stats().entries == 2
+
+
+def test_page_images_are_cached_and_least_recently_used_evicted(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path / "app_data"))
+    monkeypatch.setenv("PARSED_DOCUMENT_CACHE_MAX_SIZE", "30")
+    files = [_write(tmp_path / f"{i}.pdf", f"pdf {i}") for i in range(3)]
+    renders = []
+
+    def render(file_path, temp_dir):
+        async def inner():
+            renders.append(file_path)
+            image_paths = []
+            for page in (1, 2):
+                image_path = os.path.join(temp_dir, f"page_{page}.png")
+                with open(image_path, "w") as f:
+                    f.write(f"image {page}")
+                image_paths.append(image_path)
+            return image_paths
+
+        return inner
+
+    cache = ParsedDocumentCache()
+
+    async def run(file_path):
+        temp_dir = tmp_path / "temp" / os.path.basename(file_path)
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        return await cache.get_page_images(
+            file_path, str(temp_dir), render(file_path, str(temp_dir))
+        )
+
+    asyncio.run(run(files[0]))
+    asyncio.run(run(files[1]))
+    cached = asyncio.run(run(files[0]))
+    # Each entry is 14 bytes, so storing a third evicts the least recent one
+    asyncio.run(run(files[2]))
+    asyncio.run(run(files[1]))
+
+    assert renders == [files[0], files[1], files[2], files[1]]
+    assert [os.path.basename(each) for each in cached] == [
+        "page_1.png",
+        "page_2.png",
+    ]
+    with open(cached[1]) as f:
+        assert f.read() == "image 2"
+    stats = cache.get_stats()
+    assert stats.evictions == 2
+    assert stats.size_bytes <= 30
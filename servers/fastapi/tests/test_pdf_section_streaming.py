@@ -0,0 +1,56 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+from PIL import Image
+
+from services.documents_loader import DocumentsLoader
+
+
+def _write_pdf(path, pages: int) -> str:
+    images = [Image.new("RGB", (100, 100), "white") for _ in range(pages)]
+    images[0].save(path, save_all=True, append_images=images[1:])
+    return str(path)
+
+
+async def fake_parse(file_path, page_range=None, timeout=None):
+    # Later sections finish first, they still come out in page order
+    await asyncio.sleep(0.05 / page_range[0])
+    return f"pages {page_range[0]}-{page_range[1]}"
+
+
+def test_pdf_sections_stream_in_page_order(tmp_path):
+    pdf_path = _write_pdf(tmp_path / "report.pdf", 25)
+    loader = DocumentsLoader([pdf_path])
+
+    async def run():
+        return [each async for each in loader.stream_pdf_sections(pdf_path)]
+
+    with patch.dict(os.environ, {"DOCLING_MAX_WORKERS": "3"}), patch(
+        "services.documents_loader.DOCLING_PROCESS_POOL.parse_to_markdown",
+        side_effect=fake_parse,
+    ) as parse:
+        sections = asyncio.run(run())
+
+    assert sections == ["pages 1-10", "pages 11-20", "pages 21-25"]
+    assert parse.call_count == 3
+
+
+def test_outline_context_uses_first_pages_of_pdf(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path / "app_data"))
+    pdf_path = _write_pdf(tmp_path / "report.pdf", 45)
+    loader = DocumentsLoader([pdf_path])
+
+    with patch(
+        "services.documents_loader.DOCLING_PROCESS_POOL.parse_to_markdown",
+        side_effect=fake_parse,
+    ) as parse:
+        asyncio.run(loader.load_documents(max_pdf_pages=15))
+        full = DocumentsLoader([pdf_path])
+        asyncio.run(full.load_documents())
+
+    assert loader.documents == ["pages 1-10\n\npages 11-15"]
+    assert full.documents == [
+        "pages 1-10\n\npages 11-20\n\npages 21-30\n\npages 31-40\n\npages 41-45"
+    ]
+    assert parse.call_count == 7
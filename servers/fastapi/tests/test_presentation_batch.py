@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from api.v1.ppt.endpoints.presentation import generate_presentation_batch_handler
+from models.generate_presentation_batch_request import (
+    GeneratePresentationBatchRequest,
+)
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_and_path import PresentationAndPath
+from models.presentation_layout import PresentationLayoutModel, SlideLayoutModel
+from models.sql.image_asset import ImageAsset
+from models.sql.presentation import PresentationModel
+from models.sql.presentation_generation_batch import PresentationGenerationBatchModel
+from models.sql.slide import SlideModel
+
+
+async def _get_session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: SQLModel.metadata.create_all(
+                sync_conn,
+                tables=[
+                    PresentationModel.__table__,
+                    SlideModel.__table__,
+                    ImageAsset.__table__,
+                    PresentationGenerationBatchModel.__table__,
+                ],
+            )
+        )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def test_batch_shares_layout_fetch_and_reports_each_presentation():
+    layout = PresentationLayoutModel(
+        name="general",
+        ordered=True,
+        slides=[SlideLayoutModel(id=f"layout-{i}", json_schema={}) for i in range(2)],
+    )
+    batch_request = GeneratePresentationBatchRequest(
+        presentations=[
+            GeneratePresentationRequest(content="Solar", slides_markdown=["A", "B"]),
+            GeneratePresentationRequest(content="Wind", slides_markdown=["C", "D"]),
+            GeneratePresentationRequest(content="Fail", slides_markdown=["E", "F"]),
+        ],
+        concurrency=2,
+    )
+    layout_fetches = []
+
+    async def fake_slide_content(slide_layout, outline, *args):
+        if outline.content == "E":
+            raise HTTPException(status_code=500, detail="LLM API error")
+        return {"title": outline.content}
+
+    async def fake_fetch_assets(image_generation_service, slide):
+        return []
+
+    async def fake_get_layout(name):
+        layout_fetches.append(name)
+        await asyncio.sleep(0.01)
+        return layout
+
+    async def fake_export(presentation_id, title, export_as):
+        return PresentationAndPath(presentation_id=presentation_id, path="/tmp/x")
+
+    async def run():
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            batch = PresentationGenerationBatchModel(status="pending", total=3)
+            sql_session.add(batch)
+            await sql_session.commit()
+
+        events = asyncio.Queue()
+        with patch(
+            "api.v1.ppt.endpoints.presentation.async_session_maker", session_maker
+        ):
+            await generate_presentation_batch_handler(batch_request, batch.id, events)
+
+        collected = []
+        while not events.empty():
+            collected.append(events.get_nowait())
+        async with session_maker() as sql_session:
+            return collected, await sql_session.get(
+                PresentationGenerationBatchModel, batch.id
+            )
+
+    with (
+        patch(
+            "utils.slide_generation.get_slide_content_from_type_and_outline",
+            side_effect=fake_slide_content,
+        ),
+        patch(
+            "utils.slide_generation.process_slide_and_fetch_assets",
+            side_effect=fake_fetch_assets,
+        ),
+        patch(
+            "api.v1.ppt.endpoints.presentation.get_layout_by_name",
+            side_effect=fake_get_layout,
+        ),
+        patch(
+            "api.v1.ppt.endpoints.presentation.export_presentation",
+            side_effect=fake_export,
+        ),
+        patch("api.v1.ppt.endpoints.presentation.CONCURRENT_SERVICE", MagicMock()),
+    ):
+        events, batch = asyncio.run(run())
+
+    assert layout_fetches == ["general"]
+    assert events[-1] is None
+    assert (batch.status, batch.completed, batch.failed) == ("completed", 2, 1)
+    assert [each["status"] for each in batch.results] == [
+        "completed",
+        "completed",
+        "failed",
+    ]
+    assert batch.results[2]["presentation_id"] is not None
@@ -0,0 +1,202 @@
+import asyncio
+from datetime import datetime, timedelta
+import json
+import os
+from unittest.mock import patch
+import uuid
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from enums.presentation_generation_stage import PresentationGenerationStage
+from models.api_error_model import APIErrorModel
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.sql.async_presentation_generation_status import (
+    AsyncPresentationGenerationTaskModel,
+)
+from services.presentation_generation_queue import (
+    PRESENTATION_GENERATION_QUEUE,
+    PresentationGenerationQueue,
+)
+from services.presentation_generation_worker import PresentationGenerationWorker
+from utils.db_utils import add_missing_columns
+
+
+async def _get_session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: SQLModel.metadata.create_all(
+                sync_conn, tables=[AsyncPresentationGenerationTaskModel.__table__]
+            )
+        )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def test_queue_claims_each_task_once():
+    queue = PresentationGenerationQueue()
+
+    async def run():
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            task = await queue.enqueue(
+                sql_session,
+                GeneratePresentationRequest(content="Solar energy"),
+                uuid.uuid4(),
+            )
+
+        async with session_maker() as sql_session:
+            first = await queue.claim(sql_session, "worker-1", 5)
+        async with session_maker() as sql_session:
+            second = await queue.claim(sql_session, "worker-2", 5)
+        async with session_maker() as sql_session:
+            claimed = await sql_session.get(AsyncPresentationGenerationTaskModel, task.id)
+        return task, first, second, claimed
+
+    task, first, second, claimed = asyncio.run(run())
+
+    assert first == [task.id]
+    assert second == []
+    assert claimed.lease_owner == "worker-1"
+    assert claimed.attempts == 1
+    assert claimed.request["content"] == "Solar energy"
+    dumped = claimed.model_dump()
+    for field in ("request", "attempts", "lease_owner", "lease_expires_at"):
+        assert field not in dumped
+
+
+def test_queue_reclaims_task_with_expired_lease():
+    queue = PresentationGenerationQueue()
+
+    async def run():
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            task = await queue.enqueue(
+                sql_session,
+                GeneratePresentationRequest(content="Solar energy"),
+                uuid.uuid4(),
+            )
+            await queue.claim(sql_session, "worker-1", 1)
+
+            # Worker 1 stopped renewing its lease
+            task.lease_expires_at = datetime.now() - timedelta(seconds=1)
+            sql_session.add(task)
+            await sql_session.commit()
+
+            reclaimed = await queue.claim(sql_session, "worker-2", 1)
+            renewed = await queue.renew_lease(sql_session, task.id, "worker-1")
+        return task, reclaimed, renewed
+
+    task, reclaimed, renewed = asyncio.run(run())
+
+    assert reclaimed == [task.id]
+    assert not renewed
+
+
+def test_queue_retries_until_max_attempts(monkeypatch):
+    monkeypatch.setenv("PRESENTATION_GENERATION_MAX_ATTEMPTS", "2")
+    queue = PresentationGenerationQueue()
+    error = APIErrorModel(status_code=500, detail="LLM API error")
+
+    async def run():
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            task = await queue.enqueue(
+                sql_session,
+                GeneratePresentationRequest(content="Solar energy"),
+                uuid.uuid4(),
+            )
+            await queue.claim(sql_session, "worker-1", 1)
+            await sql_session.refresh(task)
+            queue.set_stage_completed(
+                sql_session, task, PresentationGenerationStage.OUTLINES
+            )
+            await sql_session.commit()
+
+            first_retry = await queue.retry_later(sql_session, task, error)
+            task.attempts = 2
+            second_retry = await queue.retry_later(sql_session, task, error)
+        return task, first_retry, second_retry
+
+    task, first_retry, second_retry = asyncio.run(run())
+
+    assert first_retry
+    assert not second_retry
+    assert task.lease_owner is None
+    assert task.stage == PresentationGenerationStage.OUTLINES.value
+
+
+def test_tables_of_earlier_versions_get_queue_columns():
+    queue = PresentationGenerationQueue()
+    table = AsyncPresentationGenerationTaskModel.__table__
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(
+                "CREATE TABLE async_presentation_generation_tasks ("
+                "id VARCHAR PRIMARY KEY, status VARCHAR NOT NULL, message VARCHAR, "
+                "error JSON, created_at DATETIME NOT NULL, "
+                "updated_at DATETIME NOT NULL, data JSON)"
+            )
+            await conn.exec_driver_sql(
+                "INSERT INTO async_presentation_generation_tasks VALUES "
+                "('task-old', 'completed', NULL, NULL, '2025-01-01 00:00:00', "
+                "'2025-01-01 00:00:00', NULL)"
+            )
+            for _ in range(2):
+                await conn.run_sync(
+                    lambda sync_conn: add_missing_columns(sync_conn, [table])
+                )
+
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as sql_session:
+            task = await queue.enqueue(
+                sql_session,
+                GeneratePresentationRequest(content="Solar energy"),
+                uuid.uuid4(),
+            )
+        async with session_maker() as sql_session:
+            claimed = await queue.claim(sql_session, "worker-1", 5)
+            old = await sql_session.get(AsyncPresentationGenerationTaskModel, "task-old")
+        return task, claimed, old
+
+    task, claimed, old = asyncio.run(run())
+
+    assert claimed == [task.id]
+    assert old.attempts == 0
+    assert old.slide_timings is None
+
+
+def test_worker_runs_tasks_with_the_user_config(tmp_path, monkeypatch):
+    user_config_path = tmp_path / "userConfig.json"
+    user_config_path.write_text(json.dumps({"LLM": "google"}))
+    monkeypatch.setenv("USER_CONFIG_PATH", str(user_config_path))
+    monkeypatch.setenv("LLM", "openai")
+    monkeypatch.delenv("CAN_CHANGE_KEYS", raising=False)
+    worker = PresentationGenerationWorker()
+    providers = []
+
+    async def handler(request, presentation_id, async_status, sql_session):
+        providers.append(os.environ["LLM"])
+
+    async def run():
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            task = await PRESENTATION_GENERATION_QUEUE.enqueue(
+                sql_session,
+                GeneratePresentationRequest(content="Solar energy"),
+                uuid.uuid4(),
+            )
+        with patch(
+            "services.presentation_generation_worker.async_session_maker",
+            session_maker,
+        ), patch(
+            "api.v1.ppt.endpoints.presentation.generate_presentation_handler",
+            handler,
+        ):
+            await worker._process(task.id)
+
+    asyncio.run(run())
+
+    assert providers == ["google"]
@@ -0,0 +1,177 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+import uuid
+
+from fastapi import HTTPException
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+
+from api.v1.ppt.endpoints.presentation import (
+    generate_presentation_handler,
+    get_all_presentations,
+)
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_and_path import PresentationAndPath
+from models.presentation_layout import PresentationLayoutModel, SlideLayoutModel
+from models.sql.image_asset import ImageAsset
+from models.sql.presentation import PresentationModel
+from models.sql.slide import SlideModel
+
+
+async def _get_session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: SQLModel.metadata.create_all(
+                sync_conn,
+                tables=[
+                    PresentationModel.__table__,
+                    SlideModel.__table__,
+                    ImageAsset.__table__,
+                ],
+            )
+        )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def test_failed_generation_resumes_only_missing_slides():
+    layout = PresentationLayoutModel(
+        name="general",
+        ordered=True,
+        slides=[
+            SlideLayoutModel(id=f"layout-{i}", json_schema={}) for i in range(4)
+        ],
+    )
+    request = GeneratePresentationRequest(
+        content="Solar energy", slides_markdown=["A", "B", "C", "D"]
+    )
+    presentation_id = uuid.uuid4()
+    generated = []
+    fail_slide_c = True
+
+    async def fake_slide_content(slide_layout, outline, *args):
+        if outline.content == "C":
+            await asyncio.sleep(0.05)
+            if fail_slide_c:
+                raise HTTPException(status_code=500, detail="LLM API error")
+        generated.append(outline.content)
+        return {"title": outline.content}
+
+    async def fake_fetch_assets(image_generation_service, slide):
+        return []
+
+    async def fake_get_layout(name):
+        return layout
+
+    async def fake_export(presentation_id, title, export_as):
+        return PresentationAndPath(presentation_id=presentation_id, path="/tmp/x")
+
+    async def run():
+        nonlocal fail_slide_c
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            with pytest.raises(HTTPException):
+                await generate_presentation_handler(
+                    request.model_copy(), presentation_id, None, sql_session
+                )
+            # The partial presentation stays hidden until it is finished
+            assert await get_all_presentations(sql_session) == []
+
+        fail_slide_c = False
+        generated.clear()
+        async with session_maker() as sql_session:
+            await generate_presentation_handler(
+                request.model_copy(), presentation_id, None, sql_session
+            )
+            presentations = await get_all_presentations(sql_session)
+            assert [each.id for each in presentations] == [presentation_id]
+            slides = await sql_session.scalars(
+                select(SlideModel).where(SlideModel.presentation == presentation_id)
+            )
+            return sorted(slide.content["title"] for slide in slides)
+
+    with (
+        patch(
+            "utils.slide_generation.get_slide_content_from_type_and_outline",
+            side_effect=fake_slide_content,
+        ),
+        patch(
+            "utils.slide_generation.process_slide_and_fetch_assets",
+            side_effect=fake_fetch_assets,
+        ),
+        patch(
+            "api.v1.ppt.endpoints.presentation.get_layout_by_name",
+            side_effect=fake_get_layout,
+        ),
+        patch(
+            "api.v1.ppt.endpoints.presentation.export_presentation",
+            side_effect=fake_export,
+        ),
+        patch("api.v1.ppt.endpoints.presentation.CONCURRENT_SERVICE", MagicMock()),
+    ):
+        saved_titles = asyncio.run(run())
+
+    assert generated == ["C"]
+    assert saved_titles == ["A", "B", "C", "D"]
+
+
+def test_failed_generation_cancels_pending_asset_tasks():
+    layout = PresentationLayoutModel(
+        name="general",
+        ordered=True,
+        slides=[
+            SlideLayoutModel(id=f"layout-{i}", json_schema={}) for i in range(2)
+        ],
+    )
+    request = GeneratePresentationRequest(
+        content="Solar energy", slides_markdown=["A", "B"]
+    )
+    cancelled_assets = []
+
+    async def fake_slide_content(slide_layout, outline, *args):
+        if outline.content == "B":
+            await asyncio.sleep(0.05)
+            raise HTTPException(status_code=500, detail="LLM API error")
+        return {"title": outline.content}
+
+    async def fake_fetch_assets(image_generation_service, slide):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled_assets.append(slide.content["title"])
+            raise
+        return []
+
+    async def fake_get_layout(name):
+        return layout
+
+    async def run():
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            with pytest.raises(HTTPException):
+                await asyncio.wait_for(
+                    generate_presentation_handler(
+                        request, uuid.uuid4(), None, sql_session
+                    ),
+                    timeout=5,
+                )
+
+    with (
+        patch(
+            "utils.slide_generation.get_slide_content_from_type_and_outline",
+            side_effect=fake_slide_content,
+        ),
+        patch(
+            "utils.slide_generation.process_slide_and_fetch_assets",
+            side_effect=fake_fetch_assets,
+        ),
+        patch(
+            "api.v1.ppt.endpoints.presentation.get_layout_by_name",
+            side_effect=fake_get_layout,
+        ),
+        patch("api.v1.ppt.endpoints.presentation.CONCURRENT_SERVICE", MagicMock()),
+    ):
+        asyncio.run(run())
+
+    assert cancelled_assets == ["A"]
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from unittest.mock import patch
+import uuid
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from api.v1.ppt.endpoints.presentation import stream_presentation
+from models.presentation_layout import PresentationLayoutModel, SlideLayoutModel
+from models.presentation_outline_model import (
+    PresentationOutlineModel,
+    SlideOutlineModel,
+)
+from models.presentation_structure_model import PresentationStructureModel
+from models.sql.image_asset import ImageAsset
+from models.sql.presentation import PresentationModel
+from models.sql.slide import SlideModel
+
+
+async def _get_session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: SQLModel.metadata.create_all(
+                sync_conn,
+                tables=[
+                    PresentationModel.__table__,
+                    SlideModel.__table__,
+                    ImageAsset.__table__,
+                ],
+            )
+        )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def _stream_events(generate_slide_contents, monkeypatch, tmp_path):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    presentation_id = uuid.uuid4()
+    presentation = PresentationModel(
+        id=presentation_id,
+        content="Solar energy",
+        n_slides=3,
+        language="English",
+        outlines=PresentationOutlineModel(
+            slides=[SlideOutlineModel(content=each) for each in "ABC"]
+        ).model_dump(mode="json"),
+    )
+    presentation.set_layout(
+        PresentationLayoutModel(
+            name="general",
+            ordered=True,
+            slides=[
+                SlideLayoutModel(id=f"layout-{i}", json_schema={}) for i in range(3)
+            ],
+        )
+    )
+    presentation.set_structure(PresentationStructureModel(slides=[0, 1, 2]))
+
+    async def fake_fetch_assets(image_generation_service, slide):
+        # Slides finishing later get their assets first
+        await asyncio.sleep(0.01 * (3 - slide.index))
+        slide.content = {**slide.content, "image": "generated.jpg"}
+        return []
+
+    async def run():
+        session_maker = await _get_session_maker()
+        async with session_maker() as sql_session:
+            sql_session.add(presentation)
+            await sql_session.commit()
+            response = await stream_presentation(
+                presentation_id, parallel=True, sql_session=sql_session
+            )
+            return [chunk async for chunk in response.body_iterator]
+
+    with patch(
+        "api.v1.ppt.endpoints.presentation.generate_slide_contents",
+        generate_slide_contents,
+    ), patch(
+        "api.v1.ppt.endpoints.presentation.process_slide_and_fetch_assets",
+        side_effect=fake_fetch_assets,
+    ):
+        chunks = asyncio.run(run())
+
+    return [
+        json.loads(chunk.split("data: ", 1)[1])
+        for chunk in "".join(chunks).split("\n\n")
+        if chunk
+    ]
+
+
+def test_parallel_stream_sends_slides_as_they_complete(monkeypatch, tmp_path):
+    async def generate_slide_contents(slide_layouts, outlines, *args):
+        for index in (2, 0, 1):
+            await asyncio.sleep(0.005)
+            yield index, {"title": outlines[index].content}, 0.0
+
+    events = _stream_events(generate_slide_contents, monkeypatch, tmp_path)
+
+    slide_events = [
+        (each["type"], each["index"]) for each in events if "index" in each
+    ]
+    assert [index for kind, index in slide_events if kind == "slide"] == [2, 0, 1]
+    for index in range(3):
+        assert slide_events.index(("slide", index)) < slide_events.index(
+            ("patch", index)
+        )
+    for each in events:
+        if each["type"] == "slide":
+            assert each["slide"]["index"] == each["index"]
+            assert "image" not in each["slide"]["content"]
+        elif each["type"] == "patch":
+            assert each["slide"]["content"]["image"] == "generated.jpg"
+
+    complete = events[-1]
+    assert complete["type"] == "complete"
+    assert [
+        slide["content"]["title"] for slide in complete["presentation"]["slides"]
+    ] == ["A", "B", "C"]
+
+
+def test_parallel_stream_ends_with_error_when_a_slide_fails(monkeypatch, tmp_path):
+    async def generate_slide_contents(slide_layouts, outlines, *args):
+        yield 0, {"title": outlines[0].content}, 0.0
+        raise RuntimeError("LLM API error")
+
+    events = _stream_events(generate_slide_contents, monkeypatch, tmp_path)
+
+    assert events[0]["type"] == "slide"
+    assert events[-1] == {"type": "error", "detail": "Slide generation failed"}
+    assert not any(each["type"] == "complete" for each in events)
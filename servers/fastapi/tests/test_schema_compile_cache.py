@@ -0,0 +1,60 @@
+from models.presentation_layout import SlideLayoutModel
+from services.schema_compile_cache import SCHEMA_COMPILE_CACHE, SchemaCompileCache
+from utils.llm_calls.generate_slide_content import get_response_schema
+from utils.schema_utils import ensure_strict_json_schema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "image": {
+            "type": "object",
+            "properties": {
+                "__image_url__": {"type": "string"},
+                "__image_prompt__": {"type": "string"},
+            },
+        },
+    },
+}
+
+
+def test_schema_compile_cache_builds_once_and_hands_out_copies():
+    cache = SchemaCompileCache()
+    builds = []
+
+    def build(schema):
+        builds.append(schema)
+        return ensure_strict_json_schema(schema, path=(), root=schema)
+
+    first = cache.compile(SCHEMA, "openai_strict", build)
+    first["properties"]["title"]["type"] = "number"
+    second = cache.compile(SCHEMA, "openai_strict", build)
+
+    assert len(builds) == 1
+    assert second["additionalProperties"] is False
+    assert second["properties"]["title"]["type"] == "string"
+    # The source schema is never mutated by in-place transforms
+    assert "additionalProperties" not in SCHEMA
+    assert cache.get_stats().model_dump() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_schema_compile_cache_keys_by_kind_and_schema():
+    cache = SchemaCompileCache()
+    changed_schema = {**SCHEMA, "required": ["title"]}
+
+    cache.compile(SCHEMA, "openai_strict", lambda schema: schema)
+    cache.compile(SCHEMA, "google_tool", lambda schema: schema)
+    cache.compile(changed_schema, "openai_strict", lambda schema: schema)
+
+    assert cache.get_stats().misses == 3
+
+
+def test_slide_response_schema_is_compiled_per_layout_schema():
+    slide_layout = SlideLayoutModel(id="intro", json_schema=SCHEMA)
+    SCHEMA_COMPILE_CACHE.clear()
+
+    response_schema = get_response_schema(slide_layout)
+    assert get_response_schema(slide_layout) == response_schema
+    assert "__image_url__" not in str(response_schema)
+    assert "__speaker_note__" in response_schema["required"]
+    assert SCHEMA_COMPILE_CACHE.get_stats().entries == 1
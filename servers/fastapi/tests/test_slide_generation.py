@@ -0,0 +1,112 @@
+import asyncio
+from unittest.mock import patch
+
+from models.presentation_layout import SlideLayoutModel
+from models.presentation_outline_model import SlideOutlineModel
+from utils.slide_generation import (
+    generate_slide_content_with_timing,
+    generate_slide_contents,
+)
+
+
+def _layouts_and_outlines(n: int):
+    layouts = [SlideLayoutModel(id=f"layout-{i}", json_schema={}) for i in range(n)]
+    outlines = [SlideOutlineModel(content=f"Slide {i}") for i in range(n)]
+    return layouts, outlines
+
+
+def test_generate_slide_contents_respects_concurrency_window():
+    layouts, outlines = _layouts_and_outlines(8)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_slide_content(slide_layout, outline, *args):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"title": outline.content}
+
+    async def run():
+        return [
+            each
+            async for each in generate_slide_contents(
+                layouts, outlines, "English", concurrency=3
+            )
+        ]
+
+    with patch(
+        "utils.slide_generation.get_slide_content_from_type_and_outline",
+        side_effect=fake_slide_content,
+    ):
+        results = asyncio.run(run())
+
+    assert max_in_flight == 3
+    assert sorted(index for index, _, _ in results) == list(range(8))
+    for index, content, seconds in results:
+        assert content == {"title": f"Slide {index}"}
+        assert seconds >= 0
+
+
+def test_generate_slide_contents_does_not_wait_for_slow_slide():
+    layouts, outlines = _layouts_and_outlines(4)
+
+    async def fake_slide_content(slide_layout, outline, *args):
+        await asyncio.sleep(0.2 if outline.content == "Slide 0" else 0.01)
+        return {"title": outline.content}
+
+    async def run():
+        return [
+            index
+            async for index, _, _ in generate_slide_contents(
+                layouts, outlines, "English", concurrency=2
+            )
+        ]
+
+    with patch(
+        "utils.slide_generation.get_slide_content_from_type_and_outline",
+        side_effect=fake_slide_content,
+    ):
+        completion_order = asyncio.run(run())
+
+    # Slot freed by slide 1 is reused by slides 2 and 3 while slide 0 is still running
+    assert completion_order == [1, 2, 3, 0]
+
+
+def test_generate_slide_contents_reuses_started_tasks():
+    layouts, outlines = _layouts_and_outlines(3)
+    generated = []
+
+    async def fake_slide_content(slide_layout, outline, *args):
+        generated.append(outline.content)
+        return {"title": outline.content}
+
+    async def run():
+        semaphore = asyncio.Semaphore(2)
+        started_tasks = {
+            0: asyncio.create_task(
+                generate_slide_content_with_timing(
+                    0, layouts[0], outlines[0], "English", None, None, None, semaphore
+                )
+            )
+        }
+        return {
+            index: content
+            async for index, content, _ in generate_slide_contents(
+                layouts,
+                outlines,
+                "English",
+                semaphore=semaphore,
+                started_tasks=started_tasks,
+            )
+        }
+
+    with patch(
+        "utils.slide_generation.get_slide_content_from_type_and_outline",
+        side_effect=fake_slide_content,
+    ):
+        results = asyncio.run(run())
+
+    assert results == {i: {"title": f"Slide {i}"} for i in range(3)}
+    assert sorted(generated) == ["Slide 0", "Slide 1", "Slide 2"]
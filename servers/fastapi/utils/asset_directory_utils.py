@@ -17,3 +17,11 @@ def get_uploads_directory():
     uploads_directory = os.path.join(get_app_data_directory_env(), "uploads")
     os.makedirs(uploads_directory, exist_ok=True)
     return uploads_directory
+
+
+def get_parsed_documents_directory():
+    parsed_documents_directory = os.path.join(
+        get_app_data_directory_env(), "parsed_documents"
+    )
+    os.makedirs(parsed_documents_directory, exist_ok=True)
+    return parsed_documents_directory
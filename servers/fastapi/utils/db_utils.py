@@ -1,4 +1,5 @@
 import os
+from sqlalchemy import Connection, Table, inspect, literal
 from utils.get_env import get_app_data_directory_env, get_database_url_env
 from urllib.parse import urlsplit, urlunsplit, parse_qsl
 import ssl
@@ -46,3 +47,41 @@ def get_database_url_and_connect_args() -> tuple[str, dict]:
         pass
 
     return database_url, connect_args
+
+
+def add_missing_columns(connection: Connection, tables: list[Table]):
+    """
+    Adds columns of the models that are missing in existing tables, as
+    create_all only creates missing tables. Columns are added as nullable,
+    with their scalar default for existing rows.
+    """
+    inspector = inspect(connection)
+    dialect = connection.dialect
+    quote = dialect.identifier_preparer.quote
+    for table in tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing_columns = {
+            each["name"] for each in inspector.get_columns(table.name)
+        }
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            statement = (
+                f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} "
+                f"{column.type.compile(dialect=dialect)}"
+            )
+            if column.default is not None and column.default.is_scalar:
+                default = literal(column.default.arg, column.type).compile(
+                    dialect=dialect, compile_kwargs={"literal_binds": True}
+                )
+                statement += f" DEFAULT {default}"
+            connection.exec_driver_sql(statement)
+            print(f"Added column {column.name} to {table.name}")
+
+        existing_indexes = {
+            each["name"] for each in inspector.get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(connection)
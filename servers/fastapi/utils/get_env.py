@@ -122,3 +122,123 @@ def get_extended_reasoning_env():
 
 def get_web_grounding_env():
     return os.getenv("WEB_GROUNDING")
+
+
+def get_slide_generation_concurrency_env():
+    return os.getenv("SLIDE_GENERATION_CONCURRENCY")
+
+
+def get_llm_response_cache_env():
+    return os.getenv("LLM_RESPONSE_CACHE")
+
+
+def get_llm_response_cache_ttl_env():
+    return os.getenv("LLM_RESPONSE_CACHE_TTL")
+
+
+def get_llm_response_cache_max_size_mb_env():
+    return os.getenv("LLM_RESPONSE_CACHE_MAX_SIZE_MB")
+
+
+def get_llm_max_concurrency_env():
+    return os.getenv("LLM_MAX_CONCURRENCY")
+
+
+def get_llm_requests_per_minute_env():
+    return os.getenv("LLM_REQUESTS_PER_MINUTE")
+
+
+def get_llm_tokens_per_minute_env():
+    return os.getenv("LLM_TOKENS_PER_MINUTE")
+
+
+def get_llm_max_retries_env():
+    return os.getenv("LLM_MAX_RETRIES")
+
+
+def get_llm_rate_limits_env():
+    return os.getenv("LLM_RATE_LIMITS")
+
+
+def get_presentation_worker_concurrency_env():
+    return os.getenv("PRESENTATION_WORKER_CONCURRENCY")
+
+
+def get_presentation_generation_max_attempts_env():
+    return os.getenv("PRESENTATION_GENERATION_MAX_ATTEMPTS")
+
+
+def get_disable_in_process_worker_env():
+    return os.getenv("DISABLE_IN_PROCESS_WORKER")
+
+
+def get_layout_cache_ttl_env():
+    return os.getenv("LAYOUT_CACHE_TTL")
+
+
+def get_http_timeout_env():
+    return os.getenv("HTTP_TIMEOUT")
+
+
+def get_http_max_connections_per_host_env():
+    return os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST")
+
+
+def get_image_search_cache_ttl_env():
+    return os.getenv("IMAGE_SEARCH_CACHE_TTL")
+
+
+def get_generated_image_reuse_threshold_env():
+    return os.getenv("GENERATED_IMAGE_REUSE_THRESHOLD")
+
+
+def get_reuse_generated_images_env():
+    return os.getenv("REUSE_GENERATED_IMAGES")
+
+
+def get_image_generation_concurrency_env():
+    return os.getenv("IMAGE_GENERATION_CONCURRENCY")
+
+
+def get_image_generation_max_retries_env():
+    return os.getenv("IMAGE_GENERATION_MAX_RETRIES")
+
+
+def get_generated_image_format_env():
+    return os.getenv("GENERATED_IMAGE_FORMAT")
+
+
+def get_generated_image_max_size_env():
+    return os.getenv("GENERATED_IMAGE_MAX_SIZE")
+
+
+def get_icon_search_backend_env():
+    return os.getenv("ICON_SEARCH_BACKEND")
+
+
+def get_icon_embeddings_path_env():
+    return os.getenv("ICON_EMBEDDINGS_PATH")
+
+
+def get_docling_max_workers_env():
+    return os.getenv("DOCLING_MAX_WORKERS")
+
+
+def get_docling_parse_timeout_env():
+    return os.getenv("DOCLING_PARSE_TIMEOUT")
+
+
+def get_disable_docling_warm_up_env():
+    return os.getenv("DISABLE_DOCLING_WARM_UP")
+
+
+def get_parsed_document_cache_max_size_env():
+    return os.getenv("PARSED_DOCUMENT_CACHE_MAX_SIZE")
+
+
+def get_outline_context_max_pages_env():
+    return os.getenv("OUTLINE_CONTEXT_MAX_PAGES")
+
+
+def get_outline_context_token_budget_env():
+    return os.getenv("OUTLINE_CONTEXT_TOKEN_BUDGET")
@@ -1,7 +1,13 @@
-from typing import List
+from io import BytesIO
+import mimetypes
+import os
+from typing import List, Optional
+import uuid
 
 from PIL import Image, ImageDraw
 
+from constants.presentation import GENERATED_IMAGE_FORMATS, GENERATED_IMAGE_QUALITY
+
 from models.pptx_models import PptxObjectFitEnum, PptxObjectFitModel
 
 
@@ -256,3 +262,37 @@ def fit_image(
         return image.resize((width, height), Image.LANCZOS)
 
     return image
+
+
+def save_image_bytes(
+    data: bytes,
+    output_directory: str,
+    mime_type: Optional[str] = None,
+    image_format: Optional[str] = None,
+    max_size: Optional[int] = None,
+) -> str:
+    """
+    Saves image bytes to the output directory. Downscales the image so its
+    longest side is at most max_size and transcodes it to image_format
+    (webp or jpeg) when given, otherwise writes the bytes as they are.
+    """
+    pil_format = GENERATED_IMAGE_FORMATS.get((image_format or "").lower())
+    if not pil_format and not max_size:
+        extension = mimetypes.guess_extension(mime_type or "") or ".jpg"
+        image_path = os.path.join(output_directory, f"{uuid.uuid4()}{extension}")
+        with open(image_path, "wb") as f:
+            f.write(data)
+        return image_path
+
+    with Image.open(BytesIO(data)) as image:
+        if max_size:
+            image.thumbnail((max_size, max_size), Image.LANCZOS)
+        format_name, extension = pil_format or (
+            image.format or "PNG",
+            mimetypes.guess_extension(mime_type or "") or ".png",
+        )
+        if format_name == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image_path = os.path.join(output_directory, f"{uuid.uuid4()}{extension}")
+        image.save(image_path, format_name, quality=GENERATED_IMAGE_QUALITY)
+    return image_path
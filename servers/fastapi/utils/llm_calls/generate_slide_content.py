@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from models.llm_message import LLMSystemMessage, LLMUserMessage
 from models.presentation_layout import SlideLayoutModel
 from models.presentation_outline_model import SlideOutlineModel
 from services.llm_client import LLMClient
+from services.schema_compile_cache import SCHEMA_COMPILE_CACHE
 from utils.llm_client_error_handler import handle_llm_client_exceptions
 from utils.llm_provider import get_model
 from utils.schema_utils import add_field_in_schema, remove_fields_from_schema
@@ -98,21 +99,11 @@ def get_messages(
     ]
 
 
-async def get_slide_content_from_type_and_outline(
-    slide_layout: SlideLayoutModel,
-    outline: SlideOutlineModel,
-    language: str,
-    tone: Optional[str] = None,
-    verbosity: Optional[str] = None,
-    instructions: Optional[str] = None,
-):
-    client = LLMClient()
-    model = get_model()
-
+def build_response_schema(json_schema: dict) -> dict:
     response_schema = remove_fields_from_schema(
-        slide_layout.json_schema, ["__image_url__", "__icon_url__"]
+        json_schema, ["__image_url__", "__icon_url__"]
     )
-    response_schema = add_field_in_schema(
+    return add_field_in_schema(
         response_schema,
         {
             "__speaker_note__": {
@@ -125,6 +116,24 @@ async def get_slide_content_from_type_and_outline(
         True,
     )
 
+
+def get_response_schema(slide_layout: SlideLayoutModel) -> dict:
+    return SCHEMA_COMPILE_CACHE.compile(
+        slide_layout.json_schema, "slide_content", build_response_schema
+    )
+
+
+async def get_slide_content_from_type_and_outline(
+    slide_layout: SlideLayoutModel,
+    outline: SlideOutlineModel,
+    language: str,
+    tone: Optional[str] = None,
+    verbosity: Optional[str] = None,
+    instructions: Optional[str] = None,
+):
+    client = LLMClient()
+    model = get_model()
+
     try:
         response = await client.generate_structured(
             model=model,
@@ -135,10 +144,44 @@ async def get_slide_content_from_type_and_outline(
                 verbosity,
                 instructions,
             ),
-            response_format=response_schema,
+            response_format=get_response_schema(slide_layout),
             strict=False,
         )
         return response
 
     except Exception as e:
         raise handle_llm_client_exceptions(e)
+
+
+async def get_slide_contents_in_bulk(
+    slide_layouts: List[SlideLayoutModel],
+    outlines: List[SlideOutlineModel],
+    language: str,
+    tone: Optional[str] = None,
+    verbosity: Optional[str] = None,
+    instructions: Optional[str] = None,
+) -> List[Optional[dict]]:
+    client = LLMClient()
+    model = get_model()
+
+    try:
+        return await client.generate_structured_batch(
+            model=model,
+            requests=[
+                (
+                    get_messages(
+                        outline.content,
+                        language,
+                        tone,
+                        verbosity,
+                        instructions,
+                    ),
+                    get_response_schema(slide_layout),
+                )
+                for slide_layout, outline in zip(slide_layouts, outlines)
+            ],
+            strict=False,
+        )
+
+    except Exception as e:
+        raise handle_llm_client_exceptions(e)
@@ -0,0 +1,73 @@
+from typing import List
+
+import dirtyjson
+
+from models.presentation_outline_model import SlideOutlineModel
+
+
+class OutlineStreamParser:
+    """
+    Incrementally scans a streamed presentation outline JSON
+    ({"slides": [{"content": ...}, ...]}) and returns each slide outline as
+    soon as its object closes, without waiting for the rest of the stream.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._position = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._slide_start = None
+        self.slides: List[SlideOutlineModel] = []
+
+    def feed(self, chunk: str) -> List[SlideOutlineModel]:
+        self._text += chunk
+        new_slides = []
+
+        while self._position < len(self._text):
+            char = self._text[self._position]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+
+            elif char == '"':
+                self._in_string = True
+
+            elif char in "{[":
+                # Slide objects are the objects directly inside the slides array
+                if char == "{" and self._stack == ["{", "["]:
+                    self._slide_start = self._position
+                self._stack.append(char)
+
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if (
+                    char == "}"
+                    and self._stack == ["{", "["]
+                    and self._slide_start is not None
+                ):
+                    slide = self._parse_slide(
+                        self._text[self._slide_start : self._position + 1]
+                    )
+                    self._slide_start = None
+                    if slide:
+                        self.slides.append(slide)
+                        new_slides.append(slide)
+
+            self._position += 1
+
+        return new_slides
+
+    def _parse_slide(self, text: str):
+        try:
+            slide = dict(dirtyjson.loads(text))
+            return SlideOutlineModel(content=slide["content"])
+        except Exception:
+            return None
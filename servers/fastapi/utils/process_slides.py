@@ -9,6 +9,10 @@ from utils.asset_directory_utils import get_images_directory
 from utils.dict_utils import get_dict_at_path, get_dict_paths_with_key, set_dict_at_path
 
 
+def get_icon_url(icon_urls: List[str]) -> str:
+    return icon_urls[0] if icon_urls else "/static/icons/placeholder.svg"
+
+
 async def process_slide_and_fetch_assets(
     image_generation_service: ImageGenerationService,
     slide: SlideModel,
@@ -25,17 +29,20 @@ async def process_slide_and_fetch_assets(
             image_generation_service.generate_image(
                 ImagePrompt(
                     prompt=__image_prompt__parent["__image_prompt__"],
-                )
+                ),
+                # Images of earlier slides are fetched first
+                priority=slide.index,
             )
         )
 
-    for icon_path in icon_paths:
-        __icon_query__parent = get_dict_at_path(slide.content, icon_path)
-        async_tasks.append(
-            ICON_FINDER_SERVICE.search_icons(__icon_query__parent["__icon_query__"])
-        )
+    # All icons of the slide are resolved with one batched search
+    icon_queries = [
+        get_dict_at_path(slide.content, icon_path)["__icon_query__"]
+        for icon_path in icon_paths
+    ]
+    async_tasks.append(ICON_FINDER_SERVICE.search_icons_batch(icon_queries))
 
-    results = await asyncio.gather(*async_tasks)
+    *results, icon_results = await asyncio.gather(*async_tasks)
     results.reverse()
 
     return_assets = []
@@ -49,9 +56,9 @@ async def process_slide_and_fetch_assets(
             image_dict["__image_url__"] = result
         set_dict_at_path(slide.content, image_path, image_dict)
 
-    for icon_path in icon_paths:
+    for icon_path, icon_result in zip(icon_paths, icon_results):
         icon_dict = get_dict_at_path(slide.content, icon_path)
-        icon_dict["__icon_url__"] = results.pop()[0]
+        icon_dict["__icon_url__"] = get_icon_url(icon_result)
         set_dict_at_path(slide.content, icon_path, icon_dict)
 
     return return_assets
@@ -100,8 +107,8 @@ async def process_old_and_new_slides_and_fetch_assets(
     async_image_fetch_tasks = []
     new_images_fetch_status = []
 
-    # Creates async tasks for fetching new icons
-    async_icon_fetch_tasks = []
+    # Collects new icon queries for a single batched search
+    new_icon_queries = []
     new_icons_fetch_status = []
 
     # Creates async tasks for fetching new images
@@ -135,13 +142,13 @@ async def process_old_and_new_slides_and_fetch_assets(
             new_icons_fetch_status.append(False)
             continue
 
-        async_icon_fetch_tasks.append(
-            ICON_FINDER_SERVICE.search_icons(new_icon["__icon_query__"])
-        )
+        new_icon_queries.append(new_icon["__icon_query__"])
         new_icons_fetch_status.append(True)
 
-    new_images = await asyncio.gather(*async_image_fetch_tasks)
-    new_icons = await asyncio.gather(*async_icon_fetch_tasks)
+    new_images, new_icons = await asyncio.gather(
+        asyncio.gather(*async_image_fetch_tasks),
+        ICON_FINDER_SERVICE.search_icons_batch(new_icon_queries),
+    )
 
     # list of new assets
     new_assets = []
@@ -159,7 +166,7 @@ async def process_old_and_new_slides_and_fetch_assets(
 
     for i, new_icon in enumerate(new_icons):
         if new_icons_fetch_status[i]:
-            new_icon_dicts[i]["__icon_url__"] = new_icons[i][0]
+            new_icon_dicts[i]["__icon_url__"] = get_icon_url(new_icons[i])
 
     for i, new_image_dict in enumerate(new_image_dicts):
         set_dict_at_path(new_slide_content, new_image_dict_paths[i], new_image_dict)
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
+
+from constants.presentation import DEFAULT_SLIDE_GENERATION_CONCURRENCY
+from models.presentation_layout import SlideLayoutModel
+from models.presentation_outline_model import SlideOutlineModel
+from models.slide_generation_timing import SlideGenerationTiming
+from models.sql.image_asset import ImageAsset
+from models.sql.slide import SlideModel
+from services.image_generation_service import ImageGenerationService
+from utils.get_env import get_slide_generation_concurrency_env
+from utils.llm_calls.generate_slide_content import (
+    get_slide_content_from_type_and_outline,
+    get_slide_contents_in_bulk,
+)
+from utils.parsers import parse_int_or_none
+from utils.process_slides import process_slide_and_fetch_assets
+
+
+def get_slide_generation_concurrency() -> int:
+    concurrency = parse_int_or_none(get_slide_generation_concurrency_env())
+    if not concurrency or concurrency < 1:
+        return DEFAULT_SLIDE_GENERATION_CONCURRENCY
+    return concurrency
+
+
+async def generate_slide_content_with_timing(
+    index: int,
+    slide_layout: SlideLayoutModel,
+    outline: SlideOutlineModel,
+    language: str,
+    tone: Optional[str],
+    verbosity: Optional[str],
+    instructions: Optional[str],
+    semaphore: asyncio.Semaphore,
+) -> Tuple[int, dict, float]:
+    async with semaphore:
+        started_at = time.perf_counter()
+        content = await get_slide_content_from_type_and_outline(
+            slide_layout,
+            outline,
+            language,
+            tone,
+            verbosity,
+            instructions,
+        )
+        return index, content, time.perf_counter() - started_at
+
+
+async def generate_slide_contents(
+    slide_layouts: List[SlideLayoutModel],
+    outlines: List[SlideOutlineModel],
+    language: str,
+    tone: Optional[str] = None,
+    verbosity: Optional[str] = None,
+    instructions: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    indices: Optional[List[int]] = None,
+    bulk: bool = False,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    started_tasks: Optional[Dict[int, asyncio.Task]] = None,
+) -> AsyncGenerator[Tuple[int, dict, float], None]:
+    """
+    Generates slide contents with at most `concurrency` LLM calls in flight.
+    A new slide starts as soon as any slot frees up and results are yielded
+    in completion order as (index, content, seconds). Only the slides at
+    `indices` are generated when given.
+
+    With `bulk`, all slides are first submitted as one provider batch job and
+    only the slides the batch could not answer are generated in realtime.
+
+    `started_tasks` are slides already started speculatively with
+    `generate_slide_content_with_timing` on the same `semaphore`; they are
+    awaited instead of being generated again.
+    """
+    if indices is None:
+        indices = list(range(len(slide_layouts)))
+    started_tasks = started_tasks or {}
+
+    bulk_indices = [index for index in indices if index not in started_tasks]
+    if bulk and bulk_indices:
+        started_at = time.perf_counter()
+        contents = await get_slide_contents_in_bulk(
+            [slide_layouts[index] for index in bulk_indices],
+            [outlines[index] for index in bulk_indices],
+            language,
+            tone,
+            verbosity,
+            instructions,
+        )
+        seconds = time.perf_counter() - started_at
+        for index, content in zip(bulk_indices, contents):
+            if content is not None:
+                yield index, content, seconds
+        answered_indices = {
+            index
+            for index, content in zip(bulk_indices, contents)
+            if content is not None
+        }
+        indices = [index for index in indices if index not in answered_indices]
+
+    semaphore = semaphore or asyncio.Semaphore(
+        concurrency or get_slide_generation_concurrency()
+    )
+
+    tasks = [
+        started_tasks.pop(index, None)
+        or asyncio.create_task(
+            generate_slide_content_with_timing(
+                index,
+                slide_layouts[index],
+                outlines[index],
+                language,
+                tone,
+                verbosity,
+                instructions,
+                semaphore,
+            )
+        )
+        for index in indices
+    ]
+    try:
+        for next_completed in asyncio.as_completed(tasks):
+            yield await next_completed
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def fetch_slide_assets_with_timing(
+    image_generation_service: ImageGenerationService,
+    slide: SlideModel,
+    timing: SlideGenerationTiming,
+) -> List[ImageAsset]:
+    started_at = time.perf_counter()
+    assets = await process_slide_and_fetch_assets(image_generation_service, slide)
+    timing.assets_seconds = time.perf_counter() - started_at
+    return assets
@@ -0,0 +1,45 @@
+import argparse
+import asyncio
+import os
+
+from services.database import create_db_and_tables
+from services.docling_process_pool import DOCLING_PROCESS_POOL
+from services.http_session_manager import HTTP_SESSION_MANAGER
+from services.icon_finder_service import ICON_FINDER_SERVICE
+from services.presentation_generation_worker import PresentationGenerationWorker
+from utils.get_env import (
+    get_app_data_directory_env,
+    get_disable_docling_warm_up_env,
+)
+from utils.parsers import parse_bool_or_none
+
+
+async def run_worker(concurrency: int | None):
+    os.makedirs(get_app_data_directory_env(), exist_ok=True)
+    await create_db_and_tables()
+    ICON_FINDER_SERVICE.warm_up()
+    if not parse_bool_or_none(get_disable_docling_warm_up_env()):
+        DOCLING_PROCESS_POOL.warm_up()
+
+    worker = PresentationGenerationWorker(max_concurrency=concurrency)
+    try:
+        await worker.run()
+    finally:
+        await worker.stop()
+        await HTTP_SESSION_MANAGER.close()
+        DOCLING_PROCESS_POOL.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run a presentation generation worker"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum number of presentations generated at once by this worker",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_worker(args.concurrency))
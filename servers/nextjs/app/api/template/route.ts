@@ -1,6 +1,52 @@
+import { createHash } from "crypto";
+import { promises as fs } from "fs";
 import { NextResponse } from "next/server";
+import path from "path";
 import puppeteer from "puppeteer";
 
+// Hashes what the layout schema is rendered from, so revalidations can be
+// answered without rendering: the layout codes of custom templates, or the
+// template files and the build of built-in ones.
+async function getTemplateSourceHash(groupName: string) {
+  const hash = createHash("sha1");
+  try {
+    if (groupName.startsWith("custom-")) {
+      const response = await fetch(
+        `http://localhost/api/v1/ppt/template-management/get-templates/${encodeURIComponent(
+          groupName.slice("custom-".length)
+        )}`,
+        { cache: "no-store" }
+      );
+      if (!response.ok) return null;
+      hash.update(await response.text());
+    } else {
+      const templatesDirectory = path.join(
+        process.cwd(),
+        "presentation-templates"
+      );
+      const templatePath = path.join(templatesDirectory, groupName);
+      if (path.dirname(templatePath) !== templatesDirectory) return null;
+
+      const files = (await fs.readdir(templatePath)).sort();
+      for (const file of files) {
+        if (!file.endsWith(".tsx") && file !== "settings.json") continue;
+        hash.update(file);
+        hash.update(await fs.readFile(path.join(templatePath, file)));
+      }
+      try {
+        hash.update(
+          await fs.readFile(path.join(process.cwd(), ".next-build", "BUILD_ID"))
+        );
+      } catch (e) {
+        // Development server, template files are the only source
+      }
+    }
+  } catch (e) {
+    return null;
+  }
+  return `"${hash.digest("hex")}"`;
+}
+
 export async function GET(request: Request) {
   const { searchParams } = new URL(request.url);
   const groupName = searchParams.get("group");
@@ -9,6 +55,15 @@ export async function GET(request: Request) {
     return NextResponse.json({ error: "Missing group name" }, { status: 400 });
   }
 
+  // Checked before launching the browser, a render takes seconds
+  const sourceEtag = await getTemplateSourceHash(groupName);
+  if (sourceEtag && request.headers.get("if-none-match") === sourceEtag) {
+    return new NextResponse(null, {
+      status: 304,
+      headers: { ETag: sourceEtag },
+    });
+  }
+
   const schemaPageUrl = `http://localhost/schema?group=${encodeURIComponent(
     groupName
   )}`;
@@ -74,7 +129,15 @@ export async function GET(request: Request) {
       })),
     };
 
-    return NextResponse.json(response);
+    // Lets the FastAPI layout cache revalidate without re-parsing the layout
+    const etag =
+      sourceEtag ??
+      `"${createHash("sha1").update(JSON.stringify(response)).digest("hex")}"`;
+    if (request.headers.get("if-none-match") === etag) {
+      return new NextResponse(null, { status: 304, headers: { ETag: etag } });
+    }
+
+    return NextResponse.json(response, { headers: { ETag: etag } });
   } catch (err) {
     return NextResponse.json(
       { error: "Failed to fetch or parse client page" },